@@ -0,0 +1,30 @@
+"""On-disk cache of schema analysis results."""
+
+from typing import Optional, Tuple
+
+from legend_cli.analysis.models import EnhancedModelSpec
+from legend_cli.pickle_cache import PickleCache
+
+
+class AnalysisCache(PickleCache):
+    """Analysis results pickled to ~/.legend-cli/analysis_cache.
+
+    Keys should start with Database.fingerprint() of the analyzed schema
+    followed by every input that shaped the result (documentation and
+    options), so an entry can never be served for a different schema.
+    Entries are not expired; delete the directory to force a fresh analysis.
+    """
+
+    dir_name = "analysis_cache"
+
+    def load(self, key: Tuple) -> Optional[EnhancedModelSpec]:
+        """Return the cached analysis for key.
+
+        Returns:
+            The cached EnhancedModelSpec, or None if missing or unreadable
+        """
+        return self._read(key)
+
+    def save(self, key: Tuple, spec: EnhancedModelSpec) -> None:
+        """Store a finished analysis under key."""
+        self._write(key, spec)
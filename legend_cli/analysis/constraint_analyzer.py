@@ -18,6 +18,22 @@ from legend_cli.prompts.constraint_templates import (
     format_sql_for_constraints,
 )
 
+# CHECK/WHERE -> Pure rewrites, applied in order by _convert_check_to_pure
+_CHECK_PREFIX_RE = re.compile(r"^\s*CHECK\s*\(", re.IGNORECASE)
+_TRAILING_PAREN_RE = re.compile(r"\)\s*$")
+_IS_NOT_NULL_RE = re.compile(r"\$this\.(\w+)\s+IS\s+NOT\s+NULL", re.IGNORECASE)
+_IS_NULL_RE = re.compile(r"\$this\.(\w+)\s+IS\s+NULL", re.IGNORECASE)
+_IN_LIST_RE = re.compile(r"\$this\.(\w+)\s+IN\s*\(([^)]+)\)", re.IGNORECASE)
+_BETWEEN_RE = re.compile(
+    r"\$this\.(\w+)\s+BETWEEN\s+(\S+)\s+AND\s+(\S+)", re.IGNORECASE
+)
+
+_FROM_TABLE_RE = re.compile(r"FROM\s+(\w+(?:\.\w+)?)\s+", re.IGNORECASE)
+_WHERE_CLAUSE_RE = re.compile(
+    r"WHERE\s+(.+?)(?:GROUP BY|ORDER BY|LIMIT|$)", re.IGNORECASE | re.DOTALL
+)
+_AND_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+
 
 @dataclass
 class DatabaseConstraint:
@@ -87,6 +103,8 @@ class ConstraintAnalyzer:
             claude_client: ClaudeClient for LLM-based analysis
         """
         self.claude = claude_client or ClaudeClient()
+        # Set when the last analyze() call's LLM step failed
+        self.last_llm_error: Optional[Exception] = None
 
     def analyze(
         self,
@@ -129,6 +147,7 @@ class ConstraintAnalyzer:
             suggestions.extend(sql_constraints)
 
         # Step 5: LLM-based analysis
+        self.last_llm_error = None
         if use_llm:
             try:
                 llm_constraints = self._analyze_with_llm(
@@ -137,6 +156,7 @@ class ConstraintAnalyzer:
                 suggestions.extend(llm_constraints)
             except Exception as e:
                 print(f"Warning: LLM-based constraint analysis failed: {e}")
+                self.last_llm_error = e
 
         # Deduplicate
         return self._deduplicate(suggestions)
@@ -419,8 +439,8 @@ class ConstraintAnalyzer:
         expr = check_definition.strip()
 
         # Remove CHECK keyword if present
-        expr = re.sub(r"^\s*CHECK\s*\(", "", expr, flags=re.IGNORECASE)
-        expr = re.sub(r"\)\s*$", "", expr)
+        expr = _CHECK_PREFIX_RE.sub("", expr)
+        expr = _TRAILING_PAREN_RE.sub("", expr)
 
         # Build column to property mapping
         col_to_prop = {
@@ -428,14 +448,15 @@ class ConstraintAnalyzer:
             for col in table.columns
         }
 
-        # Replace column references with $this.property
-        for col_name, prop_name in col_to_prop.items():
-            # Match word boundaries
-            expr = re.sub(
-                rf"\b{col_name}\b",
-                f"$this.{prop_name}",
-                expr,
-                flags=re.IGNORECASE
+        # Replace column references with $this.property, all columns in
+        # one pass rather than one pattern per column
+        if col_to_prop:
+            columns_re = re.compile(
+                r"\b(" + "|".join(map(re.escape, col_to_prop)) + r")\b",
+                re.IGNORECASE,
+            )
+            expr = columns_re.sub(
+                lambda m: f"$this.{col_to_prop[m.group(1).upper()]}", expr
             )
 
         # Convert SQL operators to Pure
@@ -444,36 +465,16 @@ class ConstraintAnalyzer:
         expr = expr.replace("<>", "!=")
 
         # Handle IS NOT NULL -> ->isNotEmpty()
-        expr = re.sub(
-            r"\$this\.(\w+)\s+IS\s+NOT\s+NULL",
-            r"$this.\1->isNotEmpty()",
-            expr,
-            flags=re.IGNORECASE
-        )
+        expr = _IS_NOT_NULL_RE.sub(r"$this.\1->isNotEmpty()", expr)
 
         # Handle IS NULL -> ->isEmpty()
-        expr = re.sub(
-            r"\$this\.(\w+)\s+IS\s+NULL",
-            r"$this.\1->isEmpty()",
-            expr,
-            flags=re.IGNORECASE
-        )
+        expr = _IS_NULL_RE.sub(r"$this.\1->isEmpty()", expr)
 
         # Handle IN lists
-        expr = re.sub(
-            r"\$this\.(\w+)\s+IN\s*\(([^)]+)\)",
-            r"$this.\1->in([\2])",
-            expr,
-            flags=re.IGNORECASE
-        )
+        expr = _IN_LIST_RE.sub(r"$this.\1->in([\2])", expr)
 
         # Handle BETWEEN
-        expr = re.sub(
-            r"\$this\.(\w+)\s+BETWEEN\s+(\S+)\s+AND\s+(\S+)",
-            r"$this.\1 >= \2 && $this.\1 <= \3",
-            expr,
-            flags=re.IGNORECASE
-        )
+        expr = _BETWEEN_RE.sub(r"$this.\1 >= \2 && $this.\1 <= \3", expr)
 
         return expr
 
@@ -500,11 +501,7 @@ class ConstraintAnalyzer:
         # This is a basic implementation - a proper SQL parser would be better
 
         # Find FROM table
-        from_match = re.search(
-            r"FROM\s+(\w+(?:\.\w+)?)\s+",
-            sql,
-            re.IGNORECASE
-        )
+        from_match = _FROM_TABLE_RE.search(sql)
 
         if not from_match:
             return results
@@ -512,17 +509,13 @@ class ConstraintAnalyzer:
         table_name = from_match.group(1).split(".")[-1]
 
         # Find WHERE clause
-        where_match = re.search(
-            r"WHERE\s+(.+?)(?:GROUP BY|ORDER BY|LIMIT|$)",
-            sql,
-            re.IGNORECASE | re.DOTALL
-        )
+        where_match = _WHERE_CLAUSE_RE.search(sql)
 
         if where_match:
             conditions = where_match.group(1).strip()
 
             # Split by AND (simple split, not handling nested conditions)
-            for cond in re.split(r"\s+AND\s+", conditions, flags=re.IGNORECASE):
+            for cond in _AND_RE.split(conditions):
                 cond = cond.strip()
                 # Skip conditions with parameters or subqueries
                 if "?" not in cond and "SELECT" not in cond.upper():
@@ -18,6 +18,16 @@ from legend_cli.prompts.derived_templates import (
     format_sql_for_derived,
 )
 
+_FROM_TABLE_RE = re.compile(r"FROM\s+(\w+(?:\.\w+)?)", re.IGNORECASE)
+_SELECT_CLAUSE_RE = re.compile(r"SELECT\s+(.+?)\s+FROM", re.IGNORECASE | re.DOTALL)
+_AGGREGATION_RE = re.compile(
+    r"(SUM|COUNT|AVG|MIN|MAX)\s*\(\s*(\w+(?:\.\w+)?)\s*\)(?:\s+AS\s+(\w+))?",
+    re.IGNORECASE,
+)
+_CALCULATION_RE = re.compile(
+    r"(\w+)\s*([+\-*/])\s*(\w+)(?:\s+AS\s+(\w+))?", re.IGNORECASE
+)
+
 
 @dataclass
 class SqlAggregation:
@@ -102,6 +112,8 @@ class DerivedAnalyzer:
             claude_client: ClaudeClient for LLM-based analysis
         """
         self.claude = claude_client or ClaudeClient()
+        # Why the last analyze() call fell back to non-LLM results, if it did
+        self.last_llm_error: Optional[Exception] = None
 
     def analyze(
         self,
@@ -137,6 +149,7 @@ class DerivedAnalyzer:
             suggestions.extend(sql_suggestions)
 
         # Step 4: LLM-based analysis
+        self.last_llm_error = None
         if use_llm:
             try:
                 llm_suggestions = self._analyze_with_llm(
@@ -145,6 +158,7 @@ class DerivedAnalyzer:
                 suggestions.extend(llm_suggestions)
             except Exception as e:
                 print(f"Warning: LLM-based derived property analysis failed: {e}")
+                self.last_llm_error = e
 
         # Deduplicate
         return self._deduplicate(suggestions)
@@ -421,17 +435,14 @@ class DerivedAnalyzer:
         """Extract aggregation functions from SQL."""
         aggregations = []
 
-        # Pattern for aggregation functions
-        agg_pattern = r"(SUM|COUNT|AVG|MIN|MAX)\s*\(\s*(\w+(?:\.\w+)?)\s*\)(?:\s+AS\s+(\w+))?"
-
         # Find FROM table
-        from_match = re.search(r"FROM\s+(\w+(?:\.\w+)?)", sql, re.IGNORECASE)
+        from_match = _FROM_TABLE_RE.search(sql)
         if not from_match:
             return aggregations
 
         table = from_match.group(1).split(".")[-1]
 
-        for match in re.finditer(agg_pattern, sql, re.IGNORECASE):
+        for match in _AGGREGATION_RE.finditer(sql):
             function = match.group(1).upper()
             column = match.group(2).split(".")[-1]  # Remove table prefix
             alias = match.group(3)
@@ -451,23 +462,20 @@ class DerivedAnalyzer:
         calculations = []
 
         # Find FROM table
-        from_match = re.search(r"FROM\s+(\w+(?:\.\w+)?)", sql, re.IGNORECASE)
+        from_match = _FROM_TABLE_RE.search(sql)
         if not from_match:
             return calculations
 
         table = from_match.group(1).split(".")[-1]
 
-        # Pattern for simple arithmetic in SELECT
-        calc_pattern = r"(\w+)\s*([+\-*/])\s*(\w+)(?:\s+AS\s+(\w+))?"
-
         # Extract SELECT clause
-        select_match = re.search(r"SELECT\s+(.+?)\s+FROM", sql, re.IGNORECASE | re.DOTALL)
+        select_match = _SELECT_CLAUSE_RE.search(sql)
         if not select_match:
             return calculations
 
         select_clause = select_match.group(1)
 
-        for match in re.finditer(calc_pattern, select_clause, re.IGNORECASE):
+        for match in _CALCULATION_RE.finditer(select_clause):
             col1 = match.group(1)
             op = match.group(2)
             col2 = match.group(3)
@@ -498,18 +506,17 @@ class DerivedAnalyzer:
             for col in table.columns
         }
 
-        pure_expr = expression
+        if not col_to_prop:
+            return expression
 
-        # Replace column references
-        for col_name, prop_name in col_to_prop.items():
-            pure_expr = re.sub(
-                rf"\b{col_name}\b",
-                f"$this.{prop_name}",
-                pure_expr,
-                flags=re.IGNORECASE
-            )
-
-        return pure_expr
+        # Replace column references, matching every column in one pass
+        columns_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, col_to_prop)) + r")\b",
+            re.IGNORECASE,
+        )
+        return columns_re.sub(
+            lambda m: f"$this.{col_to_prop[m.group(1).upper()]}", expression
+        )
 
     def _map_expression_to_properties(
         self,
@@ -64,6 +64,8 @@ class EnumDetector:
         self.claude = claude_client or ClaudeClient()
         self.max_enum_values = max_enum_values
         self.max_reference_rows = max_reference_rows
+        # Why the last detect() call fell back to non-LLM results, if it did
+        self.last_llm_error: Optional[Exception] = None
 
     def detect(
         self,
@@ -105,6 +107,7 @@ class EnumDetector:
 
         # Step 2: LLM-based detection (if enabled)
         # LLM can identify enum columns based on naming and context
+        self.last_llm_error = None
         if use_llm:
             try:
                 llm_candidates = self._detect_with_llm(
@@ -113,6 +116,7 @@ class EnumDetector:
                 candidates.extend(llm_candidates)
             except Exception as e:
                 print(f"Warning: LLM-based enum detection failed: {e}")
+                self.last_llm_error = e
 
         # Deduplicate and merge
         return self._merge_candidates(candidates)
@@ -197,8 +201,10 @@ class EnumDetector:
                     if values is None:
                         continue
 
-                    # Check cardinality
-                    unique_values = list(set(v for v in values if v is not None))
+                    # Check cardinality; the set is built in C, then None dropped
+                    distinct = set(values)
+                    distinct.discard(None)
+                    unique_values = list(distinct)
                     if len(unique_values) > 0 and len(unique_values) <= self.max_enum_values:
                         # Low cardinality - potential enum
                         enum_name = self._generate_enum_name(table, col.name)
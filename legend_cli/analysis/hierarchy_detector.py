@@ -65,6 +65,8 @@ class HierarchyDetector:
         """
         self.claude = claude_client or ClaudeClient()
         self.min_overlap = min_overlap
+        # Set when the last detect() call's LLM step failed
+        self.last_llm_error: Optional[Exception] = None
 
     def detect(
         self,
@@ -93,6 +95,7 @@ class HierarchyDetector:
         opportunities.extend(overlap_opportunities)
 
         # Step 3: LLM-based detection (if enabled and client available)
+        self.last_llm_error = None
         if use_llm:
             try:
                 llm_opportunities = self._detect_with_llm(database, documentation)
@@ -100,6 +103,7 @@ class HierarchyDetector:
             except Exception as e:
                 # Log warning but don't fail
                 print(f"Warning: LLM-based hierarchy detection failed: {e}")
+                self.last_llm_error = e
 
         # Deduplicate and merge
         return self._merge_opportunities(opportunities)
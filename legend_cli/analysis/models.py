@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from legend_cli.database.models import DATACLASS_SLOTS
+
 
 class AnalysisSource(str, Enum):
     """Source of an analysis suggestion."""
@@ -15,7 +17,7 @@ class AnalysisSource(str, Enum):
     DATABASE_CONSTRAINT = "database_constraint"  # From DB constraints
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InheritanceOpportunity:
     """Represents a detected opportunity for class inheritance.
 
@@ -37,8 +39,17 @@ class InheritanceOpportunity:
     # Mapping of derived class name to its additional properties
     derived_class_properties: Dict[str, List[str]] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the hierarchy for tool responses."""
+        return {
+            "base_class": self.base_class_name,
+            "derived_classes": self.derived_classes,
+            "confidence": self.confidence,
+            "discriminator": self.discriminator_column,
+        }
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class EnumerationCandidate:
     """Represents a candidate for enumeration generation.
 
@@ -60,8 +71,19 @@ class EnumerationCandidate:
     # Mapping of enum value to description/display name
     value_descriptions: Dict[str, str] = field(default_factory=dict)
 
+    def to_dict(self, max_values: int = 10) -> Dict[str, Any]:
+        """Summarize the candidate, listing at most max_values values."""
+        return {
+            "name": self.name,
+            "source_table": self.source_table,
+            "source_column": self.source_column,
+            "values": self.values[:max_values],
+            "value_count": len(self.values),
+            "confidence": self.confidence,
+        }
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ConstraintSuggestion:
     """Represents a suggested constraint for a class.
 
@@ -82,8 +104,17 @@ class ConstraintSuggestion:
     # Original SQL expression if derived from SQL
     source_sql: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the constraint for tool responses."""
+        return {
+            "class_name": self.class_name,
+            "constraint_name": self.constraint_name,
+            "expression": self.expression,
+            "confidence": self.confidence,
+        }
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class DerivedPropertySuggestion:
     """Represents a suggested derived (computed) property.
 
@@ -106,6 +137,16 @@ class DerivedPropertySuggestion:
     # Original SQL expression if derived from SQL
     source_sql: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the derived property for tool responses."""
+        return {
+            "class_name": self.class_name,
+            "property_name": self.property_name,
+            "expression": self.expression,
+            "return_type": self.return_type,
+            "confidence": self.confidence,
+        }
+
 
 @dataclass
 class TableAnalysis:
@@ -33,6 +33,11 @@ from legend_cli.database.models import Database, Relationship
 logger = logging.getLogger(__name__)
 
 
+async def _no_results() -> list:
+    """Result of a detector that analyze_async skips."""
+    return []
+
+
 @dataclass
 class AnalysisOptions:
     """Configuration options for schema analysis."""
@@ -105,6 +110,10 @@ class SchemaAnalyzer:
         self.doc_relationship_analyzer = DocumentRelationshipAnalyzer()
         self.relationship_merger = RelationshipMerger()
 
+        # Detectors that failed or fell back to non-LLM results during the
+        # last analyze()/analyze_async() call, as "<analysis>: <error>"
+        self.failures: List[str] = []
+
     def analyze(
         self,
         context: AnalysisContext,
@@ -121,22 +130,25 @@ class SchemaAnalyzer:
         enumerations = []
         constraints = []
         derived_properties = []
+        self.failures = []
 
         # Analyze document relationships if doc sources are provided
         if self.options.analyze_document_relationships and context.doc_sources:
             self._analyze_document_relationships(context)
 
-        # Run analyses based on options
-        if self.options.detect_hierarchies:
+        # Run analyses based on options; a schema without tables gives the
+        # detectors nothing to classify, so skip them and their LLM calls
+        has_tables = context.database.table_count > 0
+        if has_tables and self.options.detect_hierarchies:
             hierarchies = self._detect_hierarchies(context)
 
-        if self.options.detect_enums:
+        if has_tables and self.options.detect_enums:
             enumerations = self._detect_enums(context)
 
-        if self.options.detect_constraints:
+        if has_tables and self.options.detect_constraints:
             constraints = self._detect_constraints(context)
 
-        if self.options.detect_derived:
+        if has_tables and self.options.detect_derived:
             derived_properties = self._detect_derived(context)
 
         # Build per-table analysis
@@ -173,28 +185,25 @@ class SchemaAnalyzer:
         Returns:
             EnhancedModelSpec with all analysis results
         """
-        # Prepare tasks
-        tasks = []
-
-        if self.options.detect_hierarchies:
-            tasks.append(self._detect_hierarchies_async(context))
-        else:
-            tasks.append(asyncio.coroutine(lambda: [])())
-
-        if self.options.detect_enums:
-            tasks.append(self._detect_enums_async(context))
-        else:
-            tasks.append(asyncio.coroutine(lambda: [])())
+        self.failures = []
 
-        if self.options.detect_constraints:
-            tasks.append(self._detect_constraints_async(context))
-        else:
-            tasks.append(asyncio.coroutine(lambda: [])())
-
-        if self.options.detect_derived:
-            tasks.append(self._detect_derived_async(context))
-        else:
-            tasks.append(asyncio.coroutine(lambda: [])())
+        # Document relationships are merged into the database before the
+        # detectors read it, as in analyze()
+        if self.options.analyze_document_relationships and context.doc_sources:
+            await asyncio.to_thread(self._analyze_document_relationships, context)
+
+        # Each detector runs in a worker thread, so their LLM calls overlap;
+        # as in analyze(), none run on a schema without tables
+        has_tables = context.database.table_count > 0
+        tasks = [
+            detect(context) if enabled and has_tables else _no_results()
+            for enabled, detect in (
+                (self.options.detect_hierarchies, self._detect_hierarchies_async),
+                (self.options.detect_enums, self._detect_enums_async),
+                (self.options.detect_constraints, self._detect_constraints_async),
+                (self.options.detect_derived, self._detect_derived_async),
+            )
+        ]
 
         # Run in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -210,6 +219,7 @@ class SchemaAnalyzer:
             if isinstance(result, Exception):
                 analysis_types = ["hierarchies", "enums", "constraints", "derived"]
                 print(f"Warning: {analysis_types[i]} analysis failed: {result}")
+                self._record_failure(analysis_types[i], result)
 
         # Build per-table analysis
         table_analyses = self._build_table_analyses(
@@ -285,6 +295,11 @@ class SchemaAnalyzer:
 
         except Exception as e:
             logger.warning("Document relationship analysis failed: %s", e)
+            self._record_failure("document relationships", e)
+
+    def _record_failure(self, analysis: str, error: Exception) -> None:
+        """Note a failed detector; analyze_async may call this from threads."""
+        self.failures.append(f"{analysis}: {error}")
 
     def _detect_hierarchies(
         self,
@@ -297,9 +312,12 @@ class SchemaAnalyzer:
                 documentation=context.documentation,
                 use_llm=self.options.use_llm,
             )
+            if self.hierarchy_detector.last_llm_error is not None:
+                self._record_failure("hierarchies", self.hierarchy_detector.last_llm_error)
             return results[:self.options.max_hierarchies]
         except Exception as e:
             print(f"Warning: Hierarchy detection failed: {e}")
+            self._record_failure("hierarchies", e)
             return []
 
     async def _detect_hierarchies_async(
@@ -324,9 +342,12 @@ class SchemaAnalyzer:
                 value_fetcher=context.value_fetcher,
                 use_llm=self.options.use_llm,
             )
+            if self.enum_detector.last_llm_error is not None:
+                self._record_failure("enums", self.enum_detector.last_llm_error)
             return results[:self.options.max_enums]
         except Exception as e:
             print(f"Warning: Enum detection failed: {e}")
+            self._record_failure("enums", e)
             return []
 
     async def _detect_enums_async(
@@ -351,9 +372,12 @@ class SchemaAnalyzer:
                 db_constraints=context.db_constraints,
                 use_llm=self.options.use_llm,
             )
+            if self.constraint_analyzer.last_llm_error is not None:
+                self._record_failure("constraints", self.constraint_analyzer.last_llm_error)
             return results[:self.options.max_constraints]
         except Exception as e:
             print(f"Warning: Constraint analysis failed: {e}")
+            self._record_failure("constraints", e)
             return []
 
     async def _detect_constraints_async(
@@ -377,9 +401,12 @@ class SchemaAnalyzer:
                 documentation=context.documentation,
                 use_llm=self.options.use_llm,
             )
+            if self.derived_analyzer.last_llm_error is not None:
+                self._record_failure("derived", self.derived_analyzer.last_llm_error)
             return results[:self.options.max_derived]
         except Exception as e:
             print(f"Warning: Derived property analysis failed: {e}")
+            self._record_failure("derived", e)
             return []
 
     async def _detect_derived_async(
@@ -340,7 +340,7 @@ def _execute_snowflake_model_generation(
         for table in schema_obj.tables:
             console.print(f"    - {table.name} ({len(table.columns)} columns)")
 
-    total_tables = sum(len(s.tables) for s in db.schemas)
+    total_tables = db.table_count
     if total_tables == 0:
         console.print("[yellow]No tables found in the specified database/schema[/yellow]")
         raise typer.Exit(1)
@@ -971,7 +971,7 @@ def _execute_duckdb_model_generation(
         for table in schema_obj.tables:
             console.print(f"    - {table.name} ({len(table.columns)} columns)")
 
-    total_tables = sum(len(s.tables) for s in db.schemas)
+    total_tables = db.table_count
     if total_tables == 0:
         console.print("[yellow]No tables found in the specified database/schema[/yellow]")
         raise typer.Exit(1)
@@ -84,6 +84,26 @@ class Settings(BaseSettings):
         description="Maximum size of result/parameter strings to store in logs"
     )
 
+    # Introspected schema cache configuration
+    schema_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse introspected schemas across MCP sessions while their tables, columns and primary keys are unchanged"
+    )
+    schema_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached schemas (default: ~/.legend-cli/schema_cache)"
+    )
+
+    # Schema analysis cache configuration
+    analysis_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse analyze_schema results across MCP sessions for an unchanged schema, documentation and options"
+    )
+    analysis_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached analyses (default: ~/.legend-cli/analysis_cache)"
+    )
+
     # CLI run logging configuration
     cli_logging_enabled: bool = Field(
         default=True,
@@ -1,7 +1,8 @@
 """Abstract base class for database introspection."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from .models import Database, Column, Table, Schema
 
@@ -16,6 +17,10 @@ class DatabaseIntrospector(ABC):
     # Override in subclasses to exclude system schemas
     EXCLUDED_SCHEMAS: set = {'INFORMATION_SCHEMA'}
 
+    # Maximum number of queries introspect_database_async runs at once.
+    # Override in subclasses whose connections are safe to share across threads.
+    MAX_CONCURRENT_QUERIES: int = 1
+
     @abstractmethod
     def connect(self, database: str):
         """Establish connection to the database.
@@ -103,32 +108,122 @@ class DatabaseIntrospector(ABC):
         Returns:
             Database object containing the full schema structure
         """
-        from .relationship import RelationshipDetector
+        schema_tables = []
+        for schema_name in self._get_introspection_schemas(database, schema_filter):
+            table_names = self.get_tables(database, schema_name)
+            tables = [
+                self._introspect_table(database, schema_name, table_name)
+                for table_name in table_names
+            ]
+            schema_tables.append((schema_name, tables))
 
-        db = Database(name=database)
-        schemas = self.get_schemas(database)
+        return self._build_database(database, schema_tables, detect_relationships)
+
+    async def introspect_database_async(
+        self,
+        database: str,
+        schema_filter: Optional[str] = None,
+        detect_relationships: bool = True
+    ) -> Database:
+        """Introspect an entire database without blocking the event loop.
+
+        Produces the same result as introspect_database, but runs the
+        blocking queries in worker threads. Per-table column and primary
+        key lookups are issued concurrently, up to MAX_CONCURRENT_QUERIES
+        at a time.
+
+        Args:
+            database: Database name
+            schema_filter: Optional schema name to filter to
+            detect_relationships: Whether to detect FK relationships
+
+        Returns:
+            Database object containing the full schema structure
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+
+        async def run(func, *args):
+            async with semaphore:
+                return await asyncio.to_thread(func, *args)
+
+        schemas = await run(self._get_introspection_schemas, database, schema_filter)
+        table_names = await asyncio.gather(
+            *(run(self.get_tables, database, schema_name) for schema_name in schemas)
+        )
 
+        schema_tables = []
+        for schema_name, names in zip(schemas, table_names):
+            tables = await asyncio.gather(
+                *(run(self._introspect_table, database, schema_name, name) for name in names)
+            )
+            schema_tables.append((schema_name, list(tables)))
+
+        return self._build_database(database, schema_tables, detect_relationships)
+
+    def get_column_listing(
+        self,
+        database: str,
+        schema_filter: Optional[str] = None
+    ) -> List[Tuple]:
+        """List every introspected column with the metadata introspection reads.
+
+        Returns one (schema, table, column, data type, nullable, primary key)
+        row per column, in column order within each table. Relationships are
+        detected from exactly this information, so an unchanged listing
+        means introspection would produce the same Database. Subclasses
+        answer this with a few bulk queries; this generic version costs as
+        much as introspect_database.
+
+        Args:
+            database: Database name
+            schema_filter: Optional schema name to filter to
+
+        Returns:
+            List of column rows
+        """
+        listing = []
+        for schema_name in self._get_introspection_schemas(database, schema_filter):
+            for table_name in self.get_tables(database, schema_name):
+                table = self._introspect_table(database, schema_name, table_name)
+                pks = set(table.primary_key_columns)
+                listing.extend(
+                    (schema_name, table_name, c.name, c.data_type, c.is_nullable, c.name in pks)
+                    for c in table.columns
+                )
+        return listing
+
+    def _get_introspection_schemas(self, database: str, schema_filter: Optional[str]) -> List[str]:
+        """Get the schemas to introspect, applying the optional filter."""
+        schemas = self.get_schemas(database)
         if schema_filter:
             schemas = [s for s in schemas if s == schema_filter]
+        return schemas
 
-        for schema_name in schemas:
-            schema = Schema(name=schema_name)
-            table_names = self.get_tables(database, schema_name)
+    def _introspect_table(self, database: str, schema_name: str, table_name: str) -> Table:
+        """Fetch the columns and primary keys of a single table."""
+        columns = self.get_columns(database, schema_name, table_name)
+        pks = self.get_primary_keys(database, schema_name, table_name)
 
-            for table_name in table_names:
-                columns = self.get_columns(database, schema_name, table_name)
-                pks = self.get_primary_keys(database, schema_name, table_name)
+        return Table(
+            name=table_name,
+            schema=schema_name,
+            columns=columns,
+            primary_key_columns=pks
+        )
 
-                table = Table(
-                    name=table_name,
-                    schema=schema_name,
-                    columns=columns,
-                    primary_key_columns=pks
-                )
-                schema.tables.append(table)
+    def _build_database(
+        self,
+        database: str,
+        schema_tables: List[Tuple[str, List[Table]]],
+        detect_relationships: bool
+    ) -> Database:
+        """Assemble introspected tables into a Database and detect relationships."""
+        from .relationship import RelationshipDetector
 
-            if schema.tables:
-                db.schemas.append(schema)
+        db = Database(name=database)
+        for schema_name, tables in schema_tables:
+            if tables:
+                db.schemas.append(Schema(name=schema_name, tables=tables))
 
         if detect_relationships:
             detector = RelationshipDetector(db)
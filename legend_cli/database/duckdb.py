@@ -1,10 +1,12 @@
 """DuckDB database introspector."""
 
-from typing import Optional, List
+import sys
+import threading
+from typing import Dict, Optional, List, Set, Tuple
 from pathlib import Path
 
 from .base import DatabaseIntrospector
-from .models import Column, Database, Schema, Table
+from .models import Column, Database
 from .type_mappers import DuckDBTypeMapper
 
 
@@ -13,6 +15,9 @@ class DuckDBIntrospector(DatabaseIntrospector):
 
     EXCLUDED_SCHEMAS = {'information_schema', 'pg_catalog'}
 
+    # Each thread queries through its own cursor, so queries can overlap
+    MAX_CONCURRENT_QUERIES = 8
+
     def __init__(
         self,
         database_path: Optional[str] = None,
@@ -38,7 +43,9 @@ class DuckDBIntrospector(DatabaseIntrospector):
         self.postgres_port = postgres_port
         self._use_postgres = postgres_port is not None
         self._connection = None
-        self._cursor = None  # For psycopg2 connections
+        self._local = threading.local()  # Per-thread cursor
+        self._cursors: List = []
+        self._cursors_lock = threading.Lock()
         self._type_mapper = DuckDBTypeMapper()
         self._database_name = self._extract_database_name()
 
@@ -95,7 +102,6 @@ class DuckDBIntrospector(DatabaseIntrospector):
             port=self.postgres_port,
             dbname="main",
         )
-        self._cursor = self._connection.cursor()
         return self._connection
 
     def _connect_via_duckdb(self):
@@ -133,13 +139,33 @@ class DuckDBIntrospector(DatabaseIntrospector):
 
     def close(self):
         """Close the DuckDB connection."""
-        if self._cursor:
-            self._cursor.close()
-            self._cursor = None
+        with self._cursors_lock:
+            for cursor in self._cursors:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            self._cursors.clear()
+            self._local = threading.local()
         if self._connection:
             self._connection.close()
             self._connection = None
 
+    def _get_cursor(self):
+        """Get the calling thread's cursor, creating it on first use.
+
+        DuckDB and psycopg2 connections must not run statements from several
+        threads at once, but cursors created from them can.
+        """
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            self.connect()
+            cursor = self._connection.cursor()
+            self._local.cursor = cursor
+            with self._cursors_lock:
+                self._cursors.append(cursor)
+        return cursor
+
     def _execute_query(self, sql: str) -> List:
         """Execute a SQL query and return results.
 
@@ -151,12 +177,9 @@ class DuckDBIntrospector(DatabaseIntrospector):
         Returns:
             List of result rows
         """
-        self.connect()
-        if self._use_postgres:
-            self._cursor.execute(sql)
-            return self._cursor.fetchall()
-        else:
-            return self._connection.execute(sql).fetchall()
+        cursor = self._get_cursor()
+        cursor.execute(sql)
+        return cursor.fetchall()
 
     def get_schemas(self, database: str = None) -> List[str]:
         """Get all user schemas in the database."""
@@ -167,7 +190,7 @@ class DuckDBIntrospector(DatabaseIntrospector):
             ORDER BY schema_name
         """)
 
-        schemas = [row[0] for row in result]
+        schemas = [sys.intern(row[0]) for row in result]
         return [s for s in schemas if s.lower() not in self.EXCLUDED_SCHEMAS]
 
     def get_tables(self, database: str, schema: str, include_views: bool = True) -> List[str]:
@@ -186,7 +209,7 @@ class DuckDBIntrospector(DatabaseIntrospector):
             ORDER BY table_name
         """)
 
-        return [row[0] for row in result]
+        return [sys.intern(row[0]) for row in result]
 
     def get_columns(self, database: str, schema: str, table: str) -> List[Column]:
         """Get all columns for a table."""
@@ -204,8 +227,8 @@ class DuckDBIntrospector(DatabaseIntrospector):
         columns = []
         for row in result:
             col = Column(
-                name=row[0],
-                data_type=row[1],
+                name=sys.intern(row[0]),
+                data_type=sys.intern(row[1]),
                 is_nullable=(row[2] == 'YES'),
                 _type_mapper=self._type_mapper,
             )
@@ -239,7 +262,7 @@ class DuckDBIntrospector(DatabaseIntrospector):
                   AND tc.constraint_type = 'PRIMARY KEY'
                 ORDER BY kcu.ordinal_position
             """)
-            return [row[0] for row in result]
+            return [sys.intern(row[0]) for row in result]
         except Exception:
             # Fallback: use naming heuristics (columns ending in _id or named 'id')
             return self._detect_primary_keys_by_naming(schema, table)
@@ -260,8 +283,8 @@ class DuckDBIntrospector(DatabaseIntrospector):
                 # Result is a list of column names
                 pk_columns = result[0][0]
                 if isinstance(pk_columns, list):
-                    return pk_columns
-                return [pk_columns]
+                    return [sys.intern(c) for c in pk_columns]
+                return [sys.intern(pk_columns)]
             return []
         except Exception:
             # Fallback: try PRAGMA approach
@@ -299,6 +322,56 @@ class DuckDBIntrospector(DatabaseIntrospector):
         except Exception:
             return []
 
+    def get_column_listing(
+        self,
+        database: str = None,
+        schema_filter: Optional[str] = None
+    ) -> List[Tuple]:
+        """List every introspected column with one information_schema query."""
+        schemas = set(self._get_introspection_schemas(database, schema_filter))
+        result = self._execute_query("""
+            SELECT c.table_schema, c.table_name, c.column_name, c.data_type, c.is_nullable
+            FROM information_schema.columns c
+            JOIN information_schema.tables t
+              ON t.table_schema = c.table_schema
+              AND t.table_name = c.table_name
+            WHERE t.table_type IN ('BASE TABLE', 'VIEW')
+            ORDER BY c.table_schema, c.table_name, c.ordinal_position
+        """)
+        pks = self._get_primary_key_listing()
+        return [
+            (row[0], row[1], row[2], row[3], row[4] == 'YES', (row[0], row[1], row[2]) in pks)
+            for row in result
+            if row[0] in schemas
+        ]
+
+    def _get_primary_key_listing(self) -> Set[Tuple[str, str, str]]:
+        """(schema, table, column) of every declared primary key column."""
+        try:
+            if self._use_postgres:
+                result = self._execute_query("""
+                    SELECT kcu.table_schema, kcu.table_name, kcu.column_name
+                    FROM information_schema.table_constraints tc
+                    JOIN information_schema.key_column_usage kcu
+                      ON tc.constraint_name = kcu.constraint_name
+                      AND tc.table_schema = kcu.table_schema
+                    WHERE tc.constraint_type = 'PRIMARY KEY'
+                """)
+                return {(row[0], row[1], row[2]) for row in result}
+
+            result = self._execute_query("""
+                SELECT schema_name, table_name, constraint_column_names
+                FROM duckdb_constraints()
+                WHERE constraint_type = 'PRIMARY KEY'
+            """)
+            return {
+                (row[0], row[1], column)
+                for row in result
+                for column in (row[2] if isinstance(row[2], list) else [row[2]])
+            }
+        except Exception:
+            return set()
+
     def introspect_database(
         self,
         database: str = None,
@@ -318,43 +391,36 @@ class DuckDBIntrospector(DatabaseIntrospector):
         Returns:
             Database object containing the full schema structure
         """
-        from .relationship import RelationshipDetector
-
-        db_name = database or self._database_name
-        db = Database(name=db_name)
-
-        schemas = self.get_schemas()
-        if schema_filter:
-            schemas = [s for s in schemas if s == schema_filter]
-
-        # Default to 'main' schema if no schemas found (common in DuckDB)
-        if not schemas:
-            schemas = ['main']
-
-        for schema_name in schemas:
-            schema = Schema(name=schema_name)
-            table_names = self.get_tables(db_name, schema_name)
+        return super().introspect_database(
+            database or self._database_name, schema_filter, detect_relationships
+        )
 
-            for table_name in table_names:
-                columns = self.get_columns(db_name, schema_name, table_name)
-                pks = self.get_primary_keys(db_name, schema_name, table_name)
+    async def introspect_database_async(
+        self,
+        database: str = None,
+        schema_filter: Optional[str] = None,
+        detect_relationships: bool = True
+    ) -> Database:
+        """Introspect the DuckDB database without blocking the event loop.
 
-                table = Table(
-                    name=table_name,
-                    schema=schema_name,
-                    columns=columns,
-                    primary_key_columns=pks
-                )
-                schema.tables.append(table)
+        Args:
+            database: Optional database name (defaults to extracted name from path)
+            schema_filter: Optional schema name to filter to
+            detect_relationships: Whether to detect FK relationships
 
-            if schema.tables:
-                db.schemas.append(schema)
+        Returns:
+            Database object containing the full schema structure
+        """
+        return await super().introspect_database_async(
+            database or self._database_name, schema_filter, detect_relationships
+        )
 
-        if detect_relationships:
-            detector = RelationshipDetector(db)
-            detector.detect_relationships()
+    def _get_introspection_schemas(self, database: str, schema_filter: Optional[str]) -> List[str]:
+        """Get the schemas to introspect, defaulting to 'main'."""
+        schemas = super()._get_introspection_schemas(database, schema_filter)
 
-        return db
+        # Default to 'main' schema if no schemas found (common in DuckDB)
+        return schemas or ['main']
 
     def get_distinct_values(
         self,
@@ -388,3 +454,54 @@ class DuckDBIntrospector(DatabaseIntrospector):
         except Exception as e:
             print(f"Warning: Failed to fetch distinct values for {schema}.{table}.{column}: {e}")
             return []
+
+    def get_distinct_values_multi(
+        self,
+        schema: str,
+        table: str,
+        columns: List[str],
+        limit: int = 50,
+    ) -> Dict[str, List[str]]:
+        """Get distinct values from several columns of a table in one query.
+
+        Each column keeps its own limit and gets its own result column, so
+        values keep their native type and are converted with str() exactly
+        as get_distinct_values does. If the combined query fails (for
+        example, one column no longer exists), each column is fetched
+        separately with get_distinct_values.
+
+        Args:
+            schema: Schema name
+            table: Table name
+            columns: Column names
+            limit: Maximum number of values to return per column
+
+        Returns:
+            Distinct non-null values as strings, keyed by column name
+        """
+        if len(columns) < 2:
+            return {c: self.get_distinct_values(schema, table, c, limit) for c in columns}
+
+        # Branch i fills only result column i; the NULLs in the other
+        # columns take on its type, so no cast is needed
+        sql = " UNION ALL ".join(
+            f"""SELECT {i} AS col_idx, {", ".join(
+                f'"{column}"' if j == i else "NULL" for j in range(len(columns))
+            )} FROM (
+                SELECT DISTINCT "{column}"
+                FROM "{schema}"."{table}"
+                WHERE "{column}" IS NOT NULL
+                LIMIT {limit}
+            )"""
+            for i, column in enumerate(columns)
+        )
+        try:
+            result = self._execute_query(sql)
+        except Exception:
+            return {c: self.get_distinct_values(schema, table, c, limit) for c in columns}
+
+        values: Dict[str, List[str]] = {c: [] for c in columns}
+        for row in result:
+            col_idx = row[0]
+            values[columns[col_idx]].append(str(row[col_idx + 1]))
+        return values
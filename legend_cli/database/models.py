@@ -1,13 +1,108 @@
 """Database data models for schema introspection."""
 
-from typing import Optional, List, TYPE_CHECKING
+import hashlib
+import sys
+from typing import Optional, List, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 if TYPE_CHECKING:
     from .type_mappers import TypeMapper
 
 
-@dataclass
+# Schemas can hold many thousands of columns, so the per-table value objects
+# use __slots__ where dataclasses support it (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _default_property_type(data_type: str) -> str:
+    """Default Pure property type mapping (Snowflake-compatible)."""
+    type_upper = data_type.upper()
+
+    if "VARCHAR" in type_upper or "TEXT" in type_upper or "STRING" in type_upper or "CHAR" in type_upper:
+        return "String"
+    elif "INT" in type_upper:
+        return "Integer"
+    elif "NUMBER" in type_upper or "NUMERIC" in type_upper:
+        if "," in str(data_type):
+            return "Float"
+        return "Integer"
+    elif "FLOAT" in type_upper or "DOUBLE" in type_upper or "REAL" in type_upper or "DECIMAL" in type_upper:
+        return "Float"
+    elif "BOOL" in type_upper:
+        return "Boolean"
+    elif "DATE" in type_upper:
+        return "Date"
+    elif "TIMESTAMP" in type_upper or "DATETIME" in type_upper:
+        return "DateTime"
+    else:
+        return "String"
+
+
+@lru_cache(maxsize=1024)
+def _pure_property_type(type_mapper: Optional['TypeMapper'], data_type: str) -> str:
+    """Map a database type to a Pure property type.
+
+    Memoized because columns draw their types from a small set and the
+    mapping depends only on the type mapper and the type string.
+    """
+    if type_mapper:
+        return type_mapper.to_pure_property_type(data_type)
+    return _default_property_type(data_type)
+
+
+def _default_column_type(data_type: str) -> str:
+    """Default Pure column type mapping (Snowflake-compatible)."""
+    type_upper = data_type.upper()
+
+    if "VARCHAR" in type_upper or "TEXT" in type_upper or "STRING" in type_upper or "CHAR" in type_upper:
+        if "(" in type_upper:
+            return data_type.upper()
+        return "VARCHAR(256)"
+    elif "INT" in type_upper or "NUMBER" in type_upper or "NUMERIC" in type_upper:
+        if "." in str(data_type) or "FLOAT" in type_upper or "DOUBLE" in type_upper or "DECIMAL" in type_upper:
+            return "FLOAT"
+        return "INTEGER"
+    elif "FLOAT" in type_upper or "DOUBLE" in type_upper or "REAL" in type_upper:
+        return "FLOAT"
+    elif "BOOL" in type_upper:
+        return "BIT"
+    elif "DATE" in type_upper and "TIME" not in type_upper:
+        return "DATE"
+    elif "TIMESTAMP" in type_upper or "DATETIME" in type_upper:
+        return "TIMESTAMP"
+    elif "TIME" in type_upper:
+        # TIME type is not supported by Legend Engine - map to TIMESTAMP
+        return "TIMESTAMP"
+    else:
+        return "VARCHAR(256)"
+
+
+@lru_cache(maxsize=1024)
+def _pure_column_type(type_mapper: Optional['TypeMapper'], data_type: str) -> str:
+    """Map a database type to a Pure store column type (memoized)."""
+    if type_mapper:
+        return type_mapper.to_pure_column_type(data_type)
+    # Default Snowflake-compatible mapping for backward compatibility
+    return _default_column_type(data_type)
+
+
+# Table and column names recur across tables, generators and prompts, so
+# their Pure spellings are derived once per distinct name
+@lru_cache(maxsize=4096)
+def _pascal_case(name: str) -> str:
+    """TABLE_NAME -> TableName."""
+    return ''.join(word.capitalize() for word in name.lower().split('_'))
+
+
+@lru_cache(maxsize=4096)
+def _camel_case(name: str) -> str:
+    """COLUMN_NAME -> columnName."""
+    parts = name.lower().split('_')
+    return parts[0] + ''.join(word.capitalize() for word in parts[1:])
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Column:
     """Represents a database column."""
     name: str
@@ -18,68 +113,14 @@ class Column:
 
     def to_pure_type(self) -> str:
         """Convert database type to Pure column type."""
-        if self._type_mapper:
-            return self._type_mapper.to_pure_column_type(self.data_type)
-        # Default Snowflake-compatible mapping for backward compatibility
-        return self._default_pure_type()
+        return _pure_column_type(self._type_mapper, self.data_type)
 
     def to_pure_property_type(self) -> str:
         """Convert database type to Pure property type."""
-        if self._type_mapper:
-            return self._type_mapper.to_pure_property_type(self.data_type)
-        return self._default_property_type()
-
-    def _default_pure_type(self) -> str:
-        """Default Pure column type mapping (Snowflake-compatible)."""
-        type_upper = self.data_type.upper()
-
-        if "VARCHAR" in type_upper or "TEXT" in type_upper or "STRING" in type_upper or "CHAR" in type_upper:
-            if "(" in type_upper:
-                return self.data_type.upper()
-            return "VARCHAR(256)"
-        elif "INT" in type_upper or "NUMBER" in type_upper or "NUMERIC" in type_upper:
-            if "." in str(self.data_type) or "FLOAT" in type_upper or "DOUBLE" in type_upper or "DECIMAL" in type_upper:
-                return "FLOAT"
-            return "INTEGER"
-        elif "FLOAT" in type_upper or "DOUBLE" in type_upper or "REAL" in type_upper:
-            return "FLOAT"
-        elif "BOOL" in type_upper:
-            return "BIT"
-        elif "DATE" in type_upper and "TIME" not in type_upper:
-            return "DATE"
-        elif "TIMESTAMP" in type_upper or "DATETIME" in type_upper:
-            return "TIMESTAMP"
-        elif "TIME" in type_upper:
-            # TIME type is not supported by Legend Engine - map to TIMESTAMP
-            return "TIMESTAMP"
-        else:
-            return "VARCHAR(256)"
-
-    def _default_property_type(self) -> str:
-        """Default Pure property type mapping (Snowflake-compatible)."""
-        type_upper = self.data_type.upper()
-
-        if "VARCHAR" in type_upper or "TEXT" in type_upper or "STRING" in type_upper or "CHAR" in type_upper:
-            return "String"
-        elif "INT" in type_upper:
-            return "Integer"
-        elif "NUMBER" in type_upper or "NUMERIC" in type_upper:
-            if "," in str(self.data_type):
-                return "Float"
-            return "Integer"
-        elif "FLOAT" in type_upper or "DOUBLE" in type_upper or "REAL" in type_upper or "DECIMAL" in type_upper:
-            return "Float"
-        elif "BOOL" in type_upper:
-            return "Boolean"
-        elif "DATE" in type_upper:
-            return "Date"
-        elif "TIMESTAMP" in type_upper or "DATETIME" in type_upper:
-            return "DateTime"
-        else:
-            return "String"
+        return _pure_property_type(self._type_mapper, self.data_type)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Relationship:
     """Represents a relationship between two tables."""
     source_table: str
@@ -88,6 +129,13 @@ class Relationship:
     target_column: str
     relationship_type: str  # 'many_to_one', 'one_to_many', 'one_to_one'
     property_name: str  # Name for the association property
+    # "TABLE.COLUMN" endpoint labels, computed once at construction
+    source_key: str = field(init=False, repr=False, compare=False)
+    target_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.source_key = f"{self.source_table}.{self.source_column}"
+        self.target_key = f"{self.target_table}.{self.target_column}"
 
     def get_reverse_property_name(self, source_table_name: str) -> str:
         """Get property name for reverse relationship."""
@@ -100,7 +148,7 @@ class Relationship:
         return name
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Table:
     """Represents a database table."""
     name: str
@@ -111,13 +159,11 @@ class Table:
 
     def get_class_name(self) -> str:
         """Convert table name to class name (PascalCase)."""
-        parts = self.name.lower().split('_')
-        return ''.join(word.capitalize() for word in parts)
+        return _pascal_case(self.name)
 
     def get_property_name(self, column_name: str) -> str:
         """Convert column name to property name (camelCase)."""
-        parts = column_name.lower().split('_')
-        return parts[0] + ''.join(word.capitalize() for word in parts[1:])
+        return _camel_case(column_name)
 
     def get_potential_key_columns(self) -> List[str]:
         """Get columns that could be primary/foreign keys."""
@@ -127,7 +173,7 @@ class Table:
                 or col.name.upper() in ('ID', 'KEY', 'CODE')]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Schema:
     """Represents a database schema."""
     name: str
@@ -141,6 +187,11 @@ class Database:
     schemas: List[Schema] = field(default_factory=list)
     relationships: List[Relationship] = field(default_factory=list)
 
+    @property
+    def table_count(self) -> int:
+        """Number of tables across all schemas, without collecting them."""
+        return sum(len(schema.tables) for schema in self.schemas)
+
     def get_all_tables(self) -> List[Table]:
         """Get all tables across all schemas."""
         tables = []
@@ -155,3 +206,37 @@ class Database:
                 if table.name == table_name:
                     return table
         return None
+
+    def fingerprint(self) -> str:
+        """Hash of everything the Pure generators read from this database.
+
+        Covers the name, tables, columns and relationships in their
+        current order (which the generated code follows). Recomputed on
+        every call, since tools rename the database and merge
+        relationships into it in place.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        update = digest.update
+        update(repr(self.name).encode())
+        for schema in self.schemas:
+            for table in schema.tables:
+                update(repr((
+                    schema.name,
+                    table.name,
+                    table.primary_key_columns,
+                    [(c.name, c.data_type, c.is_nullable, c.is_primary_key)
+                     for c in table.columns],
+                )).encode())
+        update(repr(self.relationship_signature()).encode())
+        return digest.hexdigest()
+
+    def relationship_signature(self) -> Tuple:
+        """The relationship fields the generators read, in order.
+
+        Much cheaper than fingerprint(); used to key cached code on a
+        schema whose tables are unchanged since it was stored.
+        """
+        return tuple(
+            (rel.source_key, rel.target_key, rel.relationship_type, rel.property_name)
+            for rel in self.relationships
+        )
@@ -0,0 +1,60 @@
+"""On-disk cache of introspected database schemas."""
+
+import hashlib
+from typing import Iterable, Optional, Tuple
+
+from legend_cli.pickle_cache import PickleCache
+from .models import Database
+
+
+def listing_fingerprint(listing: Iterable[Tuple]) -> str:
+    """Hash a get_column_listing() result, ignoring table order.
+
+    Column order within a table is kept, since it is part of the schema.
+    """
+    normalized = sorted((tuple(row) for row in listing), key=lambda row: (row[0], row[1]))
+    return hashlib.sha256(repr(normalized).encode()).hexdigest()
+
+
+class SchemaCache(PickleCache):
+    """Introspected schemas pickled to ~/.legend-cli/schema_cache.
+
+    Each entry stores a fingerprint of the database's column listing
+    (tables, columns, types, nullability and primary keys) taken just
+    before introspection, and load() only returns the schema while the
+    live listing still matches. Introspecting again overwrites the entry.
+    """
+
+    dir_name = "schema_cache"
+
+    def load(self, key: Tuple, current_fingerprint: str) -> Optional[Database]:
+        """Return the cached schema for key if its listing fingerprint matches.
+
+        Args:
+            key: Cache key (database type, identifier and introspection options)
+            current_fingerprint: listing_fingerprint() of the live database
+
+        Returns:
+            The cached Database, or None if missing, stale or unreadable
+        """
+        entry = self._read(key)
+        if entry is None:
+            return None
+        fingerprint, schema = entry
+        if fingerprint != current_fingerprint:
+            return None
+        return schema
+
+    def save(self, key: Tuple, fingerprint: str, schema: Database) -> None:
+        """Store a freshly introspected schema under key.
+
+        Call before the schema is modified, so the entry matches the
+        database rather than the session's edits.
+
+        Args:
+            key: Cache key (database type, identifier and introspection options)
+            fingerprint: listing_fingerprint() taken before introspecting,
+                so a change made meanwhile makes the entry stale
+            schema: The introspected Database
+        """
+        self._write(key, (fingerprint, schema))
@@ -1,7 +1,8 @@
 """Snowflake database introspector."""
 
 import os
-from typing import Optional, List
+import sys
+from typing import Dict, Optional, List, Tuple
 
 from .base import DatabaseIntrospector
 from .models import Column
@@ -61,7 +62,7 @@ class SnowflakeIntrospector(DatabaseIntrospector):
         cursor = conn.cursor()
         try:
             cursor.execute("SHOW SCHEMAS")
-            schemas = [row[1] for row in cursor.fetchall()]
+            schemas = [sys.intern(row[1]) for row in cursor.fetchall()]
             return [s for s in schemas if s not in self.EXCLUDED_SCHEMAS]
         finally:
             cursor.close()
@@ -73,11 +74,11 @@ class SnowflakeIntrospector(DatabaseIntrospector):
         try:
             tables = []
             cursor.execute(f"SHOW TABLES IN {database}.{schema}")
-            tables.extend([row[1] for row in cursor.fetchall()])
+            tables.extend([sys.intern(row[1]) for row in cursor.fetchall()])
 
             if include_views:
                 cursor.execute(f"SHOW VIEWS IN {database}.{schema}")
-                tables.extend([row[1] for row in cursor.fetchall()])
+                tables.extend([sys.intern(row[1]) for row in cursor.fetchall()])
 
             return tables
         finally:
@@ -91,8 +92,8 @@ class SnowflakeIntrospector(DatabaseIntrospector):
             cursor.execute(f"DESCRIBE TABLE {database}.{schema}.{table}")
             columns = []
             for row in cursor.fetchall():
-                col_name = row[0]
-                col_type = row[1]
+                col_name = sys.intern(row[0])
+                col_type = sys.intern(row[1])
                 is_nullable = row[3] == 'Y' if len(row) > 3 else True
                 columns.append(Column(
                     name=col_name,
@@ -119,13 +120,62 @@ class SnowflakeIntrospector(DatabaseIntrospector):
                   AND tc.TABLE_NAME = '{table}'
                   AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
             """)
-            pks = [row[0] for row in cursor.fetchall()]
+            pks = [sys.intern(row[0]) for row in cursor.fetchall()]
             return pks
         except:
             return []
         finally:
             cursor.close()
 
+    def get_column_listing(
+        self,
+        database: str,
+        schema_filter: Optional[str] = None
+    ) -> List[Tuple]:
+        """List every introspected column from the database's INFORMATION_SCHEMA."""
+        schemas = set(self._get_introspection_schemas(database, schema_filter))
+        conn = self.connect(database)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE,
+                       CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE
+                FROM {database}.INFORMATION_SCHEMA.COLUMNS
+                ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+            """)
+            columns = cursor.fetchall()
+            try:
+                cursor.execute(f"""
+                    SELECT kcu.TABLE_SCHEMA, kcu.TABLE_NAME, kcu.COLUMN_NAME
+                    FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+                    JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                      ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                    WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+                """)
+                pks = {(row[0], row[1], row[2]) for row in cursor.fetchall()}
+            except Exception:
+                pks = set()
+        finally:
+            cursor.close()
+
+        return [
+            (row[0], row[1], row[2], (row[3], row[4], row[5], row[6]),
+             row[7] == 'YES', (row[0], row[1], row[2]) in pks)
+            for row in columns
+            if row[0] in schemas
+        ]
+
+    @staticmethod
+    def _table_ref(database: str, schema: str, table: str) -> str:
+        """Reference a table for the distinct-value queries.
+
+        The database name is left unquoted, as everywhere else in this
+        introspector, since it is user-supplied and Snowflake upper-cases
+        unquoted identifiers. Schema and table names come from SHOW
+        output in their stored case, so they are quoted to match exactly.
+        """
+        return f'{database}."{schema}"."{table}"'
+
     def get_distinct_values(
         self,
         database: str,
@@ -151,7 +201,7 @@ class SnowflakeIntrospector(DatabaseIntrospector):
         try:
             cursor.execute(f"""
                 SELECT DISTINCT "{column}"
-                FROM "{database}"."{schema}"."{table}"
+                FROM {self._table_ref(database, schema, table)}
                 WHERE "{column}" IS NOT NULL
                 LIMIT {limit}
             """)
@@ -161,3 +211,68 @@ class SnowflakeIntrospector(DatabaseIntrospector):
             return []
         finally:
             cursor.close()
+
+    def get_distinct_values_multi(
+        self,
+        database: str,
+        schema: str,
+        table: str,
+        columns: List[str],
+        limit: int = 50,
+    ) -> Dict[str, List[str]]:
+        """Get distinct values from several columns of a table in one query.
+
+        Saves a round trip per column. Each column keeps its own limit and
+        gets its own result column, so values keep their native type and
+        are converted with str() exactly as get_distinct_values does. If
+        the combined query fails, each column is fetched separately with
+        get_distinct_values.
+
+        Args:
+            database: Database name
+            schema: Schema name
+            table: Table name
+            columns: Column names
+            limit: Maximum number of values to return per column
+
+        Returns:
+            Distinct non-null values as strings, keyed by column name
+        """
+        if len(columns) < 2:
+            return {
+                c: self.get_distinct_values(database, schema, table, c, limit)
+                for c in columns
+            }
+
+        # Branch i fills only result column i; the NULLs in the other
+        # columns take on its type, so no cast is needed
+        table_ref = self._table_ref(database, schema, table)
+        sql = " UNION ALL ".join(
+            f"""SELECT {i} AS col_idx, {", ".join(
+                f'"{column}"' if j == i else "NULL" for j in range(len(columns))
+            )} FROM (
+                SELECT DISTINCT "{column}"
+                FROM {table_ref}
+                WHERE "{column}" IS NOT NULL
+                LIMIT {limit}
+            )"""
+            for i, column in enumerate(columns)
+        )
+        conn = self.connect(database)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql)
+            rows = cursor.fetchall()
+        except Exception:
+            return {
+                c: self.get_distinct_values(database, schema, table, c, limit)
+                for c in columns
+            }
+        finally:
+            cursor.close()
+
+        values: Dict[str, List[str]] = {c: [] for c in columns}
+        for row in rows:
+            col_idx = row[0]
+            values[columns[col_idx]].append(str(row[col_idx + 1]))
+        return values
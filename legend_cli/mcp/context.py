@@ -1,14 +1,23 @@
 """Session state management for Legend MCP server."""
 
+import asyncio
+import itertools
 import re
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple
 from enum import Enum
 
-from legend_cli.database.models import Database
+from legend_cli.database.models import Database, DATACLASS_SLOTS
 
 
+_SEPARATORS_RE = re.compile(r'[-\s.]+')
+_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+
+@lru_cache(maxsize=256)
 def sanitize_pure_identifier(name: str) -> str:
     """Sanitize a string to be a valid Pure identifier.
 
@@ -27,6 +36,9 @@ def sanitize_pure_identifier(name: str) -> str:
 
     Returns:
         Valid Pure identifier
+
+    Memoized, since tools sanitize the same database and schema names on
+    every call.
     """
     if not name:
         return "Unknown"
@@ -40,10 +52,10 @@ def sanitize_pure_identifier(name: str) -> str:
         name = name.rsplit('.', 1)[0]
 
     # Replace common separators with underscores
-    name = re.sub(r'[-\s.]+', '_', name)
+    name = _SEPARATORS_RE.sub('_', name)
 
     # Remove any characters that aren't alphanumeric or underscore
-    name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+    name = _INVALID_CHARS_RE.sub('', name)
 
     # Convert to PascalCase
     parts = name.split('_')
@@ -56,12 +68,102 @@ def sanitize_pure_identifier(name: str) -> str:
     return name or "Database"
 
 
+def code_preview(code: str, limit: int) -> str:
+    """Return code cut to limit characters, with "..." appended if cut."""
+    if len(code) <= limit:
+        return code
+    return code[:limit] + "..."
+
+
+def code_summary(code: str, limit: int) -> Dict[str, Any]:
+    """Line count and preview of a generated artifact's code."""
+    return {"lines": code.count("\n") + 1, "preview": code_preview(code, limit)}
+
+
 class DatabaseType(str, Enum):
     """Supported database types."""
     SNOWFLAKE = "snowflake"
     DUCKDB = "duckdb"
 
 
+# Source of MCPContext.schema_versions values; shared by every context so
+# a version number is never reused for a different schema
+_schema_versions = itertools.count(1)
+
+_DB_TYPES: Dict[str, DatabaseType] = {t.value: t for t in DatabaseType}
+
+
+@lru_cache(maxsize=16)
+def parse_db_type(db_type: str) -> DatabaseType:
+    """Convert a db_type argument to a DatabaseType, ignoring case.
+
+    Memoized because tools convert the same couple of strings on every
+    call. Raises ValueError for unsupported types.
+    """
+    try:
+        return _DB_TYPES[db_type.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported database type '{db_type}' (supported: {', '.join(_DB_TYPES)})"
+        ) from None
+
+
+class IntrospectorPool:
+    """A bounded pool of connected introspectors for one database.
+
+    Introspectors hold a single driver connection, so concurrent tool calls
+    against the same database would otherwise queue behind each other.
+    The pool lends out up to ``size`` introspectors at once, creating them
+    on demand with ``factory`` (which must return a connected introspector)
+    and waiting on a semaphore once all are in use.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 4, initial: Any = None):
+        """Initialize the pool.
+
+        Args:
+            factory: Callable returning a new, connected introspector
+            size: Maximum number of introspectors lent out at once
+            initial: Optional already-connected introspector to seed the pool
+        """
+        self.factory = factory
+        self.size = size
+        self._idle: List[Any] = []
+        self._all: List[Any] = []
+        # Created on first acquire so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        if initial is not None:
+            self._idle.append(initial)
+            self._all.append(initial)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow an introspector for the duration of the block."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+
+        async with self._semaphore:
+            if self._idle:
+                introspector = self._idle.pop()
+            else:
+                introspector = await asyncio.to_thread(self.factory)
+                self._all.append(introspector)
+            try:
+                yield introspector
+            finally:
+                self._idle.append(introspector)
+
+    def close(self):
+        """Close every introspector created by the pool."""
+        for introspector in self._all:
+            try:
+                introspector.close()
+            except Exception:
+                pass
+        self._idle.clear()
+        self._all.clear()
+
+
 @dataclass
 class DatabaseConnection:
     """Represents an active database connection."""
@@ -70,19 +172,44 @@ class DatabaseConnection:
     introspector: Any  # DatabaseIntrospector
     is_connected: bool = False
     connection_params: Dict[str, Any] = field(default_factory=dict)
+    pool: Optional[IntrospectorPool] = None
 
     def __post_init__(self):
         if isinstance(self.db_type, str):
-            self.db_type = DatabaseType(self.db_type.lower())
-
-
-@dataclass
+            self.db_type = parse_db_type(self.db_type)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow an introspector, from the pool when the connection has one."""
+        if self.pool is None:
+            yield self.introspector
+        else:
+            async with self.pool.acquire() as introspector:
+                yield introspector
+
+    def close(self):
+        """Close the connection's introspectors."""
+        if self.pool is not None:
+            self.pool.close()
+        elif self.introspector:
+            try:
+                self.introspector.close()
+            except Exception:
+                pass
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PendingArtifact:
     """Represents a generated artifact pending for SDLC push."""
     artifact_type: str  # 'store', 'classes', 'connection', 'mapping', 'runtime', 'associations'
     pure_code: str
     path: Optional[str] = None  # Full Pure path like 'model::domain::Person'
     classifier_path: Optional[str] = None
+    # Short preview of the Pure code, computed once when the artifact is created
+    preview: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.preview = code_preview(self.pure_code, 200)
 
 
 @dataclass
@@ -105,6 +232,13 @@ class MCPContext:
     # Pending artifacts awaiting push to SDLC
     pending_artifacts: List[PendingArtifact] = field(default_factory=list)
 
+    # Version of each stored schema, renewed by every store_schema call
+    schema_versions: Dict[str, int] = field(default_factory=dict)
+
+    # Generated code keyed by (connection key, tool, schema version, name,
+    # relationships, options...), so repeated generate_* calls skip rendering
+    artifact_cache: Dict[Tuple, Dict[str, Any]] = field(default_factory=dict)
+
     # Current SDLC context
     current_project_id: Optional[str] = None
     current_workspace_id: Optional[str] = None
@@ -126,16 +260,26 @@ class MCPContext:
         db_type: DatabaseType,
         database: str,
         introspector: Any,
-        connection_params: Dict[str, Any] = None
+        connection_params: Dict[str, Any] = None,
+        introspector_factory: Optional[Callable[[], Any]] = None,
+        pool_size: int = 4,
     ) -> DatabaseConnection:
-        """Add or update a database connection."""
+        """Add or update a database connection.
+
+        When introspector_factory is given, the connection gets a pool of
+        up to pool_size introspectors, seeded with introspector.
+        """
         key = self.get_connection_key(db_type, database)
+        pool = None
+        if introspector_factory is not None:
+            pool = IntrospectorPool(introspector_factory, size=pool_size, initial=introspector)
         conn = DatabaseConnection(
             db_type=db_type,
             database_name=database,
             introspector=introspector,
             is_connected=True,
-            connection_params=connection_params or {}
+            connection_params=connection_params or {},
+            pool=pool,
         )
         self.connections[key] = conn
         return conn
@@ -149,12 +293,7 @@ class MCPContext:
         """Remove a database connection."""
         key = self.get_connection_key(db_type, database)
         if key in self.connections:
-            conn = self.connections[key]
-            if conn.introspector:
-                try:
-                    conn.introspector.close()
-                except Exception:
-                    pass
+            self.connections[key].close()
             del self.connections[key]
             return True
         return False
@@ -163,12 +302,20 @@ class MCPContext:
         """Store an introspected database schema."""
         key = self.get_connection_key(db_type, database)
         self.introspected_schemas[key] = schema
+        self.schema_versions[key] = next(_schema_versions)
+        self.invalidate_artifacts(db_type, database)
 
     def get_schema(self, db_type: DatabaseType, database: str) -> Optional[Database]:
         """Get a stored database schema."""
         key = self.get_connection_key(db_type, database)
         return self.introspected_schemas.get(key)
 
+    def invalidate_artifacts(self, db_type: DatabaseType, database: str):
+        """Drop cached generator output for a database."""
+        key = self.get_connection_key(db_type, database)
+        for cache_key in [k for k in self.artifact_cache if k[0] == key]:
+            del self.artifact_cache[cache_key]
+
     def add_pending_artifact(
         self,
         artifact_type: str,
@@ -184,6 +331,24 @@ class MCPContext:
             classifier_path=classifier_path
         ))
 
+    def add_pending_artifacts(self, artifacts: Dict[str, str]):
+        """Add several artifacts at once, keyed by artifact type."""
+        self.pending_artifacts.extend(
+            PendingArtifact(artifact_type=artifact_type, pure_code=pure_code)
+            for artifact_type, pure_code in artifacts.items()
+        )
+
+    def set_pending_artifacts(self, artifacts: Dict[str, str]):
+        """Replace the pending list with artifacts, keyed by artifact type.
+
+        The list object is kept and its contents swapped in one slice
+        assignment, so readers never see it emptied but not yet refilled.
+        """
+        self.pending_artifacts[:] = [
+            PendingArtifact(artifact_type=artifact_type, pure_code=pure_code)
+            for artifact_type, pure_code in artifacts.items()
+        ]
+
     def clear_pending_artifacts(self):
         """Clear all pending artifacts."""
         self.pending_artifacts.clear()
@@ -203,19 +368,17 @@ class MCPContext:
 
     def close_all_connections(self):
         """Close all active database connections."""
-        for key, conn in list(self.connections.items()):
-            if conn.introspector:
-                try:
-                    conn.introspector.close()
-                except Exception:
-                    pass
+        for conn in list(self.connections.values()):
+            conn.close()
         self.connections.clear()
 
     def reset(self):
         """Reset all session state."""
         self.close_all_connections()
         self.introspected_schemas.clear()
+        self.schema_versions.clear()
         self.pending_artifacts.clear()
+        self.artifact_cache.clear()
         self.current_project_id = None
         self.current_workspace_id = None
 
@@ -4,7 +4,7 @@ import sqlite3
 import logging
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Sequence, Type
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ CREATE TABLE IF NOT EXISTS mcp_tool_calls (
     session_id TEXT,
     tool_name TEXT NOT NULL,
     parameters TEXT,  -- JSON
+    parameters_preview TEXT,  -- parameters cut for display, set at insert
     status TEXT,  -- 'started', 'success', 'error'
     result TEXT,  -- JSON (truncated)
     error_message TEXT,
@@ -28,11 +29,86 @@ CREATE TABLE IF NOT EXISTS mcp_tool_calls (
 
 CREATE INDEX IF NOT EXISTS idx_tool_calls_timestamp ON mcp_tool_calls(timestamp);
 CREATE INDEX IF NOT EXISTS idx_tool_calls_tool_name ON mcp_tool_calls(tool_name);
-CREATE INDEX IF NOT EXISTS idx_tool_calls_status ON mcp_tool_calls(status);
 CREATE INDEX IF NOT EXISTS idx_tool_calls_session_id ON mcp_tool_calls(session_id);
+CREATE INDEX IF NOT EXISTS idx_tool_calls_tool_status_ts
+    ON mcp_tool_calls(tool_name, status, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_tool_calls_error_ts
+    ON mcp_tool_calls(timestamp DESC) WHERE status = 'error';
+
+-- Per-hour, per-tool rollup of finished calls, maintained by insert_logs
+-- so get_stats reads one row per tool-hour instead of every call
+CREATE TABLE IF NOT EXISTS mcp_tool_call_stats_hourly (
+    hour TEXT NOT NULL,  -- 'YYYY-MM-DD HH:00:00' (UTC)
+    tool_name TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    sum_duration INTEGER NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,  -- calls with a duration
+    PRIMARY KEY (hour, tool_name)
+);
+
+-- Superseded by the two indexes above; without ANALYZE data SQLite would
+-- pick it for status filters and sort the matches instead of walking an
+-- index in timestamp order
+DROP INDEX IF EXISTS idx_tool_calls_status;
 """
 
 
+# Length of parameters_preview before the "..." suffix
+PARAMETERS_PREVIEW_LENGTH = 200
+
+# Columns that query_logs may project; guards the SELECT list against injection
+LOG_COLUMNS = (
+    "id",
+    "timestamp",
+    "session_id",
+    "tool_name",
+    "parameters",
+    "parameters_preview",
+    "status",
+    "result",
+    "error_message",
+    "error_type",
+    "duration_ms",
+    "context_data",
+)
+
+
+def _sql_timestamp(value: datetime) -> str:
+    """Format a UTC datetime the way SQLite's CURRENT_TIMESTAMP stores it.
+
+    Timestamps are compared as text, so cutoffs must use the same
+    "YYYY-MM-DD HH:MM:SS" layout; an isoformat() "T" separator sorts
+    after every stored time on the same date.
+    """
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _parameters_preview(parameters: Optional[str]) -> Optional[str]:
+    """Cut parameters to PARAMETERS_PREVIEW_LENGTH characters for display."""
+    if parameters and len(parameters) > PARAMETERS_PREVIEW_LENGTH:
+        return parameters[:PARAMETERS_PREVIEW_LENGTH] + "..."
+    return parameters
+
+
+def _hourly_rollup(rows: Sequence[tuple]) -> List[tuple]:
+    """Aggregate insert_logs rows into mcp_tool_call_stats_hourly rows."""
+    buckets: Dict[tuple, List[int]] = {}
+    for row in rows:
+        timestamp, tool_name, status, duration_ms = row[0], row[2], row[5], row[9]
+        bucket = buckets.setdefault((timestamp[:13] + ":00:00", tool_name), [0, 0, 0, 0, 0])
+        bucket[0] += 1
+        if status == "success":
+            bucket[1] += 1
+        elif status == "error":
+            bucket[2] += 1
+        if duration_ms is not None:
+            bucket[3] += duration_ms
+            bucket[4] += 1
+    return [key + tuple(values) for key, values in buckets.items()]
+
+
 def get_default_db_path() -> str:
     """Get the default database path (~/.legend-cli/mcp_logs.db)."""
     home = Path.home()
@@ -73,96 +149,110 @@ class MCPLogDatabase:
         try:
             conn = self._get_connection()
             conn.executescript(SCHEMA_SQL)
+            self._migrate(conn)
             self._initialized = True
             logger.debug("MCP logging database initialized at %s", self.db_path)
         except Exception as e:
             logger.error("Failed to initialize MCP logging database: %s", e)
             raise
 
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Add columns and rollups introduced after a log database was created."""
+        has_rollup = conn.execute("SELECT 1 FROM mcp_tool_call_stats_hourly LIMIT 1").fetchone()
+        if not has_rollup:
+            conn.execute(
+                """
+                INSERT INTO mcp_tool_call_stats_hourly
+                    (hour, tool_name, count, success_count, error_count,
+                     sum_duration, duration_count)
+                SELECT strftime('%Y-%m-%d %H:00:00', timestamp), tool_name, COUNT(*),
+                       SUM(status IS 'success'), SUM(status IS 'error'),
+                       COALESCE(SUM(duration_ms), 0), COUNT(duration_ms)
+                FROM mcp_tool_calls
+                GROUP BY 1, 2
+                """
+            )
+
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(mcp_tool_calls)")}
+        if "parameters_preview" not in columns:
+            conn.execute("ALTER TABLE mcp_tool_calls ADD COLUMN parameters_preview TEXT")
+            conn.execute(
+                """
+                UPDATE mcp_tool_calls
+                SET parameters_preview = CASE
+                    WHEN length(parameters) > ? THEN substr(parameters, 1, ?) || '...'
+                    ELSE parameters
+                END
+                WHERE parameters IS NOT NULL
+                """,
+                (PARAMETERS_PREVIEW_LENGTH, PARAMETERS_PREVIEW_LENGTH),
+            )
+
     def close(self) -> None:
         """Close database connection."""
         if self._connection:
             self._connection.close()
             self._connection = None
 
-    def insert_log(
-        self,
-        tool_name: str,
-        session_id: Optional[str] = None,
-        parameters: Optional[str] = None,
-        status: str = "started",
-        context_data: Optional[str] = None,
-    ) -> int:
-        """Insert a new log entry.
+    def insert_logs(self, entries: Sequence[Dict[str, Any]]) -> None:
+        """Insert completed log entries in a single transaction.
 
         Args:
-            tool_name: Name of the MCP tool being called
-            session_id: Optional session identifier
-            parameters: JSON string of tool parameters
-            status: Initial status ('started')
-            context_data: JSON string of context (project_id, workspace_id)
-
-        Returns:
-            The row ID of the inserted log entry
+            entries: Dicts with tool_name and any of timestamp (a UTC
+                datetime), session_id, parameters, status, result,
+                error_message, error_type, duration_ms and context_data
         """
         self.initialize()
         conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            INSERT INTO mcp_tool_calls (tool_name, session_id, parameters, status, context_data)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (tool_name, session_id, parameters, status, context_data),
-        )
-        return cursor.lastrowid
-
-    def update_log_success(
-        self,
-        log_id: int,
-        result: Optional[str] = None,
-        duration_ms: Optional[int] = None,
-    ) -> None:
-        """Update log entry with successful result.
-
-        Args:
-            log_id: ID of the log entry to update
-            result: JSON string of the result (may be truncated)
-            duration_ms: Execution duration in milliseconds
-        """
-        conn = self._get_connection()
-        conn.execute(
-            """
-            UPDATE mcp_tool_calls
-            SET status = 'success', result = ?, duration_ms = ?
-            WHERE id = ?
-            """,
-            (result, duration_ms, log_id),
-        )
-
-    def update_log_error(
-        self,
-        log_id: int,
-        error_message: str,
-        error_type: Optional[str] = None,
-        duration_ms: Optional[int] = None,
-    ) -> None:
-        """Update log entry with error information.
+        rows = [
+            (
+                _sql_timestamp(e.get("timestamp") or datetime.utcnow()),
+                e.get("session_id"),
+                e["tool_name"],
+                e.get("parameters"),
+                _parameters_preview(e.get("parameters")),
+                e.get("status"),
+                e.get("result"),
+                e.get("error_message"),
+                e.get("error_type"),
+                e.get("duration_ms"),
+                e.get("context_data"),
+            )
+            for e in entries
+        ]
 
-        Args:
-            log_id: ID of the log entry to update
-            error_message: Error message
-            error_type: Type/class of the error
-            duration_ms: Execution duration in milliseconds
-        """
-        conn = self._get_connection()
-        conn.execute(
-            """
-            UPDATE mcp_tool_calls
-            SET status = 'error', error_message = ?, error_type = ?, duration_ms = ?
-            WHERE id = ?
-            """,
-            (error_message, error_type, duration_ms, log_id),
-        )
+        # The connection autocommits; one explicit transaction means one
+        # journal sync for the whole batch
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                """
+                INSERT INTO mcp_tool_calls
+                    (timestamp, session_id, tool_name, parameters, parameters_preview,
+                     status, result, error_message, error_type, duration_ms, context_data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.executemany(
+                """
+                INSERT INTO mcp_tool_call_stats_hourly
+                    (hour, tool_name, count, success_count, error_count,
+                     sum_duration, duration_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (hour, tool_name) DO UPDATE SET
+                    count = count + excluded.count,
+                    success_count = success_count + excluded.success_count,
+                    error_count = error_count + excluded.error_count,
+                    sum_duration = sum_duration + excluded.sum_duration,
+                    duration_count = duration_count + excluded.duration_count
+                """,
+                _hourly_rollup(rows),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
     def query_logs(
         self,
@@ -172,7 +262,12 @@ class MCPLogDatabase:
         since_hours: int = 24,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+        fields: Optional[Sequence[str]] = None,
+        truncate_parameters: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        row_type: Optional[Type[NamedTuple]] = None,
+    ) -> List[Any]:
         """Query log entries with optional filters.
 
         Args:
@@ -182,26 +277,57 @@ class MCPLogDatabase:
             since_hours: Look back N hours (default 24)
             limit: Maximum number of results (default 100)
             offset: Offset for pagination
+            fields: Columns to return (default all); must be in LOG_COLUMNS
+            truncate_parameters: If set, cut parameters to this many
+                characters (plus "...") in SQL
+            since: UTC start of the time window; overrides since_hours
+            until: UTC end of the time window (exclusive); default open
+            row_type: Namedtuple class to build rows with instead of dicts;
+                its field names are the columns selected (fields is ignored)
 
         Returns:
-            List of log entries as dictionaries
+            List of log entries as dictionaries, or row_type instances
         """
         self.initialize()
         conn = self._get_connection()
 
+        if row_type is not None:
+            fields = row_type._fields
+        columns = list(fields) if fields else list(LOG_COLUMNS)
+        unknown = set(columns) - set(LOG_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown log columns: {', '.join(sorted(unknown))}")
+
+        select_params: List[Any] = []
+        if truncate_parameters is not None and "parameters" in columns:
+            columns[columns.index("parameters")] = (
+                "CASE WHEN length(parameters) > ? "
+                "THEN substr(parameters, 1, ?) || '...' "
+                "ELSE parameters END AS parameters"
+            )
+            select_params = [truncate_parameters, truncate_parameters]
+
         conditions = []
-        params = []
+        params: List[Any] = list(select_params)
 
         # Time filter
-        since_time = datetime.utcnow() - timedelta(hours=since_hours)
+        if since is None:
+            since = datetime.utcnow() - timedelta(hours=since_hours)
         conditions.append("timestamp >= ?")
-        params.append(since_time.isoformat())
+        params.append(_sql_timestamp(since))
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(_sql_timestamp(until))
 
         if tool_name:
             conditions.append("tool_name = ?")
             params.append(tool_name)
 
-        if status:
+        if status == "error":
+            # Inlined so SQLite can match the partial idx_tool_calls_error_ts
+            # index, which it never does for a bound parameter
+            conditions.append("status = 'error'")
+        elif status:
             conditions.append("status = ?")
             params.append(status)
 
@@ -213,17 +339,43 @@ class MCPLogDatabase:
         params.extend([limit, offset])
 
         query = f"""
-            SELECT * FROM mcp_tool_calls
+            SELECT {", ".join(columns)} FROM mcp_tool_calls
             WHERE {where_clause}
             ORDER BY timestamp DESC
             LIMIT ? OFFSET ?
         """
 
+        if row_type is not None:
+            # Plain tuples straight into the namedtuple, skipping sqlite3.Row
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            return list(map(row_type._make, cursor.execute(query, params).fetchall()))
+
         cursor = conn.execute(query, params)
         rows = cursor.fetchall()
 
         return [dict(row) for row in rows]
 
+    def get_log_by_id(self, log_id: int) -> Optional[Dict[str, Any]]:
+        """Get a specific log entry by ID, including full parameters.
+
+        Args:
+            log_id: Log entry identifier
+
+        Returns:
+            Log entry as dictionary or None
+        """
+        self.initialize()
+        conn = self._get_connection()
+
+        cursor = conn.execute(
+            "SELECT * FROM mcp_tool_calls WHERE id = ?",
+            (log_id,),
+        )
+        row = cursor.fetchone()
+
+        return dict(row) if row else None
+
     def get_stats(self, since_hours: int = 24) -> Dict[str, Any]:
         """Get statistics about tool calls.
 
@@ -237,42 +389,56 @@ class MCPLogDatabase:
         conn = self._get_connection()
 
         since_time = datetime.utcnow() - timedelta(hours=since_hours)
+        # Whole hours come from the rollup; only the partial hour at the
+        # start of the window is counted from individual calls
+        first_full_hour = since_time.replace(minute=0, second=0, microsecond=0)
+        if first_full_hour < since_time:
+            first_full_hour += timedelta(hours=1)
 
-        # Total counts
         cursor = conn.execute(
             """
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_count,
-                SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as error_count,
-                AVG(duration_ms) as avg_duration_ms
-            FROM mcp_tool_calls
-            WHERE timestamp >= ?
-            """,
-            (since_time.isoformat(),),
-        )
-        row = cursor.fetchone()
-
-        # Counts by tool
-        cursor = conn.execute(
-            """
-            SELECT tool_name, COUNT(*) as count,
-                   SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success,
-                   SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as errors
-            FROM mcp_tool_calls
-            WHERE timestamp >= ?
+            SELECT tool_name, SUM(count) AS count, SUM(success) AS success,
+                   SUM(errors) AS errors, SUM(sum_duration) AS sum_duration,
+                   SUM(duration_count) AS duration_count
+            FROM (
+                SELECT tool_name, count, success_count AS success,
+                       error_count AS errors, sum_duration, duration_count
+                FROM mcp_tool_call_stats_hourly
+                WHERE hour >= ?
+                UNION ALL
+                SELECT tool_name, 1, status IS 'success', status IS 'error',
+                       COALESCE(duration_ms, 0), duration_ms IS NOT NULL
+                FROM mcp_tool_calls
+                WHERE timestamp >= ? AND timestamp < ?
+            )
             GROUP BY tool_name
             ORDER BY count DESC
             """,
-            (since_time.isoformat(),),
+            (
+                _sql_timestamp(first_full_hour),
+                _sql_timestamp(since_time),
+                _sql_timestamp(first_full_hour),
+            ),
         )
-        tool_stats = [dict(r) for r in cursor.fetchall()]
+        rows = cursor.fetchall()
+
+        sum_duration = sum(r["sum_duration"] for r in rows)
+        duration_count = sum(r["duration_count"] for r in rows)
+        tool_stats = [
+            {
+                "tool_name": r["tool_name"],
+                "count": r["count"],
+                "success": r["success"],
+                "errors": r["errors"],
+            }
+            for r in rows
+        ]
 
         return {
-            "total_calls": row["total"] or 0,
-            "success_count": row["success_count"] or 0,
-            "error_count": row["error_count"] or 0,
-            "avg_duration_ms": round(row["avg_duration_ms"] or 0, 2),
+            "total_calls": sum(r["count"] for r in rows),
+            "success_count": sum(r["success"] for r in rows),
+            "error_count": sum(r["errors"] for r in rows),
+            "avg_duration_ms": round(sum_duration / duration_count, 2) if duration_count else 0,
             "since_hours": since_hours,
             "by_tool": tool_stats,
         }
@@ -295,10 +461,16 @@ class MCPLogDatabase:
             DELETE FROM mcp_tool_calls
             WHERE timestamp < ?
             """,
-            (cutoff_time.isoformat(),),
+            (_sql_timestamp(cutoff_time),),
         )
 
         deleted = cursor.rowcount
+        # Keep the rollup's partial cutoff hour; get_stats windows never
+        # reach back past retention anyway
+        conn.execute(
+            "DELETE FROM mcp_tool_call_stats_hourly WHERE hour < ?",
+            (_sql_timestamp(cutoff_time.replace(minute=0, second=0, microsecond=0)),),
+        )
         if deleted > 0:
             logger.info("Cleaned up %d old log entries", deleted)
 
@@ -1,10 +1,14 @@
 """MCP tool call logging service."""
 
+import asyncio
+import itertools
 import json
 import logging
 import time
 import uuid
-from typing import Optional, Any, Dict, List
+from collections import deque
+from datetime import datetime
+from typing import Optional, Any, Deque, Dict, List, NamedTuple, Sequence, Type
 
 from .db import MCPLogDatabase
 
@@ -16,6 +20,13 @@ class MCPLogService:
 
     Provides async-compatible methods for logging tool invocations,
     results, and errors.
+
+    Calls are held in memory while they run and written once finished.
+    Finished entries go into a bounded buffer that is flushed to SQLite
+    in one transaction per batch, either when batch_size entries are
+    waiting or flush_interval seconds after the first one. When the
+    buffer is full the oldest entry is dropped and counted in
+    dropped_count. Queries flush first, so they always see finished calls.
     """
 
     def __init__(
@@ -24,6 +35,9 @@ class MCPLogService:
         retention_days: int = 30,
         max_result_size: int = 10000,
         enabled: bool = True,
+        batch_size: int = 100,
+        flush_interval: float = 0.1,
+        buffer_size: int = 10000,
     ):
         """Initialize the logging service.
 
@@ -32,12 +46,22 @@ class MCPLogService:
             retention_days: Number of days to retain logs.
             max_result_size: Maximum size of result/parameter strings to store.
             enabled: Whether logging is enabled.
+            batch_size: Number of finished entries that triggers a flush.
+            flush_interval: Seconds to wait before flushing a partial batch.
+            buffer_size: Maximum finished entries held before dropping.
         """
         self.db = MCPLogDatabase(db_path) if enabled else None
         self.retention_days = retention_days
         self.max_result_size = max_result_size
         self.enabled = enabled
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped_count = 0
         self._session_id: Optional[str] = None
+        self._ids = itertools.count(1)
+        self._running: Dict[int, Dict[str, Any]] = {}
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     @property
     def session_id(self) -> str:
@@ -77,7 +101,7 @@ class MCPLogService:
             context: Additional context (project_id, workspace_id, etc.)
 
         Returns:
-            Log entry ID for tracking
+            Log entry ID for tracking (local to this service, not the row ID)
         """
         if not self.enabled or self.db is None:
             return -1
@@ -86,13 +110,15 @@ class MCPLogService:
             params_json = self._truncate(self._safe_json(params)) if params else None
             context_json = self._safe_json(context) if context else None
 
-            log_id = self.db.insert_log(
-                tool_name=tool_name,
-                session_id=self.session_id,
-                parameters=params_json,
-                status="started",
-                context_data=context_json,
-            )
+            log_id = next(self._ids)
+            self._running[log_id] = {
+                "timestamp": datetime.utcnow(),
+                "session_id": self.session_id,
+                "tool_name": tool_name,
+                "parameters": params_json,
+                "status": "started",
+                "context_data": context_json,
+            }
 
             logger.debug("Logged tool start: %s (id=%d)", tool_name, log_id)
             return log_id
@@ -118,12 +144,13 @@ class MCPLogService:
             return
 
         try:
-            result_json = self._truncate(self._safe_json(result))
-            self.db.update_log_success(
-                log_id=log_id,
-                result=result_json,
-                duration_ms=duration_ms,
-            )
+            entry = self._running.pop(log_id, None)
+            if entry is None:
+                return
+            entry["status"] = "success"
+            entry["result"] = self._truncate(self._safe_json(result))
+            entry["duration_ms"] = duration_ms
+            self._enqueue(entry)
             logger.debug("Logged tool success: id=%d, duration=%dms", log_id, duration_ms)
 
         except Exception as e:
@@ -146,27 +173,61 @@ class MCPLogService:
             return
 
         try:
-            error_message = str(error)[:1000]  # Truncate error message
+            entry = self._running.pop(log_id, None)
+            if entry is None:
+                return
             error_type = type(error).__name__
-
-            self.db.update_log_error(
-                log_id=log_id,
-                error_message=error_message,
-                error_type=error_type,
-                duration_ms=duration_ms,
-            )
+            entry["status"] = "error"
+            entry["error_message"] = str(error)[:1000]  # Truncate error message
+            entry["error_type"] = error_type
+            entry["duration_ms"] = duration_ms
+            self._enqueue(entry)
             logger.debug("Logged tool error: id=%d, type=%s", log_id, error_type)
 
         except Exception as e:
             logger.warning("Failed to log tool error: %s", e)
 
+    def _enqueue(self, entry: Dict[str, Any]) -> None:
+        """Buffer a finished entry and schedule or trigger a flush."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped_count += 1
+        self._buffer.append(entry)
+
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.flush_interval, self.flush
+            )
+
+    def flush(self) -> None:
+        """Write buffered entries to the database."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._buffer or self.db is None:
+            return
+
+        entries = list(self._buffer)
+        self._buffer.clear()
+        try:
+            self.db.insert_logs(entries)
+        except Exception as e:
+            self.dropped_count += len(entries)
+            logger.warning("Failed to write %d log entries: %s", len(entries), e)
+
     async def query_logs(
         self,
         tool_name: Optional[str] = None,
         status: Optional[str] = None,
         since_hours: int = 24,
         limit: int = 20,
-    ) -> List[Dict[str, Any]]:
+        fields: Optional[Sequence[str]] = None,
+        truncate_parameters: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        row_type: Optional[Type[NamedTuple]] = None,
+    ) -> List[Any]:
         """Query recent tool call logs.
 
         Args:
@@ -174,23 +235,34 @@ class MCPLogService:
             status: Filter by status ('success', 'error')
             since_hours: Look back N hours
             limit: Maximum results to return
+            fields: Columns to return (default all)
+            truncate_parameters: Truncate parameters to this many characters
+            since: UTC start of the time window; overrides since_hours
+            until: UTC end of the time window (exclusive)
+            row_type: Namedtuple class to return rows as; selects its fields
 
         Returns:
-            List of log entries
+            List of log entries, as dicts or row_type instances
+
+        Raises:
+            Exception: If the database query fails, so callers can tell a
+                failure from a window with no matching logs
         """
         if not self.enabled or self.db is None:
             return []
 
-        try:
-            return self.db.query_logs(
-                tool_name=tool_name,
-                status=status,
-                since_hours=since_hours,
-                limit=limit,
-            )
-        except Exception as e:
-            logger.warning("Failed to query logs: %s", e)
-            return []
+        self.flush()
+        return self.db.query_logs(
+            tool_name=tool_name,
+            status=status,
+            since_hours=since_hours,
+            limit=limit,
+            fields=fields,
+            truncate_parameters=truncate_parameters,
+            since=since,
+            until=until,
+            row_type=row_type,
+        )
 
     async def get_stats(self, since_hours: int = 24) -> Dict[str, Any]:
         """Get tool call statistics.
@@ -200,18 +272,19 @@ class MCPLogService:
 
         Returns:
             Statistics dictionary
+
+        Raises:
+            Exception: If the database query fails
         """
         if not self.enabled or self.db is None:
             return {"enabled": False}
 
-        try:
-            stats = self.db.get_stats(since_hours=since_hours)
-            stats["enabled"] = True
-            stats["session_id"] = self.session_id
-            return stats
-        except Exception as e:
-            logger.warning("Failed to get stats: %s", e)
-            return {"enabled": True, "error": str(e)}
+        self.flush()
+        stats = self.db.get_stats(since_hours=since_hours)
+        stats["dropped"] = self.dropped_count
+        stats["enabled"] = True
+        stats["session_id"] = self.session_id
+        return stats
 
     async def cleanup_old_logs(self) -> int:
         """Delete logs older than retention period.
@@ -229,7 +302,13 @@ class MCPLogService:
             return 0
 
     def close(self) -> None:
-        """Close database connection."""
+        """Flush buffered entries and close the database connection.
+
+        Calls still running are written with status 'started'.
+        """
+        self._buffer.extend(self._running.values())
+        self._running.clear()
+        self.flush()
         if self.db:
             self.db.close()
 
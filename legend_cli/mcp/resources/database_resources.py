@@ -27,7 +27,7 @@ def get_database_resources() -> List[Resource]:
 
     # Add resources for introspected schemas
     for key, schema in ctx.introspected_schemas.items():
-        table_count = sum(len(s.tables) for s in schema.schemas)
+        table_count = schema.table_count
         resources.append(Resource(
             uri=f"legend://schema/{key}",
             name=f"Schema: {schema.name}",
@@ -97,8 +97,8 @@ def read_schema_resource(key: str) -> str:
         ],
         "relationships": [
             {
-                "source": f"{r.source_table}.{r.source_column}",
-                "target": f"{r.target_table}.{r.target_column}",
+                "source": r.source_key,
+                "target": r.target_key,
                 "type": r.relationship_type,
                 "property_name": r.property_name
             }
@@ -106,7 +106,7 @@ def read_schema_resource(key: str) -> str:
         ],
         "summary": {
             "schema_count": len(schema.schemas),
-            "table_count": sum(len(s.tables) for s in schema.schemas),
+            "table_count": schema.table_count,
             "relationship_count": len(schema.relationships)
         }
     }, indent=2)
@@ -8,7 +8,7 @@ from typing import List
 
 from mcp.types import Resource
 
-from ..context import get_context
+from ..context import code_summary, get_context
 
 
 def get_model_resources() -> List[Resource]:
@@ -58,8 +58,7 @@ def read_pending_artifacts() -> str:
                 "index": i,
                 "type": a.artifact_type,
                 "path": a.path,
-                "lines": len(a.pure_code.split("\n")),
-                "preview": a.pure_code[:300] + "..." if len(a.pure_code) > 300 else a.pure_code
+                **code_summary(a.pure_code, 300),
             }
             for i, a in enumerate(ctx.pending_artifacts)
         ]
@@ -0,0 +1,82 @@
+"""Compact JSON encoding for MCP tool responses."""
+
+import dataclasses
+import enum
+import io
+import json
+from datetime import date, datetime, time
+from typing import Any, Iterable, Iterator, Mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode, for the json module, the types orjson handles natively.
+
+    Mirrors orjson: datetimes, dates and times in ISO format, dataclasses
+    as objects of their public fields, enums by value. Anything else is
+    written as str(obj), as both encoders do via default=str.
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            f.name: getattr(obj, f.name)
+            for f in dataclasses.fields(obj)
+            if not f.name.startswith("_")
+        }
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    return str(obj)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize a tool response, with orjson when installed.
+
+    Responses for large schemas carry many small dicts and long code
+    previews, where orjson is several times faster than the json module.
+    Without it, the json module produces the same output. Values neither
+    encoder supports are written as str(value).
+
+    Args:
+        obj: The response to serialize
+        pretty: Indent by two spaces instead of writing compactly
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+    if pretty:
+        return json.dumps(obj, default=_json_default, indent=2, ensure_ascii=False)
+    return json.dumps(obj, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
+
+def write_json_array(buf: io.StringIO, items: Iterable[Any]) -> None:
+    """Serialize items to buf as a JSON array, one element at a time."""
+    buf.write("[")
+    for i, item in enumerate(items):
+        if i:
+            buf.write(",")
+        buf.write(dumps(item))
+    buf.write("]")
+
+
+def write_json_object(buf: io.StringIO, fields: Mapping[str, Any]) -> None:
+    """Serialize fields to buf as a JSON object.
+
+    Iterator values (such as generator expressions) are written with
+    write_json_array, so large lists are never built in full.
+    """
+    buf.write("{")
+    for i, (key, value) in enumerate(fields.items()):
+        if i:
+            buf.write(",")
+        buf.write(dumps(key))
+        buf.write(":")
+        if isinstance(value, Iterator):
+            write_json_array(buf, value)
+        else:
+            buf.write(dumps(value))
+    buf.write("}")
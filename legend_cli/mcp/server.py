@@ -4,20 +4,26 @@ This module implements a Model Context Protocol (MCP) server that enables
 Claude Desktop to interact with Legend for model generation and modification.
 """
 
+import json
 import logging
 import time
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Optional, Union
 
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
+    CallToolResult,
     Tool,
     TextContent,
     Resource,
     ResourceTemplate,
 )
 
-from .context import get_context, reset_context
+from .context import MCPContext, get_context, reset_context
+from .errors import MCPError
 from .tools import database, model_generation, sdlc, preview, model_modification
 from .tools import logging as logging_tools
 from .logging import MCPLogService
@@ -33,6 +39,10 @@ server = Server("legend-cli")
 # Global log service instance
 _log_service: Optional[MCPLogService] = None
 
+# Session context bound at server startup; handlers fall back to
+# get_context() when invoked outside run_server (e.g. in tests)
+_session_context: Optional[MCPContext] = None
+
 
 def get_log_service() -> Optional[MCPLogService]:
     """Get the global log service instance."""
@@ -57,36 +67,111 @@ def initialize_log_service() -> MCPLogService:
 # Tool Registration
 # =============================================================================
 
+# Every tool definition is static, so the combined list is assembled
+# once here instead of on each list_tools request. Each tools module
+# likewise builds its Tool objects once, in a module-level _TOOLS tuple;
+# its get_tools() returns a fresh list, so extending the result cannot
+# alter the shared tuple.
+_ALL_TOOLS: tuple[Tool, ...] = (
+    *database.get_tools(),
+    *model_generation.get_tools(),
+    *sdlc.get_tools(),
+    *preview.get_tools(),
+    *model_modification.get_tools(),
+    *logging_tools.get_tools(),
+)
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available MCP tools."""
-    tools = []
+    return list(_ALL_TOOLS)
+
+
+def _compile_validator(schema: dict[str, Any]) -> Any:
+    """Check a tool's inputSchema and build a reusable validator for it."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Argument validators keyed by tool name, built once. The SDK's built-in
+# validation calls jsonschema.validate(), which checks the schema itself
+# against the metaschema on every request (milliseconds per call), so it
+# is turned off in favour of these.
+_VALIDATORS = MappingProxyType({
+    tool.name: _compile_validator(tool.inputSchema) for tool in _ALL_TOOLS
+})
+
 
+def validate_arguments(name: str, arguments: dict[str, Any]) -> Optional[str]:
+    """Check tool arguments against the tool's inputSchema.
+
+    Returns:
+        The most relevant error message, or None if the arguments are
+        valid or the tool is unknown
+    """
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        return None
+    error = best_match(validator.iter_errors(arguments))
+    return error.message if error is not None else None
+
+
+# Tool handlers keyed by tool name. Each handler is called as
+# handler(ctx, **arguments) and returns a JSON string. Read-only once built.
+TOOL_HANDLERS = MappingProxyType({
     # Database tools
-    tools.extend(database.get_tools())
+    "connect_database": database.connect_database,
+    "list_databases": database.list_databases,
+    "list_schemas": database.list_schemas,
+    "list_tables": database.list_tables,
+    "describe_table": database.describe_table,
+    "introspect_database": database.introspect_database,
 
     # Model generation tools
-    tools.extend(model_generation.get_tools())
+    "generate_model": model_generation.generate_model,
+    "generate_store": model_generation.generate_store,
+    "generate_classes": model_generation.generate_classes,
+    "generate_connection": model_generation.generate_connection,
+    "generate_mapping": model_generation.generate_mapping,
+    "generate_runtime": model_generation.generate_runtime,
+    "generate_associations": model_generation.generate_associations,
+    "analyze_schema": model_generation.analyze_schema,
 
     # SDLC tools
-    tools.extend(sdlc.get_tools())
+    "list_projects": sdlc.list_projects,
+    "create_project": sdlc.create_project,
+    "list_workspaces": sdlc.list_workspaces,
+    "create_workspace": sdlc.create_workspace,
+    "get_workspace_entities": sdlc.get_workspace_entities,
+    "push_artifacts": sdlc.push_artifacts,
 
     # Preview tools
-    tools.extend(preview.get_tools())
+    "preview_changes": preview.preview_changes,
+    "validate_pure_code": preview.validate_pure_code,
+    "validate_model_completeness": preview.validate_model_completeness,
 
     # Model modification tools
-    tools.extend(model_modification.get_tools())
+    "read_entity": model_modification.read_entity,
+    "read_entities": model_modification.read_entities,
+    "add_property": model_modification.add_property,
+    "remove_property": model_modification.remove_property,
+    "create_class": model_modification.create_class,
+    "create_association": model_modification.create_association,
+    "create_function": model_modification.create_function,
+    "delete_entity": model_modification.delete_entity,
+    "update_entity": model_modification.update_entity,
 
     # Logging tools
-    tools.extend(logging_tools.get_tools())
+    "query_mcp_logs": logging_tools.query_mcp_logs,
+    "get_mcp_log_stats": logging_tools.get_mcp_log_stats,
+})
 
-    return tools
 
-
-@server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
-    ctx = get_context()
+    ctx = _session_context if _session_context is not None else get_context()
     log_service = get_log_service()
 
     # Start logging
@@ -104,88 +189,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         )
 
     try:
-        # Database tools
-        if name == "connect_database":
-            result = await database.connect_database(ctx, **arguments)
-        elif name == "list_databases":
-            result = await database.list_databases(ctx, **arguments)
-        elif name == "list_schemas":
-            result = await database.list_schemas(ctx, **arguments)
-        elif name == "list_tables":
-            result = await database.list_tables(ctx, **arguments)
-        elif name == "describe_table":
-            result = await database.describe_table(ctx, **arguments)
-        elif name == "introspect_database":
-            result = await database.introspect_database(ctx, **arguments)
-
-        # Model generation tools
-        elif name == "generate_model":
-            result = await model_generation.generate_model(ctx, **arguments)
-        elif name == "generate_store":
-            result = await model_generation.generate_store(ctx, **arguments)
-        elif name == "generate_classes":
-            result = await model_generation.generate_classes(ctx, **arguments)
-        elif name == "generate_connection":
-            result = await model_generation.generate_connection(ctx, **arguments)
-        elif name == "generate_mapping":
-            result = await model_generation.generate_mapping(ctx, **arguments)
-        elif name == "generate_runtime":
-            result = await model_generation.generate_runtime(ctx, **arguments)
-        elif name == "generate_associations":
-            result = await model_generation.generate_associations(ctx, **arguments)
-        elif name == "analyze_schema":
-            result = await model_generation.analyze_schema(ctx, **arguments)
-
-        # SDLC tools
-        elif name == "list_projects":
-            result = await sdlc.list_projects(ctx, **arguments)
-        elif name == "create_project":
-            result = await sdlc.create_project(ctx, **arguments)
-        elif name == "list_workspaces":
-            result = await sdlc.list_workspaces(ctx, **arguments)
-        elif name == "create_workspace":
-            result = await sdlc.create_workspace(ctx, **arguments)
-        elif name == "get_workspace_entities":
-            result = await sdlc.get_workspace_entities(ctx, **arguments)
-        elif name == "push_artifacts":
-            result = await sdlc.push_artifacts(ctx, **arguments)
-
-        # Preview tools
-        elif name == "preview_changes":
-            result = await preview.preview_changes(ctx, **arguments)
-        elif name == "validate_pure_code":
-            result = await preview.validate_pure_code(ctx, **arguments)
-        elif name == "validate_model_completeness":
-            result = await preview.validate_model_completeness(ctx, **arguments)
-
-        # Model modification tools
-        elif name == "read_entity":
-            result = await model_modification.read_entity(ctx, **arguments)
-        elif name == "read_entities":
-            result = await model_modification.read_entities(ctx, **arguments)
-        elif name == "add_property":
-            result = await model_modification.add_property(ctx, **arguments)
-        elif name == "remove_property":
-            result = await model_modification.remove_property(ctx, **arguments)
-        elif name == "create_class":
-            result = await model_modification.create_class(ctx, **arguments)
-        elif name == "create_association":
-            result = await model_modification.create_association(ctx, **arguments)
-        elif name == "create_function":
-            result = await model_modification.create_function(ctx, **arguments)
-        elif name == "delete_entity":
-            result = await model_modification.delete_entity(ctx, **arguments)
-        elif name == "update_entity":
-            result = await model_modification.update_entity(ctx, **arguments)
-
-        # Logging tools
-        elif name == "query_mcp_logs":
-            result = await logging_tools.query_mcp_logs(ctx, **arguments)
-        elif name == "get_mcp_log_stats":
-            result = await logging_tools.get_mcp_log_stats(ctx, **arguments)
-
-        else:
+        handler = TOOL_HANDLERS.get(name)
+        if handler is None:
             result = f"Unknown tool: {name}"
+        else:
+            result = await handler(ctx, **arguments)
 
         # Log successful completion
         if log_service and log_service.enabled and log_id >= 0:
@@ -196,7 +204,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 duration_ms=duration_ms,
             )
 
-        return [TextContent(type="text", text=str(result))]
+        return [TextContent(type="text", text=result)]
 
     except Exception as e:
         # Log error
@@ -208,10 +216,33 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 duration_ms=duration_ms,
             )
 
-        logger.exception(f"Error in tool {name}")
+        # Expected tool failures carry a descriptive message; only log a
+        # traceback for unexpected errors
+        if isinstance(e, MCPError):
+            logger.warning("Tool %s failed: %s", name, e)
+        else:
+            logger.exception("Error in tool %s", name)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+@server.call_tool(validate_input=False)
+async def _call_validated_tool(
+    name: str, arguments: dict[str, Any]
+) -> Union[CallToolResult, list[TextContent]]:
+    """Reject arguments that do not match the tool's schema, then call it.
+
+    Invalid calls get the same error result the SDK's own validation
+    returns, and are not logged as tool calls.
+    """
+    message = validate_arguments(name, arguments)
+    if message is not None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Input validation error: {message}")],
+            isError=True,
+        )
+    return await call_tool(name, arguments)
+
+
 # =============================================================================
 # Resource Registration
 # =============================================================================
@@ -219,7 +250,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 @server.list_resources()
 async def list_resources() -> list[Resource]:
     """List available resources."""
-    ctx = get_context()
+    ctx = _session_context if _session_context is not None else get_context()
     resources = []
 
     # Add resources for connected databases
@@ -236,7 +267,7 @@ async def list_resources() -> list[Resource]:
         resources.append(Resource(
             uri=f"legend://schema/{key}",
             name=f"Schema: {schema.name}",
-            description=f"Introspected schema with {len(schema.get_all_tables())} tables",
+            description=f"Introspected schema with {schema.table_count} tables",
             mimeType="application/json"
         ))
 
@@ -274,70 +305,92 @@ async def list_resource_templates() -> list[ResourceTemplate]:
     ]
 
 
-@server.read_resource()
-async def read_resource(uri: str) -> str:
-    """Read a resource by URI."""
-    import json
-    ctx = get_context()
-
-    if uri.startswith("legend://database/"):
-        key = uri.replace("legend://database/", "")
-        conn = ctx.connections.get(key)
-        if conn:
-            return json.dumps({
-                "db_type": conn.db_type.value,
-                "database": conn.database_name,
-                "connected": conn.is_connected,
-                "params": conn.connection_params
-            }, indent=2)
-        return json.dumps({"error": "Database not found"})
-
-    elif uri.startswith("legend://schema/"):
-        key = uri.replace("legend://schema/", "")
-        schema = ctx.introspected_schemas.get(key)
-        if schema:
-            return json.dumps({
-                "name": schema.name,
-                "schemas": [
-                    {
-                        "name": s.name,
-                        "tables": [
-                            {
-                                "name": t.name,
-                                "columns": [
-                                    {"name": c.name, "type": c.data_type, "nullable": c.is_nullable}
-                                    for c in t.columns
-                                ],
-                                "primary_keys": t.primary_key_columns
-                            }
-                            for t in s.tables
-                        ]
-                    }
-                    for s in schema.schemas
-                ],
-                "relationships": [
-                    {
-                        "source": f"{r.source_table}.{r.source_column}",
-                        "target": f"{r.target_table}.{r.target_column}",
-                        "type": r.relationship_type
-                    }
-                    for r in schema.relationships
-                ]
-            }, indent=2)
-        return json.dumps({"error": "Schema not found"})
-
-    elif uri == "legend://pending-artifacts":
+def _read_database_resource(ctx, key: str) -> str:
+    """Read a connected database resource."""
+    conn = ctx.connections.get(key)
+    if conn:
+        return json.dumps({
+            "db_type": conn.db_type.value,
+            "database": conn.database_name,
+            "connected": conn.is_connected,
+            "params": conn.connection_params
+        }, indent=2)
+    return json.dumps({"error": "Database not found"})
+
+
+def _read_schema_resource(ctx, key: str) -> str:
+    """Read an introspected schema resource."""
+    schema = ctx.introspected_schemas.get(key)
+    if schema:
         return json.dumps({
-            "count": len(ctx.pending_artifacts),
-            "artifacts": [
+            "name": schema.name,
+            "schemas": [
                 {
-                    "type": a.artifact_type,
-                    "path": a.path,
-                    "preview": a.pure_code[:200] + "..." if len(a.pure_code) > 200 else a.pure_code
+                    "name": s.name,
+                    "tables": [
+                        {
+                            "name": t.name,
+                            "columns": [
+                                {"name": c.name, "type": c.data_type, "nullable": c.is_nullable}
+                                for c in t.columns
+                            ],
+                            "primary_keys": t.primary_key_columns
+                        }
+                        for t in s.tables
+                    ]
                 }
-                for a in ctx.pending_artifacts
+                for s in schema.schemas
+            ],
+            "relationships": [
+                {
+                    "source": r.source_key,
+                    "target": r.target_key,
+                    "type": r.relationship_type
+                }
+                for r in schema.relationships
             ]
         }, indent=2)
+    return json.dumps({"error": "Schema not found"})
+
+
+def _read_pending_artifacts_resource(ctx, key: str) -> Optional[str]:
+    """Read the pending artifacts resource (takes no key)."""
+    if key:
+        return None
+    return json.dumps({
+        "count": len(ctx.pending_artifacts),
+        "artifacts": [
+            {
+                "type": a.artifact_type,
+                "path": a.path,
+                "preview": a.preview
+            }
+            for a in ctx.pending_artifacts
+        ]
+    }, indent=2)
+
+
+# Resource readers keyed by the first path segment after the URI scheme
+_RESOURCE_URI_PREFIX = "legend://"
+_RESOURCE_HANDLERS = MappingProxyType({
+    "database": _read_database_resource,
+    "schema": _read_schema_resource,
+    "pending-artifacts": _read_pending_artifacts_resource,
+})
+
+
+@server.read_resource()
+async def read_resource(uri: str) -> str:
+    """Read a resource by URI."""
+    ctx = _session_context if _session_context is not None else get_context()
+
+    if uri.startswith(_RESOURCE_URI_PREFIX):
+        kind, _, key = uri[len(_RESOURCE_URI_PREFIX):].partition("/")
+        handler = _RESOURCE_HANDLERS.get(kind)
+        if handler:
+            content = handler(ctx, key)
+            if content is not None:
+                return content
 
     return json.dumps({"error": f"Unknown resource: {uri}"})
 
@@ -348,10 +401,12 @@ async def read_resource(uri: str) -> str:
 
 async def run_server():
     """Run the MCP server."""
+    global _session_context
     logger.info("Starting Legend CLI MCP server...")
 
-    # Reset context for fresh session
+    # Reset context for fresh session and bind it for the handlers
     reset_context()
+    _session_context = get_context()
 
     # Initialize logging service
     log_service = initialize_log_service()
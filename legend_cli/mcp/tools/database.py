@@ -4,183 +4,190 @@ Provides tools for connecting to databases, introspecting schemas,
 and listing database objects.
 """
 
-import json
-from typing import Any, List, Optional
+import asyncio
+import functools
+import io
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.types import Tool
 
-from ..context import MCPContext, DatabaseType
+from ..context import MCPContext, DatabaseType, DatabaseConnection, parse_db_type
 from ..errors import ConnectionError, DatabaseError, IntrospectionError
-
-
-def get_tools() -> List[Tool]:
-    """Return all database-related tools."""
-    return [
-        Tool(
-            name="connect_database",
-            description="Connect to a Snowflake or DuckDB database. For Snowflake, requires account, user credentials via environment variables. For DuckDB, requires the path to the .duckdb file. If DuckDB is served via Postgres wire protocol (e.g., buenavista), use postgres_port to connect via psycopg2 instead of direct file access.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database to connect to"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "For Snowflake: database name. For DuckDB: path to .duckdb file"
-                    },
-                    "warehouse": {
-                        "type": "string",
-                        "description": "Snowflake warehouse name (Snowflake only)"
-                    },
-                    "role": {
-                        "type": "string",
-                        "description": "Snowflake role (Snowflake only, default: from env)"
-                    },
-                    "postgres_host": {
-                        "type": "string",
-                        "description": "Host for Postgres wire protocol connection (DuckDB only, default: localhost)"
-                    },
-                    "postgres_port": {
-                        "type": "integer",
-                        "description": "Port for Postgres wire protocol connection (DuckDB only, e.g., 5433 for buenavista). When set, connects via psycopg2 instead of direct file access."
-                    }
+from ..serialization import dumps, write_json_object
+from legend_cli.config import settings
+from legend_cli.database.models import Database
+from legend_cli.database.schema_cache import SchemaCache, listing_fingerprint
+
+
+_DB_TYPE_SCHEMA = {
+    "type": "string",
+    "enum": ["snowflake", "duckdb"],
+    "description": "Type of database"
+}
+_DATABASE_SCHEMA = {
+    "type": "string",
+    "description": "Database identifier"
+}
+_SCHEMA_NAME_SCHEMA = {
+    "type": "string",
+    "description": "Schema name"
+}
+_POSTGRES_HOST_SCHEMA = {
+    "type": "string",
+    "description": "Host for Postgres wire protocol connection (DuckDB only, default: localhost)"
+}
+
+# Tool definitions are static; build them once at import time rather than per list_tools call
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="connect_database",
+        description="Connect to a Snowflake or DuckDB database. For Snowflake, requires account, user credentials via environment variables. For DuckDB, requires the path to the .duckdb file. If DuckDB is served via Postgres wire protocol (e.g., buenavista), use postgres_port to connect via psycopg2 instead of direct file access.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": {
+                    "type": "string",
+                    "enum": ["snowflake", "duckdb"],
+                    "description": "Type of database to connect to"
                 },
-                "required": ["db_type", "database"]
-            }
-        ),
-        Tool(
-            name="list_databases",
-            description="List available databases. For DuckDB, this lists the attached databases. For Snowflake, this requires an existing connection.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier (path for DuckDB, name for Snowflake)"
-                    }
+                "database": {
+                    "type": "string",
+                    "description": "For Snowflake: database name. For DuckDB: path to .duckdb file"
                 },
-                "required": ["db_type", "database"]
-            }
-        ),
-        Tool(
-            name="list_schemas",
-            description="List all schemas in a database.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    }
+                "warehouse": {
+                    "type": "string",
+                    "description": "Snowflake warehouse name (Snowflake only)"
                 },
-                "required": ["db_type", "database"]
-            }
-        ),
-        Tool(
-            name="list_tables",
-            description="List all tables in a database schema.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "schema": {
-                        "type": "string",
-                        "description": "Schema name"
-                    },
-                    "include_views": {
-                        "type": "boolean",
-                        "description": "Whether to include views (default: true)",
-                        "default": True
-                    }
+                "role": {
+                    "type": "string",
+                    "description": "Snowflake role (Snowflake only, default: from env)"
                 },
-                "required": ["db_type", "database", "schema"]
-            }
-        ),
-        Tool(
-            name="describe_table",
-            description="Get detailed information about a table including columns, types, and constraints.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "schema": {
-                        "type": "string",
-                        "description": "Schema name"
-                    },
-                    "table": {
-                        "type": "string",
-                        "description": "Table name"
-                    }
+                "postgres_host": _POSTGRES_HOST_SCHEMA,
+                "postgres_port": {
+                    "type": "integer",
+                    "description": "Port for Postgres wire protocol connection (DuckDB only, e.g., 5433 for buenavista). When set, connects via psycopg2 instead of direct file access."
+                }
+            },
+            "required": ["db_type", "database"]
+        }
+    ),
+    Tool(
+        name="list_databases",
+        description="List available databases. For DuckDB, this lists the attached databases. For Snowflake, this requires an existing connection.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": {
+                    "type": "string",
+                    "description": "Database identifier (path for DuckDB, name for Snowflake)"
+                }
+            },
+            "required": ["db_type", "database"]
+        }
+    ),
+    Tool(
+        name="list_schemas",
+        description="List all schemas in a database.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA
+            },
+            "required": ["db_type", "database"]
+        }
+    ),
+    Tool(
+        name="list_tables",
+        description="List all tables in a database schema.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "schema": _SCHEMA_NAME_SCHEMA,
+                "include_views": {
+                    "type": "boolean",
+                    "description": "Whether to include views (default: true)",
+                    "default": True
+                }
+            },
+            "required": ["db_type", "database", "schema"]
+        }
+    ),
+    Tool(
+        name="describe_table",
+        description="Get detailed information about a table including columns, types, and constraints.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "schema": _SCHEMA_NAME_SCHEMA,
+                "table": {
+                    "type": "string",
+                    "description": "Table name"
+                }
+            },
+            "required": ["db_type", "database", "schema", "table"]
+        }
+    ),
+    Tool(
+        name="introspect_database",
+        description="Perform full database introspection including all schemas, tables, columns, and relationship detection. This creates a complete schema model ready for Pure code generation. For DuckDB served via Postgres wire protocol (e.g., buenavista), use postgres_port to connect via psycopg2.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "schema_filter": {
+                    "type": "string",
+                    "description": "Optional: filter to specific schema"
                 },
-                "required": ["db_type", "database", "schema", "table"]
-            }
-        ),
-        Tool(
-            name="introspect_database",
-            description="Perform full database introspection including all schemas, tables, columns, and relationship detection. This creates a complete schema model ready for Pure code generation. For DuckDB served via Postgres wire protocol (e.g., buenavista), use postgres_port to connect via psycopg2.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "schema_filter": {
-                        "type": "string",
-                        "description": "Optional: filter to specific schema"
-                    },
-                    "detect_relationships": {
-                        "type": "boolean",
-                        "description": "Whether to detect foreign key relationships (default: true)",
-                        "default": True
-                    },
-                    "postgres_host": {
-                        "type": "string",
-                        "description": "Host for Postgres wire protocol connection (DuckDB only, default: localhost)"
-                    },
-                    "postgres_port": {
-                        "type": "integer",
-                        "description": "Port for Postgres wire protocol connection (DuckDB only, e.g., 5433 for buenavista)"
-                    }
+                "detect_relationships": {
+                    "type": "boolean",
+                    "description": "Whether to detect foreign key relationships (default: true)",
+                    "default": True
                 },
-                "required": ["db_type", "database"]
-            }
-        ),
-    ]
+                "postgres_host": _POSTGRES_HOST_SCHEMA,
+                "postgres_port": {
+                    "type": "integer",
+                    "description": "Port for Postgres wire protocol connection (DuckDB only, e.g., 5433 for buenavista)"
+                }
+            },
+            "required": ["db_type", "database"]
+        }
+    ),
+)
+
+
+def get_tools() -> List[Tool]:
+    """Return all database-related tools."""
+    return list(_TOOLS)
+
+
+# Introspector classes resolved on first use, keyed by database type
+_INTROSPECTOR_CLASSES: Dict[DatabaseType, type] = {}
+
+
+def _get_introspector_class(db_type_enum: DatabaseType) -> type:
+    """Resolve the introspector class for a database type.
+
+    Drivers are imported lazily so that optional dependencies are only
+    required for the database types actually used; the resolved class is
+    cached so later calls skip the import machinery.
+    """
+    cls = _INTROSPECTOR_CLASSES.get(db_type_enum)
+    if cls is None:
+        if db_type_enum == DatabaseType.SNOWFLAKE:
+            from legend_cli.database.snowflake import SnowflakeIntrospector as cls
+        elif db_type_enum == DatabaseType.DUCKDB:
+            from legend_cli.database.duckdb import DuckDBIntrospector as cls
+        else:
+            raise ValueError(f"Unsupported database type: {db_type_enum.value}")
+        _INTROSPECTOR_CLASSES[db_type_enum] = cls
+    return cls
 
 
 def _get_introspector(db_type: str, database: str, **kwargs):
@@ -195,25 +202,121 @@ def _get_introspector(db_type: str, database: str, **kwargs):
             - postgres_host: Host for Postgres wire protocol (DuckDB only)
             - postgres_port: Port for Postgres wire protocol (DuckDB only)
     """
-    db_type_enum = DatabaseType(db_type.lower())
+    db_type_enum = parse_db_type(db_type)
+    introspector_cls = _get_introspector_class(db_type_enum)
 
     if db_type_enum == DatabaseType.SNOWFLAKE:
-        from legend_cli.database.snowflake import SnowflakeIntrospector
-        return SnowflakeIntrospector(
+        return introspector_cls(
             warehouse=kwargs.get("warehouse"),
             role=kwargs.get("role")
         )
-    elif db_type_enum == DatabaseType.DUCKDB:
-        from legend_cli.database.duckdb import DuckDBIntrospector
-        postgres_port = kwargs.get("postgres_port")
-        postgres_host = kwargs.get("postgres_host")
-        return DuckDBIntrospector(
-            database_path=database,
-            postgres_host=postgres_host if postgres_port else None,
-            postgres_port=postgres_port,
-        )
-    else:
-        raise ValueError(f"Unsupported database type: {db_type}")
+
+    postgres_port = kwargs.get("postgres_port")
+    postgres_host = kwargs.get("postgres_host")
+    return introspector_cls(
+        database_path=database,
+        postgres_host=postgres_host if postgres_port else None,
+        postgres_port=postgres_port,
+    )
+
+
+def _connect_introspector(db_type: str, database: str, **kwargs):
+    """Create an introspector and connect it to the database."""
+    introspector = _get_introspector(db_type, database, **kwargs)
+    introspector.connect(database)
+    return introspector
+
+
+async def _ensure_connection(
+    ctx: MCPContext,
+    db_type_enum: DatabaseType,
+    database: str,
+    **kwargs,
+) -> DatabaseConnection:
+    """Get an existing connection or create, connect and register a new one.
+
+    Args:
+        ctx: MCP session context
+        db_type_enum: Database type
+        database: Database identifier
+        **kwargs: Connection parameters passed to _get_introspector and
+            recorded on the connection when one is created
+
+    Returns:
+        The active DatabaseConnection
+    """
+    conn = ctx.get_connection(db_type_enum, database)
+    if conn:
+        return conn
+
+    factory = functools.partial(_connect_introspector, db_type_enum.value, database, **kwargs)
+    introspector = await asyncio.to_thread(factory)
+    return ctx.add_connection(
+        db_type_enum, database, introspector,
+        connection_params=kwargs,
+        introspector_factory=factory,
+    )
+
+
+async def _run_pooled(conn: DatabaseConnection, method: str, *args) -> Any:
+    """Call an introspector method in a worker thread on a pooled introspector."""
+    async with conn.acquire() as introspector:
+        return await asyncio.to_thread(getattr(introspector, method), *args)
+
+
+def _get_schema_cache() -> Optional[SchemaCache]:
+    """Return the on-disk schema cache, or None when it is disabled."""
+    if not settings.schema_cache_enabled:
+        return None
+    return SchemaCache(settings.schema_cache_dir)
+
+
+def _schema_cache_key(
+    db_type_enum: DatabaseType,
+    database: str,
+    schema_filter: Optional[str],
+    detect_relationships: bool,
+) -> Tuple:
+    """Key a cached schema by database and the options that shaped it."""
+    return (db_type_enum.value, database, schema_filter, detect_relationships)
+
+
+async def load_cached_schema(
+    ctx: MCPContext,
+    db_type: str,
+    database: str,
+    schema_filter: Optional[str] = None,
+    detect_relationships: bool = True,
+    postgres_host: Optional[str] = None,
+    postgres_port: Optional[int] = None,
+) -> Optional[Database]:
+    """Restore a schema introspected in an earlier session, if still current.
+
+    Lists the database's columns and primary keys with a couple of bulk
+    queries (connecting if needed) and, when the listing matches the
+    cached entry, stores the cached schema in the context. This skips
+    the per-table column and key queries.
+
+    Returns:
+        The restored schema, or None if there is no current cache entry
+    """
+    schema_cache = _get_schema_cache()
+    if schema_cache is None:
+        return None
+
+    db_type_enum = parse_db_type(db_type)
+    conn = await _ensure_connection(
+        ctx, db_type_enum, database,
+        postgres_host=postgres_host,
+        postgres_port=postgres_port,
+    )
+    listing = await _run_pooled(conn, "get_column_listing", database, schema_filter)
+
+    key = _schema_cache_key(db_type_enum, database, schema_filter, detect_relationships)
+    schema = schema_cache.load(key, listing_fingerprint(listing))
+    if schema is not None:
+        ctx.store_schema(db_type_enum, database, schema)
+    return schema
 
 
 async def connect_database(
@@ -227,45 +330,43 @@ async def connect_database(
 ) -> str:
     """Connect to a database."""
     try:
-        db_type_enum = DatabaseType(db_type.lower())
+        db_type_enum = parse_db_type(db_type)
 
         # Check if already connected
         existing = ctx.get_connection(db_type_enum, database)
         if existing and existing.is_connected:
-            return json.dumps({
+            return dumps({
                 "status": "already_connected",
                 "db_type": db_type,
                 "database": database,
                 "message": "Database connection already exists"
             })
 
-        # Create introspector
-        introspector = _get_introspector(
-            db_type, database,
-            warehouse=warehouse,
-            role=role,
-            postgres_host=postgres_host,
-            postgres_port=postgres_port,
+        connection_params = {
+            "warehouse": warehouse,
+            "role": role,
+            "postgres_host": postgres_host,
+            "postgres_port": postgres_port,
+        }
+
+        # Create introspector and test connection (off the event loop;
+        # drivers block on the network)
+        factory = functools.partial(
+            _connect_introspector, db_type, database, **connection_params
         )
-
-        # Test connection
-        introspector.connect(database)
+        introspector = await asyncio.to_thread(factory)
 
         # Store connection in context
         ctx.add_connection(
             db_type=db_type_enum,
             database=database,
             introspector=introspector,
-            connection_params={
-                "warehouse": warehouse,
-                "role": role,
-                "postgres_host": postgres_host,
-                "postgres_port": postgres_port,
-            }
+            connection_params=connection_params,
+            introspector_factory=factory,
         )
 
         connection_method = "Postgres wire protocol" if postgres_port else "direct"
-        return json.dumps({
+        return dumps({
             "status": "connected",
             "db_type": db_type,
             "database": database,
@@ -275,70 +376,58 @@ async def connect_database(
 
     except ImportError as e:
         raise ConnectionError(
-            f"Missing database driver: {str(e)}",
+            f"Missing database driver: {e}",
             details={"db_type": db_type, "database": database}
-        )
+        ) from e
     except Exception as e:
         raise ConnectionError(
-            f"Failed to connect to {db_type} database: {str(e)}",
+            f"Failed to connect to {db_type} database: {e}",
             details={"db_type": db_type, "database": database}
-        )
+        ) from e
 
 
 async def list_databases(ctx: MCPContext, db_type: str, database: str) -> str:
     """List available databases."""
     try:
-        db_type_enum = DatabaseType(db_type.lower())
+        db_type_enum = parse_db_type(db_type)
 
-        # Get or create connection
-        conn = ctx.get_connection(db_type_enum, database)
-        if not conn:
-            introspector = _get_introspector(db_type, database)
-            introspector.connect(database)
-            ctx.add_connection(db_type_enum, database, introspector)
-            conn = ctx.get_connection(db_type_enum, database)
+        conn = await _ensure_connection(ctx, db_type_enum, database)
 
         # For DuckDB, we can only access the connected database
         if db_type_enum == DatabaseType.DUCKDB:
-            return json.dumps({
+            return dumps({
                 "databases": [conn.introspector.get_database_name()],
                 "message": "DuckDB shows the current connected database"
             })
 
         # For Snowflake, we could potentially list databases
         # but this requires SHOW DATABASES permission
-        return json.dumps({
+        return dumps({
             "databases": [database],
             "message": "Currently connected database"
         })
 
     except Exception as e:
-        raise DatabaseError(f"Failed to list databases: {str(e)}")
+        raise DatabaseError(f"Failed to list databases: {e}") from e
 
 
 async def list_schemas(ctx: MCPContext, db_type: str, database: str) -> str:
     """List schemas in a database."""
     try:
-        db_type_enum = DatabaseType(db_type.lower())
+        db_type_enum = parse_db_type(db_type)
 
-        # Get or create connection
-        conn = ctx.get_connection(db_type_enum, database)
-        if not conn:
-            introspector = _get_introspector(db_type, database)
-            introspector.connect(database)
-            ctx.add_connection(db_type_enum, database, introspector)
-            conn = ctx.get_connection(db_type_enum, database)
+        conn = await _ensure_connection(ctx, db_type_enum, database)
 
-        schemas = conn.introspector.get_schemas(database)
+        schemas = await _run_pooled(conn, "get_schemas", database)
 
-        return json.dumps({
+        return dumps({
             "database": database,
             "schemas": schemas,
             "count": len(schemas)
         })
 
     except Exception as e:
-        raise DatabaseError(f"Failed to list schemas: {str(e)}")
+        raise DatabaseError(f"Failed to list schemas: {e}") from e
 
 
 async def list_tables(
@@ -350,19 +439,13 @@ async def list_tables(
 ) -> str:
     """List tables in a schema."""
     try:
-        db_type_enum = DatabaseType(db_type.lower())
+        db_type_enum = parse_db_type(db_type)
 
-        # Get or create connection
-        conn = ctx.get_connection(db_type_enum, database)
-        if not conn:
-            introspector = _get_introspector(db_type, database)
-            introspector.connect(database)
-            ctx.add_connection(db_type_enum, database, introspector)
-            conn = ctx.get_connection(db_type_enum, database)
+        conn = await _ensure_connection(ctx, db_type_enum, database)
 
-        tables = conn.introspector.get_tables(database, schema, include_views)
+        tables = await _run_pooled(conn, "get_tables", database, schema, include_views)
 
-        return json.dumps({
+        return dumps({
             "database": database,
             "schema": schema,
             "tables": tables,
@@ -371,7 +454,7 @@ async def list_tables(
         })
 
     except Exception as e:
-        raise DatabaseError(f"Failed to list tables: {str(e)}")
+        raise DatabaseError(f"Failed to list tables: {e}") from e
 
 
 async def describe_table(
@@ -383,20 +466,21 @@ async def describe_table(
 ) -> str:
     """Describe a table's structure."""
     try:
-        db_type_enum = DatabaseType(db_type.lower())
+        db_type_enum = parse_db_type(db_type)
 
-        # Get or create connection
-        conn = ctx.get_connection(db_type_enum, database)
-        if not conn:
-            introspector = _get_introspector(db_type, database)
-            introspector.connect(database)
-            ctx.add_connection(db_type_enum, database, introspector)
-            conn = ctx.get_connection(db_type_enum, database)
+        conn = await _ensure_connection(ctx, db_type_enum, database)
 
-        columns = conn.introspector.get_columns(database, schema, table)
-        primary_keys = conn.introspector.get_primary_keys(database, schema, table)
+        # Both queries run on one introspector; running them concurrently
+        # would make the pool open a second connection (for Snowflake, a
+        # second login) for a single table
+        async with conn.acquire() as introspector:
+            columns = await asyncio.to_thread(introspector.get_columns, database, schema, table)
+            primary_keys = await asyncio.to_thread(
+                introspector.get_primary_keys, database, schema, table
+            )
+        pk_set = set(primary_keys)
 
-        return json.dumps({
+        return dumps({
             "database": database,
             "schema": schema,
             "table": table,
@@ -405,7 +489,7 @@ async def describe_table(
                     "name": col.name,
                     "data_type": col.data_type,
                     "is_nullable": col.is_nullable,
-                    "is_primary_key": col.name in primary_keys,
+                    "is_primary_key": col.name in pk_set,
                     "pure_type": col.to_pure_property_type()
                 }
                 for col in columns
@@ -415,10 +499,10 @@ async def describe_table(
         })
 
     except Exception as e:
-        raise DatabaseError(f"Failed to describe table: {str(e)}")
+        raise DatabaseError(f"Failed to describe table: {e}") from e
 
 
-async def introspect_database(
+async def introspect_schema(
     ctx: MCPContext,
     db_type: str,
     database: str,
@@ -426,85 +510,113 @@ async def introspect_database(
     detect_relationships: bool = True,
     postgres_host: Optional[str] = None,
     postgres_port: Optional[int] = None,
-) -> str:
-    """Perform full database introspection."""
+) -> Database:
+    """Introspect a database and store the schema in the context and on disk.
+
+    Returns:
+        The introspected schema
+    """
     try:
-        db_type_enum = DatabaseType(db_type.lower())
-
-        # Get or create connection
-        conn = ctx.get_connection(db_type_enum, database)
-        if not conn:
-            introspector = _get_introspector(
-                db_type, database,
-                postgres_host=postgres_host,
-                postgres_port=postgres_port,
-            )
-            introspector.connect(database)
-            ctx.add_connection(
-                db_type_enum, database, introspector,
-                connection_params={
-                    "postgres_host": postgres_host,
-                    "postgres_port": postgres_port,
-                }
-            )
-            conn = ctx.get_connection(db_type_enum, database)
+        db_type_enum = parse_db_type(db_type)
 
-        # Introspect the database
-        db_schema = conn.introspector.introspect_database(
-            database=database,
-            schema_filter=schema_filter,
-            detect_relationships=detect_relationships
+        conn = await _ensure_connection(
+            ctx, db_type_enum, database,
+            postgres_host=postgres_host,
+            postgres_port=postgres_port,
         )
 
-        # Store in context for later use
-        ctx.store_schema(db_type_enum, database, db_schema)
-
-        # Build summary
-        total_tables = sum(len(s.tables) for s in db_schema.schemas)
-        total_columns = sum(
-            len(t.columns)
-            for s in db_schema.schemas
-            for t in s.tables
-        )
+        # Introspect the database. The cache fingerprint is taken first,
+        # so a change made during introspection leaves a stale entry.
+        schema_cache = _get_schema_cache()
+        async with conn.acquire() as introspector:
+            if schema_cache is not None:
+                listing = await asyncio.to_thread(
+                    introspector.get_column_listing, database, schema_filter
+                )
+            db_schema = await introspector.introspect_database_async(
+                database=database,
+                schema_filter=schema_filter,
+                detect_relationships=detect_relationships
+            )
 
-        return json.dumps({
-            "status": "success",
-            "database": database,
-            "schema_filter": schema_filter,
-            "summary": {
-                "schemas": len(db_schema.schemas),
-                "tables": total_tables,
-                "columns": total_columns,
-                "relationships": len(db_schema.relationships)
-            },
-            "schemas": [
-                {
-                    "name": s.name,
-                    "tables": [
-                        {
-                            "name": t.name,
-                            "columns": len(t.columns),
-                            "primary_keys": t.primary_key_columns
-                        }
-                        for t in s.tables
-                    ]
-                }
-                for s in db_schema.schemas
-            ],
-            "relationships": [
-                {
-                    "source": f"{r.source_table}.{r.source_column}",
-                    "target": f"{r.target_table}.{r.target_column}",
-                    "type": r.relationship_type,
-                    "property_name": r.property_name
-                }
-                for r in db_schema.relationships
-            ],
-            "message": f"Successfully introspected {total_tables} tables with {len(db_schema.relationships)} relationships detected"
-        })
+        # Store in context for later use, and on disk for later sessions
+        ctx.store_schema(db_type_enum, database, db_schema)
+        if schema_cache is not None:
+            schema_cache.save(
+                _schema_cache_key(db_type_enum, database, schema_filter, detect_relationships),
+                listing_fingerprint(listing),
+                db_schema,
+            )
+        return db_schema
 
     except Exception as e:
         raise IntrospectionError(
-            f"Failed to introspect database: {str(e)}",
+            f"Failed to introspect database: {e}",
             details={"db_type": db_type, "database": database, "schema_filter": schema_filter}
-        )
+        ) from e
+
+
+async def introspect_database(
+    ctx: MCPContext,
+    db_type: str,
+    database: str,
+    schema_filter: Optional[str] = None,
+    detect_relationships: bool = True,
+    postgres_host: Optional[str] = None,
+    postgres_port: Optional[int] = None,
+) -> str:
+    """Perform full database introspection."""
+    db_schema = await introspect_schema(
+        ctx, db_type, database, schema_filter,
+        detect_relationships=detect_relationships,
+        postgres_host=postgres_host,
+        postgres_port=postgres_port,
+    )
+
+    # Build summary
+    total_tables = db_schema.table_count
+    total_columns = sum(
+        len(t.columns)
+        for s in db_schema.schemas
+        for t in s.tables
+    )
+
+    # Write the response schema-by-schema rather than building the
+    # whole nested structure before serializing it
+    buf = io.StringIO()
+    write_json_object(buf, {
+        "status": "success",
+        "database": database,
+        "schema_filter": schema_filter,
+        "summary": {
+            "schemas": len(db_schema.schemas),
+            "tables": total_tables,
+            "columns": total_columns,
+            "relationships": len(db_schema.relationships)
+        },
+        "schemas": (
+            {
+                "name": s.name,
+                "tables": [
+                    {
+                        "name": t.name,
+                        "columns": len(t.columns),
+                        "primary_keys": t.primary_key_columns
+                    }
+                    for t in s.tables
+                ]
+            }
+            for s in db_schema.schemas
+        ),
+        "relationships": (
+            {
+                "source": r.source_key,
+                "target": r.target_key,
+                "type": r.relationship_type,
+                "property_name": r.property_name
+            }
+            for r in db_schema.relationships
+        ),
+        "message": f"Successfully introspected {total_tables} tables with {len(db_schema.relationships)} relationships detected",
+    })
+    return buf.getvalue()
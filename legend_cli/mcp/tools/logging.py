@@ -3,65 +3,272 @@
 Provides tools for querying MCP tool call logs for debugging and monitoring.
 """
 
-import json
+import asyncio
+import io
 import logging
-from typing import Any, List, Optional
+import time
+from collections import defaultdict, namedtuple
+from datetime import datetime, timedelta
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from mcp.types import Tool
 
 from ..context import MCPContext
+from ..serialization import dumps
 
 logger = logging.getLogger(__name__)
 
+# Columns query_mcp_logs displays; the log store skips the rest (notably
+# the potentially large result and context blobs) and builds these rows
+# directly from its result tuples
+_LogRow = namedtuple(
+    "_LogRow",
+    "id timestamp tool_name status duration_ms error_message error_type parameters_preview",
+)
 
-def get_tools() -> List[Tool]:
-    """Return all logging-related tools."""
-    return [
-        Tool(
-            name="query_mcp_logs",
-            description="Query MCP tool call logs for debugging. Returns recent tool calls with optional filtering by tool name, status, or time range.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tool_name": {
-                        "type": "string",
-                        "description": "Filter by tool name (e.g., 'push_artifacts', 'validate_pure_code')"
-                    },
-                    "status": {
-                        "type": "string",
-                        "enum": ["success", "error"],
-                        "description": "Filter by status"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "default": 20,
-                        "description": "Maximum number of results to return (default 20)"
-                    },
-                    "since_hours": {
-                        "type": "integer",
-                        "default": 24,
-                        "description": "Look back N hours (default 24)"
-                    }
-                },
-                "required": []
+# get_mcp_log_stats responses by since_hours, as (time.monotonic(), response);
+# dashboards poll the stats, and each miss re-aggregates the whole window
+_STATS_TTL = 15.0
+_stats_cache: Dict[int, Tuple[float, str]] = {}
+_stats_locks: DefaultDict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Upper bounds on query_mcp_logs/get_mcp_log_stats arguments, so one call
+# cannot scan the whole log table
+_MAX_LOG_LIMIT = 1000
+_MAX_SINCE_HOURS = 24 * 90
+
+# Responses with more log entries than this skip pretty-printing and are
+# streamed compactly instead
+_PRETTY_LOG_LIMIT = 50
+
+# After _BREAKER_THRESHOLD consecutive failures the logging tools stop
+# calling the log service for _BREAKER_COOLDOWN seconds, so an outage
+# does not cost a traceback and a failed query on every call
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
+_consecutive_failures = 0
+_breaker_open_until = 0.0
+
+
+# server.get_log_service, bound on first use; server imports this module,
+# so importing it at the top would be circular
+_get_log_service: Optional[Callable[[], Any]] = None
+
+
+def _resolve_log_service() -> Any:
+    """Return the server's log service, importing its getter only once."""
+    global _get_log_service
+    if _get_log_service is None:
+        from ..server import get_log_service
+        _get_log_service = get_log_service
+    return _get_log_service()
+
+
+_DISABLED_JSON = dumps({
+    "status": "disabled",
+    "message": "MCP logging is not enabled. Set MCP_LOGGING_ENABLED=true to enable."
+})
+
+
+def _error_json(message: str) -> str:
+    """Build an error response; only the message needs encoding."""
+    return '{"status":"error","message":' + dumps(message) + "}"
+
+
+_UNAVAILABLE_JSON = _error_json(
+    "MCP log service is failing repeatedly; retrying in a few seconds."
+)
+
+
+def _record_success() -> None:
+    """Close the failure breaker after a successful log service call."""
+    global _consecutive_failures
+    _consecutive_failures = 0
+
+
+def _record_failure(action: str, error: Exception) -> None:
+    """Log a failed call and open the breaker once failures pile up.
+
+    Only the first failure in a run is logged with a traceback; call from
+    inside the except block.
+    """
+    global _consecutive_failures, _breaker_open_until
+    _consecutive_failures += 1
+    if _consecutive_failures == 1:
+        logger.exception("Error %s", action)
+    else:
+        logger.warning(
+            "Error %s (%d consecutive failures): %s", action, _consecutive_failures, error
+        )
+    if _consecutive_failures >= _BREAKER_THRESHOLD:
+        _breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+
+
+async def _batched_query(
+    log_service: Any,
+    *,
+    limit: int,
+    since_hours: float,
+    **filters: Any,
+) -> List[Dict[str, Any]]:
+    """Query logs newest-first over geometrically growing time slices.
+
+    Starts with the most recent hour and doubles the window until limit
+    rows are found or since_hours is covered, querying only the slice not
+    already scanned each time. Recent logs usually fill the limit, so a
+    month-long lookback rarely scans more than the last few hours. A
+    failed slice raises rather than widening the window.
+    """
+    now = datetime.utcnow()
+    results: List[Dict[str, Any]] = []
+    covered = 0.0
+    window = min(1.0, since_hours)
+
+    while True:
+        results.extend(await log_service.query_logs(
+            since=now - timedelta(hours=window),
+            until=now - timedelta(hours=covered) if covered else None,
+            limit=limit - len(results),
+            **filters,
+        ))
+        if len(results) >= limit or window >= since_hours:
+            return results
+        covered = window
+        window = min(window * 2, since_hours)
+
+
+def _iter_formatted(logs: List[_LogRow]) -> Iterator[Dict[str, Any]]:
+    """Yield log rows reshaped for display, one at a time."""
+    # Unpacking in the for statement reads every field in one step
+    for (log_id, timestamp, tool_name, status, duration_ms,
+         error_message, error_type, parameters_preview) in logs:
+        formatted_log = {
+            "id": log_id,
+            "timestamp": timestamp,
+            "tool_name": tool_name,
+            "status": status,
+            "duration_ms": duration_ms,
+        }
+
+        if error_message:
+            formatted_log["error"] = {
+                "message": error_message,
+                "type": error_type,
             }
-        ),
-        Tool(
-            name="get_mcp_log_stats",
-            description="Get statistics about MCP tool call usage, including success/error rates and performance metrics.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "since_hours": {
-                        "type": "integer",
-                        "default": 24,
-                        "description": "Look back N hours (default 24)"
-                    }
+
+        # The preview is truncated once, when the call is logged
+        if parameters_preview:
+            formatted_log["parameters"] = parameters_preview
+
+        yield formatted_log
+
+
+def _stream_logs_response(
+    head: Dict[str, Any],
+    entries: Iterable[Dict[str, Any]],
+    message: str,
+) -> str:
+    """Serialize a compact query_mcp_logs response entry by entry.
+
+    Writes the envelope around the log array by hand so that no list of
+    formatted entries is held alongside the output buffer.
+    """
+    buf = io.StringIO()
+    # Bound once; the loop runs for up to _MAX_LOG_LIMIT entries
+    write = buf.write
+
+    write(dumps(head)[:-1])
+    write(',"logs":[')
+    separator = ""
+    for entry in entries:
+        write(separator)
+        write(dumps(entry))
+        separator = ","
+    write('],"message":')
+    write(dumps(message))
+    write("}")
+    return buf.getvalue()
+
+
+def _ndjson_logs_response(head: Dict[str, Any], entries: Iterable[Dict[str, Any]]) -> str:
+    """Serialize a query_mcp_logs response as NDJSON.
+
+    The first line is the summary (status, count, filters, message); each
+    following line is one log entry.
+    """
+    buf = io.StringIO()
+    write = buf.write
+
+    write(dumps(head))
+    for entry in entries:
+        write("\n")
+        write(dumps(entry))
+    return buf.getvalue()
+
+
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="query_mcp_logs",
+        description="Query MCP tool call logs for debugging. Returns recent tool calls with optional filtering by tool name, status, or time range.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tool_name": {
+                    "type": "string",
+                    "description": "Filter by tool name (e.g., 'push_artifacts', 'validate_pure_code')"
                 },
-                "required": []
-            }
-        ),
-    ]
+                "status": {
+                    "type": "string",
+                    "enum": ["success", "error"],
+                    "description": "Filter by status"
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": 20,
+                    "minimum": 1,
+                    "maximum": _MAX_LOG_LIMIT,
+                    "description": f"Maximum number of results to return (default 20, max {_MAX_LOG_LIMIT})"
+                },
+                "since_hours": {
+                    "type": "integer",
+                    "default": 24,
+                    "minimum": 1,
+                    "maximum": _MAX_SINCE_HOURS,
+                    "description": f"Look back N hours (default 24, max {_MAX_SINCE_HOURS})"
+                },
+                "output_format": {
+                    "type": "string",
+                    "enum": ["json", "ndjson"],
+                    "default": "json",
+                    "description": "Response format: a single JSON document, or NDJSON with a summary line followed by one line per log entry (better for bulk export)"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_mcp_log_stats",
+        description="Get statistics about MCP tool call usage, including success/error rates and performance metrics.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "since_hours": {
+                    "type": "integer",
+                    "default": 24,
+                    "minimum": 1,
+                    "maximum": _MAX_SINCE_HOURS,
+                    "description": f"Look back N hours (default 24, max {_MAX_SINCE_HOURS})"
+                }
+            },
+            "required": []
+        }
+    ),
+)
+
+
+def get_tools() -> List[Tool]:
+    """Return all logging-related tools."""
+    return list(_TOOLS)
 
 
 async def query_mcp_logs(
@@ -70,69 +277,54 @@ async def query_mcp_logs(
     status: Optional[str] = None,
     limit: int = 20,
     since_hours: int = 24,
+    output_format: str = "json",
 ) -> str:
     """Query MCP tool call logs."""
     try:
-        from ..server import get_log_service
+        limit = 20 if limit is None else min(max(int(limit), 1), _MAX_LOG_LIMIT)
+        since_hours = min(max(int(since_hours), 1), _MAX_SINCE_HOURS)
 
-        log_service = get_log_service()
+        log_service = _resolve_log_service()
         if not log_service or not log_service.enabled:
-            return json.dumps({
-                "status": "disabled",
-                "message": "MCP logging is not enabled. Set MCP_LOGGING_ENABLED=true to enable."
-            })
+            return _DISABLED_JSON
+        if time.monotonic() < _breaker_open_until:
+            return _UNAVAILABLE_JSON
 
-        logs = await log_service.query_logs(
+        logs = await _batched_query(
+            log_service,
+            limit=limit,
+            since_hours=since_hours,
             tool_name=tool_name,
             status=status,
-            since_hours=since_hours,
-            limit=limit,
+            row_type=_LogRow,
         )
+        _record_success()
 
-        # Format logs for display
-        formatted_logs = []
-        for log in logs:
-            formatted_log = {
-                "id": log.get("id"),
-                "timestamp": log.get("timestamp"),
-                "tool_name": log.get("tool_name"),
-                "status": log.get("status"),
-                "duration_ms": log.get("duration_ms"),
-            }
-
-            if log.get("error_message"):
-                formatted_log["error"] = {
-                    "message": log.get("error_message"),
-                    "type": log.get("error_type"),
-                }
-
-            # Include truncated parameters if present
-            if log.get("parameters"):
-                params = log.get("parameters")
-                if len(params) > 200:
-                    params = params[:200] + "..."
-                formatted_log["parameters"] = params
-
-            formatted_logs.append(formatted_log)
-
-        return json.dumps({
+        response = {
             "status": "success",
-            "count": len(formatted_logs),
+            "count": len(logs),
             "since_hours": since_hours,
             "filters": {
                 "tool_name": tool_name,
                 "status": status,
             },
-            "logs": formatted_logs,
-            "message": f"Found {len(formatted_logs)} log entries"
-        }, indent=2)
+        }
+        message = f"Found {len(logs)} log entries"
+
+        if output_format == "ndjson":
+            response["message"] = message
+            return _ndjson_logs_response(response, _iter_formatted(logs))
+
+        if len(logs) <= _PRETTY_LOG_LIMIT:
+            response["logs"] = list(_iter_formatted(logs))
+            response["message"] = message
+            return dumps(response, pretty=True)
+
+        return _stream_logs_response(response, _iter_formatted(logs), message)
 
     except Exception as e:
-        logger.exception("Error querying MCP logs")
-        return json.dumps({
-            "status": "error",
-            "message": f"Failed to query logs: {str(e)}"
-        })
+        _record_failure("querying MCP logs", e)
+        return _error_json(f"Failed to query logs: {str(e)}")
 
 
 async def get_mcp_log_stats(
@@ -141,26 +333,34 @@ async def get_mcp_log_stats(
 ) -> str:
     """Get MCP tool call statistics."""
     try:
-        from ..server import get_log_service
+        since_hours = min(max(int(since_hours), 1), _MAX_SINCE_HOURS)
 
-        log_service = get_log_service()
+        log_service = _resolve_log_service()
         if not log_service or not log_service.enabled:
-            return json.dumps({
-                "status": "disabled",
-                "message": "MCP logging is not enabled. Set MCP_LOGGING_ENABLED=true to enable."
-            })
+            return _DISABLED_JSON
+        if time.monotonic() < _breaker_open_until:
+            return _UNAVAILABLE_JSON
 
-        stats = await log_service.get_stats(since_hours=since_hours)
+        cached = _stats_cache.get(since_hours)
+        if cached and time.monotonic() - cached[0] < _STATS_TTL:
+            return cached[1]
 
-        return json.dumps({
-            "status": "success",
-            **stats,
-            "message": f"Statistics for the last {since_hours} hours"
-        }, indent=2)
+        # One aggregation per window at a time; waiters reuse its result
+        async with _stats_locks[since_hours]:
+            cached = _stats_cache.get(since_hours)
+            if cached and time.monotonic() - cached[0] < _STATS_TTL:
+                return cached[1]
+
+            stats = await log_service.get_stats(since_hours=since_hours)
+            _record_success()
+            response = dumps({
+                "status": "success",
+                **stats,
+                "message": f"Statistics for the last {since_hours} hours"
+            }, pretty=True)
+            _stats_cache[since_hours] = (time.monotonic(), response)
+            return response
 
     except Exception as e:
-        logger.exception("Error getting MCP log stats")
-        return json.dumps({
-            "status": "error",
-            "message": f"Failed to get stats: {str(e)}"
-        })
+        _record_failure("getting MCP log stats", e)
+        return _error_json(f"Failed to get stats: {str(e)}")
@@ -5,27 +5,92 @@ including stores, classes, connections, mappings, and runtimes.
 """
 
 import asyncio
-import json
+import functools
+import importlib
+import io
 import logging
-from typing import Any, Dict, List, Optional
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from mcp.types import Tool
 
-from ..context import MCPContext, DatabaseType, sanitize_pure_identifier
-from ..errors import GenerationError, IntrospectionError
+from ..context import MCPContext, DatabaseType, code_summary, parse_db_type, sanitize_pure_identifier
+from ..errors import GenerationError, IntrospectionError, MCPError
+from ..serialization import dumps
+from .database import introspect_schema, load_cached_schema
+from legend_cli.config import settings
+from legend_cli.database import DuckDBIntrospector, SnowflakeIntrospector
+from legend_cli.prompts.enum_templates import normalize_enum_value
 
 logger = logging.getLogger(__name__)
 
+# legend_cli.pure, bound on first use; its enhanced generator imports
+# legend_cli.analysis and the LLM client, which would slow server startup
+_pure: Optional[ModuleType] = None
 
+
+def _pure_module() -> ModuleType:
+    """Return legend_cli.pure, importing it only on the first call."""
+    global _pure
+    if _pure is None:
+        _pure = importlib.import_module("legend_cli.pure")
+    return _pure
+
+
+def _artifact_response_parts(artifact_type: str, message: str) -> Tuple[str, str]:
+    """Encode a single-artifact response around its code field."""
+    head = dumps({"status": "success", "artifact_type": artifact_type})[:-1] + ',"code":'
+    tail = ',"message":' + dumps(message) + "}"
+    return head, tail
+
+
+# Store, class, mapping and runtime responses differ only in their code,
+# so everything around it is encoded once here
+_ARTIFACT_RESPONSES: Dict[str, Tuple[str, str]] = {
+    artifact_type: _artifact_response_parts(artifact_type, message)
+    for artifact_type, message in (
+        ("store", "Store definition generated and added to pending artifacts"),
+        ("classes", "Class definitions generated and added to pending artifacts"),
+        ("mapping", "Mapping definition generated and added to pending artifacts"),
+        ("runtime", "Runtime definition generated and added to pending artifacts"),
+    )
+}
+
+
+def _artifact_response(artifact_type: str, code: str) -> str:
+    """Build a single-artifact tool response; only the code is encoded."""
+    head, tail = _ARTIFACT_RESPONSES[artifact_type]
+    return head + dumps(code) + tail
+
+
+@functools.lru_cache(maxsize=16)
+def _no_database_error(
+    artifact_name: str,
+    reason: str,
+    suggestion: str = "Please provide the database parameter.",
+) -> str:
+    """Return the error for skip_database_prompt on a tool that needs a database."""
+    return dumps({
+        "status": "error",
+        "message": f"Cannot generate {artifact_name} without database. {reason}",
+        "suggestion": suggestion,
+    })
+
+
+@functools.lru_cache(maxsize=32)
 def _needs_database_input_response(db_type: str, tool_name: str) -> str:
-    """Return a structured response asking for database info."""
+    """Return a structured response asking for database info.
+
+    Memoized: the response depends only on the two arguments, and
+    clients that omit the database hit this on every prompt round-trip.
+    """
     hints = {
         "snowflake": "For Snowflake: database name (e.g., 'MY_DB')",
         "duckdb": "For DuckDB: path to .duckdb file (e.g., '/path/to/data.duckdb')",
     }
     hint = hints.get(db_type.lower(), "Provide the database identifier")
 
-    return json.dumps({
+    return dumps({
         "status": "needs_input",
         "required_field": "database",
         "message": f"Please provide the database identifier to {tool_name.replace('_', ' ')}.",
@@ -61,7 +126,6 @@ def _generate_docs_from_schema(
     Returns:
         Dictionary mapping class names to ClassDocumentation objects
     """
-    import asyncio
     from legend_cli.doc_generator import DocGenerator
 
     try:
@@ -108,6 +172,7 @@ def _populate_enum_values(
     schema: "Database",
     postgres_host: Optional[str] = None,
     postgres_port: Optional[int] = None,
+    introspector: Any = None,
 ) -> "EnhancedModelSpec":
     """Populate enum candidates with actual values from the database.
 
@@ -118,64 +183,69 @@ def _populate_enum_values(
         schema: Database schema object
         postgres_host: Host for Postgres wire protocol connection (DuckDB only)
         postgres_port: Port for Postgres wire protocol connection (DuckDB only)
+        introspector: Connected introspector to query through (left open);
+            if None, one is created for this call and closed afterwards
 
     Returns:
         Updated EnhancedModelSpec with populated enum values
     """
-    from legend_cli.prompts.enum_templates import normalize_enum_value
-
     # Get schema name (use first schema if multiple)
     schema_name = schema.schemas[0].name if schema.schemas else "main"
+    owns_introspector = introspector is None
 
     try:
-        if db_type == DatabaseType.DUCKDB:
-            from legend_cli.database import DuckDBIntrospector
+        if owns_introspector and db_type == DatabaseType.DUCKDB:
             introspector = DuckDBIntrospector(
                 database_path=database,
                 read_only=True,
                 postgres_host=postgres_host if postgres_port else None,
                 postgres_port=postgres_port,
             )
-        else:
-            from legend_cli.database import SnowflakeIntrospector
+        elif owns_introspector:
             introspector = SnowflakeIntrospector()
 
+        # Enums that still need values, grouped so each table is queried once
+        enums_by_table: Dict[str, List[Any]] = {}
         for enum in enhanced_spec.enumerations:
-            if enum.values:
-                # Already has values, skip
-                continue
+            if not enum.values:
+                enums_by_table.setdefault(enum.source_table, []).append(enum)
 
+        for table, enums in enums_by_table.items():
+            columns = list(dict.fromkeys(enum.source_column for enum in enums))
             try:
-                # Fetch distinct values from the source table/column
+                # Fetch distinct values from the table's enum columns
                 if db_type == DatabaseType.DUCKDB:
-                    values = introspector.get_distinct_values(
+                    values_by_column = introspector.get_distinct_values_multi(
                         schema=schema_name,
-                        table=enum.source_table,
-                        column=enum.source_column,
+                        table=table,
+                        columns=columns,
                         limit=50,
                     )
                 else:
-                    values = introspector.get_distinct_values(
+                    values_by_column = introspector.get_distinct_values_multi(
                         database=database,
                         schema=schema_name,
-                        table=enum.source_table,
-                        column=enum.source_column,
+                        table=table,
+                        columns=columns,
                         limit=50,
                     )
+            except Exception as e:
+                logger.warning("Failed to fetch enum values from %s: %s", table, str(e))
+                continue
 
+            for enum in enums:
+                values = values_by_column.get(enum.source_column)
                 if values:
-                    # Normalize values to valid enum identifiers
-                    enum.values = [normalize_enum_value(v) for v in values]
-                    # Store original values as descriptions
-                    enum.value_descriptions = {
-                        normalize_enum_value(v): v for v in values
-                    }
+                    # Normalize values to valid enum identifiers, keeping
+                    # the original values as descriptions
+                    normalized = [(normalize_enum_value(v), v) for v in values]
+                    enum.values = [name for name, _ in normalized]
+                    enum.value_descriptions = dict(normalized)
                     logger.debug("Populated %d values for enum %s from %s.%s",
-                                len(values), enum.name, enum.source_table, enum.source_column)
-            except Exception as e:
-                logger.warning("Failed to fetch values for enum %s: %s", enum.name, str(e))
+                                len(values), enum.name, table, enum.source_column)
 
-        introspector.close()
+        if owns_introspector:
+            introspector.close()
 
     except Exception as e:
         logger.warning("Failed to populate enum values: %s", str(e))
@@ -183,399 +253,473 @@ def _populate_enum_values(
     return enhanced_spec
 
 
-def get_tools() -> List[Tool]:
-    """Return all model generation tools."""
-    return [
-        Tool(
-            name="generate_model",
-            description="End-to-end model generation from a database. Generates all artifacts: Store, Classes, Connection, Mapping, Runtime, and optionally Associations. This is the main tool for complete model generation.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "schema_filter": {
-                        "type": "string",
-                        "description": "Optional: filter to specific schema"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix for generated Pure code (default: 'model')",
-                        "default": "model"
-                    },
-                    "enhanced": {
-                        "type": "boolean",
-                        "description": "Use enhanced analysis (enums, hierarchies, constraints). Default: true",
-                        "default": True
-                    },
-                    "generate_docs": {
-                        "type": "boolean",
-                        "description": "Generate doc.doc annotations for classes and attributes. Default: true",
-                        "default": True
-                    },
-                    "doc_reference": {
-                        "type": "string",
-                        "description": "Optional URL or PDF path to use as documentation reference. If not provided, docs are generated from field names."
-                    },
-                    "snowflake_account": {
-                        "type": "string",
-                        "description": "Snowflake account for connection (Snowflake only)"
-                    },
-                    "snowflake_warehouse": {
-                        "type": "string",
-                        "description": "Snowflake warehouse for connection (Snowflake only)"
-                    },
-                    "snowflake_role": {
-                        "type": "string",
-                        "description": "Snowflake role for connection (Snowflake only)"
-                    },
-                    "duckdb_host": {
-                        "type": "string",
-                        "description": "DuckDB PostgreSQL proxy host for Legend connection (DuckDB only, default: host.docker.internal)"
-                    },
-                    "duckdb_port": {
-                        "type": "integer",
-                        "description": "DuckDB PostgreSQL proxy port for Legend connection (DuckDB only, default: 5433)"
-                    },
-                    "postgres_host": {
-                        "type": "string",
-                        "description": "Host for Postgres wire protocol introspection (DuckDB only, default: localhost). Use when DuckDB file is locked by buenavista."
-                    },
-                    "postgres_port": {
-                        "type": "integer",
-                        "description": "Port for Postgres wire protocol introspection (DuckDB only, e.g., 5433). When set, connects via psycopg2 instead of direct file access."
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, generate classes only without store/connection when database is not provided",
-                        "default": False
-                    },
-                    "detect_hierarchies": {
-                        "type": "boolean",
-                        "description": "Detect class inheritance hierarchies (enhanced mode). Default: true",
-                        "default": True
-                    },
-                    "detect_enums": {
-                        "type": "boolean",
-                        "description": "Detect enumeration candidates (enhanced mode). Default: true",
-                        "default": True
-                    },
-                    "detect_constraints": {
-                        "type": "boolean",
-                        "description": "Generate data constraints (enhanced mode). Default: false (may have syntax issues)",
-                        "default": False
-                    },
-                    "detect_derived": {
-                        "type": "boolean",
-                        "description": "Detect derived properties (enhanced mode). Default: false (may have syntax issues)",
-                        "default": False
-                    },
-                    "confidence_threshold": {
-                        "type": "number",
-                        "description": "Minimum confidence threshold for enhanced suggestions (0.0-1.0). Default: 0.7",
-                        "default": 0.7
-                    }
+def _run_enhanced_analysis(
+    schema: "Database",
+    parsed_doc_sources,
+    detect_hierarchies: bool,
+    detect_enums: bool,
+    detect_constraints: bool,
+    detect_derived: bool,
+    confidence_threshold: float,
+) -> Tuple[Optional["EnhancedModelSpec"], Dict[str, Any]]:
+    """Run generate_model's enhanced analysis.
+
+    Blocking (LLM calls); reads the schema without changing it.
+
+    Returns:
+        (enhanced spec, summary counts), or (None, {"error": ...}) if the
+        analysis failed
+    """
+    try:
+        from legend_cli.analysis import SchemaAnalyzer, AnalysisContext, AnalysisOptions
+
+        logger.info("Running enhanced schema analysis...")
+
+        # Configure analysis options
+        analysis_options = AnalysisOptions(
+            detect_hierarchies=detect_hierarchies,
+            detect_enums=detect_enums,
+            detect_constraints=detect_constraints,
+            detect_derived=detect_derived,
+            analyze_document_relationships=False,  # generate_model merges these first
+            use_llm=True,
+            confidence_threshold=confidence_threshold,
+        )
+
+        # Run analysis
+        analyzer = SchemaAnalyzer(options=analysis_options)
+        context = AnalysisContext(
+            database=schema,
+            documentation=None,
+            sql_queries=None,
+            doc_sources=parsed_doc_sources,
+        )
+        enhanced_spec = analyzer.analyze(context)
+
+        # Build summary
+        enhanced_summary = {
+            "hierarchies": len(enhanced_spec.hierarchies),
+            "enumerations": len(enhanced_spec.enumerations),
+            "constraints": len(enhanced_spec.constraints),
+            "derived_properties": len(enhanced_spec.derived_properties),
+        }
+
+        logger.info(
+            "Enhanced analysis complete: %d hierarchies, %d enums, %d constraints, %d derived",
+            enhanced_summary["hierarchies"],
+            enhanced_summary["enumerations"],
+            enhanced_summary["constraints"],
+            enhanced_summary["derived_properties"],
+        )
+        if analyzer.failures:
+            enhanced_summary["warnings"] = analyzer.failures
+
+        return enhanced_spec, enhanced_summary
+
+    except Exception as e:
+        logger.warning("Enhanced analysis failed: %s. Continuing with basic generation.", str(e))
+        return None, {"error": str(e)}
+
+
+async def _analyze_with_enum_values(
+    ctx: MCPContext,
+    schema: "Database",
+    parsed_doc_sources,
+    db_type_enum: "DatabaseType",
+    database: str,
+    detect_hierarchies: bool,
+    detect_enums: bool,
+    detect_constraints: bool,
+    detect_derived: bool,
+    confidence_threshold: float,
+    postgres_host: Optional[str] = None,
+    postgres_port: Optional[int] = None,
+) -> Tuple[Optional["EnhancedModelSpec"], Dict[str, Any]]:
+    """Run the enhanced analysis in a worker thread, then fill in enum values.
+
+    Enum values are fetched through the session's pooled connection to
+    the database when there is one, and only for as long as the queries
+    take; otherwise _populate_enum_values opens its own.
+    """
+    enhanced_spec, enhanced_summary = await asyncio.to_thread(
+        _run_enhanced_analysis,
+        schema,
+        parsed_doc_sources,
+        detect_hierarchies,
+        detect_enums,
+        detect_constraints,
+        detect_derived,
+        confidence_threshold,
+    )
+    if enhanced_spec is None or not enhanced_spec.enumerations:
+        return enhanced_spec, enhanced_summary
+
+    # Fetch actual values for enum candidates that have empty values
+    populate = functools.partial(
+        _populate_enum_values,
+        enhanced_spec,
+        db_type_enum,
+        database,
+        schema,
+        postgres_host=postgres_host,
+        postgres_port=postgres_port,
+    )
+    conn = ctx.get_connection(db_type_enum, database)
+    if conn is None:
+        await asyncio.to_thread(populate)
+    else:
+        async with conn.acquire() as introspector:
+            await asyncio.to_thread(populate, introspector=introspector)
+
+    enums_with_values = sum(1 for e in enhanced_spec.enumerations if e.values)
+    logger.info("Populated values for %d/%d enum candidates",
+               enums_with_values, len(enhanced_spec.enumerations))
+    return enhanced_spec, enhanced_summary
+
+
+async def _completed(value: Any) -> Any:
+    """Awaitable standing in for a skipped step in asyncio.gather."""
+    return value
+
+
+# Input schema properties shared by the tools below
+_DB_TYPE_SCHEMA = {
+    "type": "string",
+    "enum": ["snowflake", "duckdb"],
+    "description": "Type of database"
+}
+_DATABASE_SCHEMA = {
+    "type": "string",
+    "description": "Database identifier"
+}
+_PACKAGE_PREFIX_SCHEMA = {
+    "type": "string",
+    "description": "Package prefix (default: 'model')",
+    "default": "model"
+}
+_SKIP_PROMPT_SCHEMA = {
+    "type": "boolean",
+    "description": "If true, skip prompting for database",
+    "default": False
+}
+
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="generate_model",
+        description="End-to-end model generation from a database. Generates all artifacts: Store, Classes, Connection, Mapping, Runtime, and optionally Associations. This is the main tool for complete model generation.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "schema_filter": {
+                    "type": "string",
+                    "description": "Optional: filter to specific schema"
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="generate_store",
-            description="Generate only the database store definition (###Relational section) from an introspected schema.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix (default: 'model')",
-                        "default": "model"
-                    },
-                    "include_joins": {
-                        "type": "boolean",
-                        "description": "Include join definitions from relationships (default: true)",
-                        "default": True
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, skip prompting for database",
-                        "default": False
-                    }
+                "package_prefix": {
+                    "type": "string",
+                    "description": "Package prefix for generated Pure code (default: 'model')",
+                    "default": "model"
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="generate_classes",
-            description="Generate Pure class definitions from an introspected schema.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix (default: 'model')",
-                        "default": "model"
-                    },
-                    "generate_docs": {
-                        "type": "boolean",
-                        "description": "Generate doc.doc annotations",
-                        "default": False
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, skip prompting for database",
-                        "default": False
-                    }
+                "enhanced": {
+                    "type": "boolean",
+                    "description": "Use enhanced analysis (enums, hierarchies, constraints). Default: true",
+                    "default": True
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="generate_connection",
-            description="Generate a database connection definition.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database name"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix (default: 'model')",
-                        "default": "model"
-                    },
-                    "account": {
-                        "type": "string",
-                        "description": "Snowflake account (Snowflake only)"
-                    },
-                    "warehouse": {
-                        "type": "string",
-                        "description": "Snowflake warehouse (Snowflake only)"
-                    },
-                    "role": {
-                        "type": "string",
-                        "description": "Snowflake role (Snowflake only)",
-                        "default": "ACCOUNTADMIN"
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "Snowflake region (Snowflake only)"
-                    },
-                    "auth_type": {
-                        "type": "string",
-                        "enum": ["keypair", "password"],
-                        "description": "Authentication type (Snowflake only)",
-                        "default": "keypair"
-                    },
-                    "host": {
-                        "type": "string",
-                        "description": "PostgreSQL proxy host (DuckDB only)",
-                        "default": "host.docker.internal"
-                    },
-                    "port": {
-                        "type": "integer",
-                        "description": "PostgreSQL proxy port (DuckDB only)",
-                        "default": 5433
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, skip prompting for database",
-                        "default": False
-                    }
+                "generate_docs": {
+                    "type": "boolean",
+                    "description": "Generate doc.doc annotations for classes and attributes. Default: true",
+                    "default": True
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="generate_mapping",
-            description="Generate Pure mapping definition from an introspected schema.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix (default: 'model')",
-                        "default": "model"
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, skip prompting for database",
-                        "default": False
-                    }
+                "doc_reference": {
+                    "type": "string",
+                    "description": "Optional URL or PDF path to use as documentation reference. If not provided, docs are generated from field names."
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="generate_runtime",
-            description="Generate Pure runtime definition.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database name"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix (default: 'model')",
-                        "default": "model"
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, skip prompting for database",
-                        "default": False
-                    }
+                "snowflake_account": {
+                    "type": "string",
+                    "description": "Snowflake account for connection (Snowflake only)"
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="generate_associations",
-            description="Generate Pure Association definitions from detected relationships. Can use document sources (ERD images, SQL JOINs) or LLM-based discovery when no foreign key constraints exist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "package_prefix": {
-                        "type": "string",
-                        "description": "Package prefix (default: 'model')",
-                        "default": "model"
-                    },
-                    "doc_reference": {
-                        "type": "string",
-                        "description": "Optional URL or PDF path containing ERD diagrams or SQL queries. Relationships extracted from documents take priority over LLM inference."
-                    },
-                    "use_llm": {
-                        "type": "boolean",
-                        "description": "Use LLM to discover relationships when no FK constraints exist (default: true)",
-                        "default": True
-                    },
-                    "confidence_threshold": {
-                        "type": "number",
-                        "description": "Minimum confidence for LLM-discovered relationships (0-1, default: 0.6)",
-                        "default": 0.6
-                    },
-                    "skip_database_prompt": {
-                        "type": "boolean",
-                        "description": "If true, skip prompting for database",
-                        "default": False
-                    }
+                "snowflake_warehouse": {
+                    "type": "string",
+                    "description": "Snowflake warehouse for connection (Snowflake only)"
                 },
-                "required": ["db_type"]
-            }
-        ),
-        Tool(
-            name="analyze_schema",
-            description="Perform enhanced schema analysis to detect enumerations, class hierarchies, constraints, and derived properties. Uses LLM for intelligent pattern detection.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_type": {
-                        "type": "string",
-                        "enum": ["snowflake", "duckdb"],
-                        "description": "Type of database"
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "Database identifier"
-                    },
-                    "documentation": {
-                        "type": "string",
-                        "description": "Optional documentation content to inform analysis"
-                    },
-                    "detect_hierarchies": {
-                        "type": "boolean",
-                        "description": "Detect class hierarchies",
-                        "default": True
-                    },
-                    "detect_enums": {
-                        "type": "boolean",
-                        "description": "Detect enumeration candidates",
-                        "default": True
-                    },
-                    "detect_constraints": {
-                        "type": "boolean",
-                        "description": "Detect constraint suggestions",
-                        "default": True
-                    },
-                    "detect_derived": {
-                        "type": "boolean",
-                        "description": "Detect derived properties",
-                        "default": True
-                    },
-                    "use_llm": {
-                        "type": "boolean",
-                        "description": "Use LLM for enhanced detection",
-                        "default": True
-                    },
-                    "confidence_threshold": {
-                        "type": "number",
-                        "description": "Minimum confidence threshold (0-1)",
-                        "default": 0.7
-                    }
+                "snowflake_role": {
+                    "type": "string",
+                    "description": "Snowflake role for connection (Snowflake only)"
                 },
-                "required": ["db_type", "database"]
-            }
-        ),
-    ]
+                "duckdb_host": {
+                    "type": "string",
+                    "description": "DuckDB PostgreSQL proxy host for Legend connection (DuckDB only, default: host.docker.internal)"
+                },
+                "duckdb_port": {
+                    "type": "integer",
+                    "description": "DuckDB PostgreSQL proxy port for Legend connection (DuckDB only, default: 5433)"
+                },
+                "postgres_host": {
+                    "type": "string",
+                    "description": "Host for Postgres wire protocol introspection (DuckDB only, default: localhost). Use when DuckDB file is locked by buenavista."
+                },
+                "postgres_port": {
+                    "type": "integer",
+                    "description": "Port for Postgres wire protocol introspection (DuckDB only, e.g., 5433). When set, connects via psycopg2 instead of direct file access."
+                },
+                "skip_database_prompt": {
+                    "type": "boolean",
+                    "description": "If true, generate classes only without store/connection when database is not provided",
+                    "default": False
+                },
+                "detect_hierarchies": {
+                    "type": "boolean",
+                    "description": "Detect class inheritance hierarchies (enhanced mode). Default: true",
+                    "default": True
+                },
+                "detect_enums": {
+                    "type": "boolean",
+                    "description": "Detect enumeration candidates (enhanced mode). Default: true",
+                    "default": True
+                },
+                "detect_constraints": {
+                    "type": "boolean",
+                    "description": "Generate data constraints (enhanced mode). Default: false (may have syntax issues)",
+                    "default": False
+                },
+                "detect_derived": {
+                    "type": "boolean",
+                    "description": "Detect derived properties (enhanced mode). Default: false (may have syntax issues)",
+                    "default": False
+                },
+                "confidence_threshold": {
+                    "type": "number",
+                    "description": "Minimum confidence threshold for enhanced suggestions (0.0-1.0). Default: 0.7",
+                    "default": 0.7
+                }
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="generate_store",
+        description="Generate only the database store definition (###Relational section) from an introspected schema.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "package_prefix": _PACKAGE_PREFIX_SCHEMA,
+                "include_joins": {
+                    "type": "boolean",
+                    "description": "Include join definitions from relationships (default: true)",
+                    "default": True
+                },
+                "skip_database_prompt": _SKIP_PROMPT_SCHEMA
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="generate_classes",
+        description="Generate Pure class definitions from an introspected schema.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "package_prefix": _PACKAGE_PREFIX_SCHEMA,
+                "generate_docs": {
+                    "type": "boolean",
+                    "description": "Generate doc.doc annotations",
+                    "default": False
+                },
+                "skip_database_prompt": _SKIP_PROMPT_SCHEMA
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="generate_connection",
+        description="Generate a database connection definition.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "package_prefix": _PACKAGE_PREFIX_SCHEMA,
+                "account": {
+                    "type": "string",
+                    "description": "Snowflake account (Snowflake only)"
+                },
+                "warehouse": {
+                    "type": "string",
+                    "description": "Snowflake warehouse (Snowflake only)"
+                },
+                "role": {
+                    "type": "string",
+                    "description": "Snowflake role (Snowflake only)",
+                    "default": "ACCOUNTADMIN"
+                },
+                "region": {
+                    "type": "string",
+                    "description": "Snowflake region (Snowflake only)"
+                },
+                "auth_type": {
+                    "type": "string",
+                    "enum": ["keypair", "password"],
+                    "description": "Authentication type (Snowflake only)",
+                    "default": "keypair"
+                },
+                "host": {
+                    "type": "string",
+                    "description": "PostgreSQL proxy host (DuckDB only)",
+                    "default": "host.docker.internal"
+                },
+                "port": {
+                    "type": "integer",
+                    "description": "PostgreSQL proxy port (DuckDB only)",
+                    "default": 5433
+                },
+                "skip_database_prompt": _SKIP_PROMPT_SCHEMA
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="generate_mapping",
+        description="Generate Pure mapping definition from an introspected schema.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "package_prefix": _PACKAGE_PREFIX_SCHEMA,
+                "skip_database_prompt": _SKIP_PROMPT_SCHEMA
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="generate_runtime",
+        description="Generate Pure runtime definition.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "package_prefix": _PACKAGE_PREFIX_SCHEMA,
+                "skip_database_prompt": _SKIP_PROMPT_SCHEMA
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="generate_associations",
+        description="Generate Pure Association definitions from detected relationships. Can use document sources (ERD images, SQL JOINs) or LLM-based discovery when no foreign key constraints exist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "package_prefix": _PACKAGE_PREFIX_SCHEMA,
+                "doc_reference": {
+                    "type": "string",
+                    "description": "Optional URL or PDF path containing ERD diagrams or SQL queries. Relationships extracted from documents take priority over LLM inference."
+                },
+                "use_llm": {
+                    "type": "boolean",
+                    "description": "Use LLM to discover relationships when no FK constraints exist (default: true)",
+                    "default": True
+                },
+                "confidence_threshold": {
+                    "type": "number",
+                    "description": "Minimum confidence for LLM-discovered relationships (0-1, default: 0.6)",
+                    "default": 0.6
+                },
+                "skip_database_prompt": _SKIP_PROMPT_SCHEMA
+            },
+            "required": ["db_type"]
+        }
+    ),
+    Tool(
+        name="analyze_schema",
+        description="Perform enhanced schema analysis to detect enumerations, class hierarchies, constraints, and derived properties. Uses LLM for intelligent pattern detection.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_type": _DB_TYPE_SCHEMA,
+                "database": _DATABASE_SCHEMA,
+                "documentation": {
+                    "type": "string",
+                    "description": "Optional documentation content to inform analysis"
+                },
+                "detect_hierarchies": {
+                    "type": "boolean",
+                    "description": "Detect class hierarchies",
+                    "default": True
+                },
+                "detect_enums": {
+                    "type": "boolean",
+                    "description": "Detect enumeration candidates",
+                    "default": True
+                },
+                "detect_constraints": {
+                    "type": "boolean",
+                    "description": "Detect constraint suggestions",
+                    "default": True
+                },
+                "detect_derived": {
+                    "type": "boolean",
+                    "description": "Detect derived properties",
+                    "default": True
+                },
+                "use_llm": {
+                    "type": "boolean",
+                    "description": "Use LLM for enhanced detection",
+                    "default": True
+                },
+                "confidence_threshold": {
+                    "type": "number",
+                    "description": "Minimum confidence threshold (0-1)",
+                    "default": 0.7
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Ignore any cached analysis of this schema and analyze it again",
+                    "default": False
+                }
+            },
+            "required": ["db_type", "database"]
+        }
+    ),
+)
+
+
+def get_tools() -> List[Tool]:
+    """Return all model generation tools."""
+    return list(_TOOLS)
+
+
+def _wrap_errors(action: str):
+    """Report a tool's unexpected failures as GenerationError.
+
+    MCP errors raised by the tool pass through unchanged; anything else
+    becomes GenerationError("<action> failed: ...") chained to the
+    original exception.
+    """
+    def decorator(func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await func(*args, **kwargs)
+            except MCPError:
+                raise
+            except Exception as e:
+                raise GenerationError(f"{action} failed: {e}") from e
+        return wrapper
+    return decorator
 
 
 def _get_schema_or_error(ctx: MCPContext, db_type: str, database: str):
     """Get introspected schema or raise an error."""
-    db_type_enum = DatabaseType(db_type.lower())
+    db_type_enum = parse_db_type(db_type)
     schema = ctx.get_schema(db_type_enum, database)
     if not schema:
         raise IntrospectionError(
@@ -585,6 +729,92 @@ def _get_schema_or_error(ctx: MCPContext, db_type: str, database: str):
     return schema
 
 
+def _artifact_cache_key(
+    ctx: MCPContext, db_type: str, database: str, schema, tool: str, *options: Any
+) -> Tuple:
+    """Build the ctx.artifact_cache key for a tool's output on this schema.
+
+    Tables and columns are fixed once a schema is stored, so its version
+    stands in for them; the name and relationships are keyed directly,
+    since tools rename the database and merge relationships in place.
+    """
+    conn_key = ctx.get_connection_key(parse_db_type(db_type), database)
+    return (
+        conn_key,
+        tool,
+        ctx.schema_versions.get(conn_key),
+        schema.name,
+        schema.relationship_signature(),
+        *options,
+    )
+
+
+def _cached_artifact(
+    ctx: MCPContext, key: Tuple, artifact_type: str, render: Callable[[], str]
+) -> str:
+    """Return cached code for key, calling render() only on a miss."""
+    artifacts = ctx.artifact_cache.get(key)
+    if artifacts is None:
+        artifacts = {artifact_type: render()}
+        ctx.artifact_cache[key] = artifacts
+    return artifacts[artifact_type]
+
+
+def _model_response(
+    database: str,
+    package_prefix: str,
+    schema,
+    artifacts: Dict[str, str],
+    enhanced_mode: bool,
+    enhanced_summary: Dict[str, Any],
+    doc_reference: Optional[str],
+    doc_relationship_count: int,
+) -> str:
+    """Build the generate_model response.
+
+    Each artifact's preview is encoded straight into the output rather
+    than collected into a response dict first.
+    """
+    head = {
+        "status": "success",
+        "database": database,
+        "package_prefix": package_prefix,
+        "enhanced_mode": enhanced_mode,
+        "artifacts_generated": list(artifacts.keys()),
+        "summary": {
+            "schemas": len(schema.schemas),
+            "tables": schema.table_count,
+            "relationships": len(schema.relationships),
+        },
+    }
+    tail: Dict[str, Any] = {
+        "message": f"Generated {len(artifacts)} artifacts. Use preview_changes to review or push_artifacts to push to SDLC."
+    }
+    if enhanced_summary:
+        tail["enhanced_analysis"] = enhanced_summary
+    if doc_relationship_count > 0:
+        tail["document_relationships"] = {
+            "count": doc_relationship_count,
+            "source": doc_reference,
+        }
+
+    buf = io.StringIO()
+    write = buf.write
+    write(dumps(head)[:-1])
+    write(',"artifacts":{')
+    separator = ""
+    for artifact_type, code in artifacts.items():
+        write(separator)
+        write(dumps(artifact_type))
+        write(":")
+        write(dumps(code_summary(code, 500)))
+        separator = ","
+    write("},")
+    write(dumps(tail)[1:])
+    return buf.getvalue()
+
+
+@_wrap_errors("Model generation")
 async def generate_model(
     ctx: MCPContext,
     db_type: str,
@@ -609,238 +839,187 @@ async def generate_model(
     confidence_threshold: float = 0.7,
 ) -> str:
     """Generate complete model from database."""
+    # Reject an unsupported db_type before prompting for the database
+    db_type_enum = parse_db_type(db_type)
+
     # Check if database is needed
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_model")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate model without database. The 'skip' option is not available for generate_model as it requires database introspection.",
-            "suggestion": "Please provide the database parameter, or use generate_classes with an already-introspected schema."
-        })
-
-    try:
-        from legend_cli.pure.generator import PureCodeGenerator
-        from legend_cli.pure.enhanced_generator import EnhancedPureCodeGenerator
-        from legend_cli.pure.connections import SnowflakeConnectionGenerator, DuckDBConnectionGenerator
-
-        db_type_enum = DatabaseType(db_type.lower())
-
-        # Get schema - introspect if not already done
-        schema = ctx.get_schema(db_type_enum, database)
-        if not schema:
-            # Need to introspect first
-            from .database import introspect_database as do_introspect
-            await do_introspect(
-                ctx, db_type, database, schema_filter,
-                detect_relationships=True,
-                postgres_host=postgres_host,
-                postgres_port=postgres_port,
-            )
-            schema = ctx.get_schema(db_type_enum, database)
-
-        if not schema:
-            raise GenerationError("Failed to introspect database schema")
-
-        # Update context settings
-        ctx.package_prefix = package_prefix
-
-        # Sanitize database name for Pure code
-        db_name = sanitize_pure_identifier(schema.name)
+        return _no_database_error(
+            "model",
+            "The 'skip' option is not available for generate_model as it requires database introspection.",
+            "Please provide the database parameter, or use generate_classes with an already-introspected schema.",
+        )
 
-        # Update the schema name to use sanitized version
-        schema.name = db_name
+    pure = _pure_module()
+    PureCodeGenerator = pure.PureCodeGenerator
+    EnhancedPureCodeGenerator = pure.EnhancedPureCodeGenerator
+    SnowflakeConnectionGenerator = pure.SnowflakeConnectionGenerator
+    DuckDBConnectionGenerator = pure.DuckDBConnectionGenerator
 
-        # Generate connection code
-        store_path = f"{package_prefix}::store::{db_name}"
+    # Get schema - introspect if not already done
+    schema = ctx.get_schema(db_type_enum, database)
+    if not schema:
+        # An earlier session's introspection is reused while the
+        # database's tables, columns and keys are unchanged
+        schema = await load_cached_schema(
+            ctx, db_type, database, schema_filter,
+            postgres_host=postgres_host,
+            postgres_port=postgres_port,
+        )
+    if not schema:
+        # Need to introspect first
+        schema = await introspect_schema(
+            ctx, db_type, database, schema_filter,
+            detect_relationships=True,
+            postgres_host=postgres_host,
+            postgres_port=postgres_port,
+        )
 
-        if db_type_enum == DatabaseType.SNOWFLAKE:
-            conn_gen = SnowflakeConnectionGenerator()
-            connection_code = conn_gen.generate(
-                database_name=db_name,
-                store_path=store_path,
-                package_prefix=package_prefix,
-                account=snowflake_account or "",
-                warehouse=snowflake_warehouse or "",
-                role=snowflake_role or "ACCOUNTADMIN",
-            )
-        else:
-            conn_gen = DuckDBConnectionGenerator()
-            connection_code = conn_gen.generate(
-                database_name=db_name,
-                store_path=store_path,
-                package_prefix=package_prefix,
-                host=duckdb_host,
-                port=duckdb_port,
-            )
+    # Update context settings
+    ctx.package_prefix = package_prefix
 
-        # Analyze document relationships if doc_reference is provided
-        parsed_doc_sources = None
-        doc_relationship_count = 0
-        if doc_reference:
-            try:
-                from legend_cli.doc_generator import DocGenerator
-                from legend_cli.analysis import (
-                    DocumentRelationshipAnalyzer,
-                    RelationshipMerger,
-                )
+    # Sanitize database name for Pure code
+    db_name = sanitize_pure_identifier(schema.name)
 
-                logger.info("Analyzing document source for relationships: %s", doc_reference)
+    # Update the schema name to use sanitized version
+    schema.name = db_name
 
-                # Parse the document source
-                doc_gen = DocGenerator()
-                parsed_doc_sources = asyncio.get_event_loop().run_until_complete(
-                    doc_gen.parse_sources([doc_reference])
-                )
+    # Generate connection code
+    store_path = f"{package_prefix}::store::{db_name}"
 
-                # Analyze for relationships
-                doc_rel_analyzer = DocumentRelationshipAnalyzer()
-                known_tables = {t.name for t in schema.get_all_tables()}
-                doc_relationships = doc_rel_analyzer.analyze_documents_sync(
-                    doc_sources=parsed_doc_sources,
-                    known_tables=known_tables,
-                )
+    if db_type_enum == DatabaseType.SNOWFLAKE:
+        conn_gen = SnowflakeConnectionGenerator()
+        connection_code = conn_gen.generate(
+            database_name=db_name,
+            store_path=store_path,
+            package_prefix=package_prefix,
+            account=snowflake_account or "",
+            warehouse=snowflake_warehouse or "",
+            role=snowflake_role or "ACCOUNTADMIN",
+        )
+    else:
+        conn_gen = DuckDBConnectionGenerator()
+        connection_code = conn_gen.generate(
+            database_name=db_name,
+            store_path=store_path,
+            package_prefix=package_prefix,
+            host=duckdb_host,
+            port=duckdb_port,
+        )
 
-                if doc_relationships:
-                    doc_relationship_count = len(doc_relationships)
-                    logger.info("Found %d relationships in document", doc_relationship_count)
+    # Everything below depends only on the schema and these options
+    cache_key = _artifact_cache_key(
+        ctx, db_type, database, schema, "model",
+        package_prefix, connection_code, enhanced, generate_docs, doc_reference,
+        detect_hierarchies, detect_enums, detect_constraints, detect_derived,
+        confidence_threshold,
+    )
+    cached = ctx.artifact_cache.get(cache_key)
+    if cached is not None:
+        ctx.set_pending_artifacts(cached["artifacts"])
+        return cached["response"]
+
+    # Analysis failures are not cached, so the next call retries them
+    cacheable = True
+
+    # Analyze document relationships if doc_reference is provided
+    parsed_doc_sources = None
+    doc_relationship_count = 0
+    if doc_reference:
+        try:
+            from legend_cli.doc_generator import DocGenerator
+            from legend_cli.analysis import (
+                DocumentRelationshipAnalyzer,
+                RelationshipMerger,
+            )
 
-                    # Merge with existing relationships (document takes priority)
-                    merger = RelationshipMerger()
-                    schema.relationships = merger.merge_into_database(
-                        document_relationships=doc_relationships,
-                        existing_relationships=schema.relationships,
-                    )
+            logger.info("Analyzing document source for relationships: %s", doc_reference)
 
-            except Exception as e:
-                logger.warning("Document relationship analysis failed: %s", str(e))
+            # Parse the document source
+            doc_gen = DocGenerator()
+            parsed_doc_sources = asyncio.get_event_loop().run_until_complete(
+                doc_gen.parse_sources([doc_reference])
+            )
 
-        # Run enhanced analysis if requested
-        enhanced_spec = None
-        enhanced_summary = {}
-        if enhanced:
-            try:
-                from legend_cli.analysis import SchemaAnalyzer, AnalysisContext, AnalysisOptions
-
-                logger.info("Running enhanced schema analysis...")
-
-                # Configure analysis options
-                analysis_options = AnalysisOptions(
-                    detect_hierarchies=detect_hierarchies,
-                    detect_enums=detect_enums,
-                    detect_constraints=detect_constraints,
-                    detect_derived=detect_derived,
-                    analyze_document_relationships=False,  # Already done above
-                    use_llm=True,
-                    confidence_threshold=confidence_threshold,
-                )
+            # Analyze for relationships
+            doc_rel_analyzer = DocumentRelationshipAnalyzer()
+            known_tables = {t.name for t in schema.get_all_tables()}
+            doc_relationships = doc_rel_analyzer.analyze_documents_sync(
+                doc_sources=parsed_doc_sources,
+                known_tables=known_tables,
+            )
 
-                # Run analysis
-                analyzer = SchemaAnalyzer(options=analysis_options)
-                context = AnalysisContext(
-                    database=schema,
-                    documentation=None,
-                    sql_queries=None,
-                    doc_sources=parsed_doc_sources,
-                )
-                enhanced_spec = analyzer.analyze(context)
-
-                # Build summary
-                enhanced_summary = {
-                    "hierarchies": len(enhanced_spec.hierarchies),
-                    "enumerations": len(enhanced_spec.enumerations),
-                    "constraints": len(enhanced_spec.constraints),
-                    "derived_properties": len(enhanced_spec.derived_properties),
-                }
+            if doc_relationships:
+                doc_relationship_count = len(doc_relationships)
+                logger.info("Found %d relationships in document", doc_relationship_count)
 
-                logger.info(
-                    "Enhanced analysis complete: %d hierarchies, %d enums, %d constraints, %d derived",
-                    enhanced_summary["hierarchies"],
-                    enhanced_summary["enumerations"],
-                    enhanced_summary["constraints"],
-                    enhanced_summary["derived_properties"],
+                # Merge with existing relationships (document takes priority)
+                merger = RelationshipMerger()
+                schema.relationships = merger.merge_into_database(
+                    document_relationships=doc_relationships,
+                    existing_relationships=schema.relationships,
                 )
 
-                # Fetch actual values for enum candidates that have empty values
-                if enhanced_spec.enumerations:
-                    enhanced_spec = _populate_enum_values(
-                        enhanced_spec,
-                        db_type_enum,
-                        database,
-                        schema,
-                        postgres_host=postgres_host,
-                        postgres_port=postgres_port,
-                    )
-                    # Update summary with enums that have values
-                    enums_with_values = sum(1 for e in enhanced_spec.enumerations if e.values)
-                    logger.info("Populated values for %d/%d enum candidates",
-                               enums_with_values, len(enhanced_spec.enumerations))
-
-            except Exception as e:
-                logger.warning("Enhanced analysis failed: %s. Continuing with basic generation.", str(e))
-                enhanced_spec = None
-                enhanced_summary = {"error": str(e)}
-
-        # Generate documentation if requested
-        docs = None
-        if generate_docs:
-            docs = _generate_docs_from_schema(schema, doc_reference)
-
+        except Exception as e:
+            logger.warning("Document relationship analysis failed: %s", str(e))
+            cacheable = False
+
+    # Enhanced analysis and documentation both mostly wait on the LLM and
+    # neither changes the schema, so run them side by side in threads
+    (enhanced_spec, enhanced_summary), docs = await asyncio.gather(
+        _analyze_with_enum_values(
+            ctx,
+            schema,
+            parsed_doc_sources,
+            db_type_enum,
+            database,
+            detect_hierarchies,
+            detect_enums,
+            detect_constraints,
+            detect_derived,
+            confidence_threshold,
+            postgres_host=postgres_host,
+            postgres_port=postgres_port,
+        ) if enhanced else _completed((None, {})),
+        asyncio.to_thread(_generate_docs_from_schema, schema, doc_reference)
+        if generate_docs else _completed(None),
+    )
+    if "error" in enhanced_summary or "warnings" in enhanced_summary:
+        cacheable = False
+
+    def render() -> Dict[str, str]:
         if enhanced_spec:
             # Use enhanced generator
             generator = EnhancedPureCodeGenerator(schema, enhanced_spec=enhanced_spec, package_prefix=package_prefix)
-            artifacts = generator.generate_all_enhanced(
+            return generator.generate_all_enhanced(
                 connection_code=connection_code,
                 docs=docs,
             )
-        else:
-            # Use basic generator
-            generator = PureCodeGenerator(schema, package_prefix)
-            artifacts = generator.generate_all(connection_code, docs=docs)
-
-        # Store pending artifacts
-        ctx.clear_pending_artifacts()
-        for artifact_type, code in artifacts.items():
-            ctx.add_pending_artifact(artifact_type, code)
-
-        # Build response
-        response = {
-            "status": "success",
-            "database": database,
-            "package_prefix": package_prefix,
-            "enhanced_mode": enhanced and enhanced_spec is not None,
-            "artifacts_generated": list(artifacts.keys()),
-            "summary": {
-                "schemas": len(schema.schemas),
-                "tables": sum(len(s.tables) for s in schema.schemas),
-                "relationships": len(schema.relationships),
-            },
-            "artifacts": {
-                artifact_type: {
-                    "lines": len(code.split("\n")),
-                    "preview": code[:500] + "..." if len(code) > 500 else code
-                }
-                for artifact_type, code in artifacts.items()
-            },
-            "message": f"Generated {len(artifacts)} artifacts. Use preview_changes to review or push_artifacts to push to SDLC."
-        }
+        # Use basic generator
+        generator = PureCodeGenerator(schema, package_prefix)
+        return generator.generate_all(connection_code, docs=docs)
 
-        if enhanced_summary:
-            response["enhanced_analysis"] = enhanced_summary
+    # Rendering a large schema takes a while; do it off the event loop
+    # so other tool calls and log flushes are not held up
+    artifacts = await asyncio.to_thread(render)
 
-        if doc_relationship_count > 0:
-            response["document_relationships"] = {
-                "count": doc_relationship_count,
-                "source": doc_reference,
-            }
+    # Store pending artifacts
+    ctx.set_pending_artifacts(artifacts)
 
-        return json.dumps(response)
-
-    except Exception as e:
-        raise GenerationError(f"Model generation failed: {str(e)}")
+    enhanced_mode = enhanced and enhanced_spec is not None
+    response = _model_response(
+        database, package_prefix, schema, artifacts, enhanced_mode,
+        enhanced_summary, doc_reference, doc_relationship_count,
+    )
+    if cacheable:
+        ctx.artifact_cache[cache_key] = {"artifacts": artifacts, "response": response}
+    return response
 
 
+@_wrap_errors("Store generation")
 async def generate_store(
     ctx: MCPContext,
     db_type: str,
@@ -850,46 +1029,38 @@ async def generate_store(
     skip_database_prompt: bool = False,
 ) -> str:
     """Generate store definition."""
+    # Reject an unsupported db_type before prompting for the database
+    parse_db_type(db_type)
+
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_store")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate store without database. Store requires a database schema to be introspected.",
-            "suggestion": "Please provide the database parameter."
-        })
+        return _no_database_error(
+            "store", "Store requires a database schema to be introspected."
+        )
 
-    try:
-        from legend_cli.pure.generator import PureCodeGenerator
+    PureCodeGenerator = _pure_module().PureCodeGenerator
 
-        schema = _get_schema_or_error(ctx, db_type, database)
+    schema = _get_schema_or_error(ctx, db_type, database)
 
-        # Sanitize database name for Pure code
-        schema.name = sanitize_pure_identifier(schema.name)
+    # Sanitize database name for Pure code
+    schema.name = sanitize_pure_identifier(schema.name)
 
+    def render() -> str:
         generator = PureCodeGenerator(schema, package_prefix)
-
         if include_joins:
-            code = generator.generate_store_with_joins()
-        else:
-            code = generator.generate_store()
+            return generator.generate_store_with_joins()
+        return generator.generate_store()
 
-        ctx.add_pending_artifact("store", code)
+    key = _artifact_cache_key(ctx, db_type, database, schema, "store", package_prefix, include_joins)
+    code = _cached_artifact(ctx, key, "store", render)
+    ctx.add_pending_artifact("store", code)
 
-        return json.dumps({
-            "status": "success",
-            "artifact_type": "store",
-            "code": code,
-            "message": "Store definition generated and added to pending artifacts"
-        })
-
-    except IntrospectionError:
-        raise
-    except Exception as e:
-        raise GenerationError(f"Store generation failed: {str(e)}")
+    return _artifact_response("store", code)
 
 
+@_wrap_errors("Class generation")
 async def generate_classes(
     ctx: MCPContext,
     db_type: str,
@@ -899,45 +1070,39 @@ async def generate_classes(
     skip_database_prompt: bool = False,
 ) -> str:
     """Generate class definitions."""
+    # Reject an unsupported db_type before prompting for the database
+    parse_db_type(db_type)
+
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_classes")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate classes without database. Classes require a database schema to be introspected.",
-            "suggestion": "Please provide the database parameter."
-        })
-
-    try:
-        from legend_cli.pure.generator import PureCodeGenerator
+        return _no_database_error(
+            "classes", "Classes require a database schema to be introspected."
+        )
 
-        schema = _get_schema_or_error(ctx, db_type, database)
+    PureCodeGenerator = _pure_module().PureCodeGenerator
 
-        # Sanitize database name for Pure code
-        schema.name = sanitize_pure_identifier(schema.name)
+    schema = _get_schema_or_error(ctx, db_type, database)
 
-        generator = PureCodeGenerator(schema, package_prefix)
+    # Sanitize database name for Pure code
+    schema.name = sanitize_pure_identifier(schema.name)
 
-        docs = None
-        # Could integrate doc generation here if generate_docs is True
+    docs = None
+    # Could integrate doc generation here if generate_docs is True
+    # (and add it to the cache key)
 
-        code = generator.generate_classes(docs=docs)
-        ctx.add_pending_artifact("classes", code)
+    key = _artifact_cache_key(ctx, db_type, database, schema, "classes", package_prefix)
+    code = _cached_artifact(
+        ctx, key, "classes",
+        lambda: PureCodeGenerator(schema, package_prefix).generate_classes(docs=docs),
+    )
+    ctx.add_pending_artifact("classes", code)
 
-        return json.dumps({
-            "status": "success",
-            "artifact_type": "classes",
-            "code": code,
-            "message": "Class definitions generated and added to pending artifacts"
-        })
-
-    except IntrospectionError:
-        raise
-    except Exception as e:
-        raise GenerationError(f"Class generation failed: {str(e)}")
+    return _artifact_response("classes", code)
 
 
+@_wrap_errors("Connection generation")
 async def generate_connection(
     ctx: MCPContext,
     db_type: str,
@@ -955,61 +1120,59 @@ async def generate_connection(
     skip_database_prompt: bool = False,
 ) -> str:
     """Generate connection definition."""
+    # Reject an unsupported db_type before prompting for the database
+    db_type_enum = parse_db_type(db_type)
+
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_connection")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate connection without database. Connection requires a database name.",
-            "suggestion": "Please provide the database parameter."
-        })
-
-    try:
-        from legend_cli.pure.connections import SnowflakeConnectionGenerator, DuckDBConnectionGenerator
-
-        db_type_enum = DatabaseType(db_type.lower())
-
-        # Sanitize database name for Pure code
-        db_name = sanitize_pure_identifier(database)
-        store_path = f"{package_prefix}::store::{db_name}"
-
-        if db_type_enum == DatabaseType.SNOWFLAKE:
-            conn_gen = SnowflakeConnectionGenerator()
-            code = conn_gen.generate(
-                database_name=db_name,
-                store_path=store_path,
-                package_prefix=package_prefix,
-                account=account or "",
-                warehouse=warehouse or "",
-                role=role,
-                region=region,
-                auth_type=auth_type,
-            )
-        else:
-            conn_gen = DuckDBConnectionGenerator()
-            code = conn_gen.generate(
-                database_name=db_name,
-                store_path=store_path,
-                package_prefix=package_prefix,
-                host=host,
-                port=port,
-            )
+        return _no_database_error(
+            "connection", "Connection requires a database name."
+        )
 
-        ctx.add_pending_artifact("connection", code)
+    pure = _pure_module()
+    SnowflakeConnectionGenerator = pure.SnowflakeConnectionGenerator
+    DuckDBConnectionGenerator = pure.DuckDBConnectionGenerator
+
+    # Sanitize database name for Pure code
+    db_name = sanitize_pure_identifier(database)
+    store_path = f"{package_prefix}::store::{db_name}"
+
+    if db_type_enum == DatabaseType.SNOWFLAKE:
+        conn_gen = SnowflakeConnectionGenerator()
+        code = conn_gen.generate(
+            database_name=db_name,
+            store_path=store_path,
+            package_prefix=package_prefix,
+            account=account or "",
+            warehouse=warehouse or "",
+            role=role,
+            region=region,
+            auth_type=auth_type,
+        )
+    else:
+        conn_gen = DuckDBConnectionGenerator()
+        code = conn_gen.generate(
+            database_name=db_name,
+            store_path=store_path,
+            package_prefix=package_prefix,
+            host=host,
+            port=port,
+        )
 
-        return json.dumps({
-            "status": "success",
-            "artifact_type": "connection",
-            "db_type": db_type,
-            "code": code,
-            "message": "Connection definition generated and added to pending artifacts"
-        })
+    ctx.add_pending_artifact("connection", code)
 
-    except Exception as e:
-        raise GenerationError(f"Connection generation failed: {str(e)}")
+    return dumps({
+        "status": "success",
+        "artifact_type": "connection",
+        "db_type": db_type,
+        "code": code,
+        "message": "Connection definition generated and added to pending artifacts"
+    })
 
 
+@_wrap_errors("Mapping generation")
 async def generate_mapping(
     ctx: MCPContext,
     db_type: str,
@@ -1018,42 +1181,35 @@ async def generate_mapping(
     skip_database_prompt: bool = False,
 ) -> str:
     """Generate mapping definition."""
+    # Reject an unsupported db_type before prompting for the database
+    parse_db_type(db_type)
+
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_mapping")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate mapping without database. Mapping requires a database schema to be introspected.",
-            "suggestion": "Please provide the database parameter."
-        })
-
-    try:
-        from legend_cli.pure.generator import PureCodeGenerator
-
-        schema = _get_schema_or_error(ctx, db_type, database)
+        return _no_database_error(
+            "mapping", "Mapping requires a database schema to be introspected."
+        )
 
-        # Sanitize database name for Pure code
-        schema.name = sanitize_pure_identifier(schema.name)
+    PureCodeGenerator = _pure_module().PureCodeGenerator
 
-        generator = PureCodeGenerator(schema, package_prefix)
-        code = generator.generate_mapping()
+    schema = _get_schema_or_error(ctx, db_type, database)
 
-        ctx.add_pending_artifact("mapping", code)
+    # Sanitize database name for Pure code
+    schema.name = sanitize_pure_identifier(schema.name)
 
-        return json.dumps({
-            "status": "success",
-            "artifact_type": "mapping",
-            "code": code,
-            "message": "Mapping definition generated and added to pending artifacts"
-        })
+    key = _artifact_cache_key(ctx, db_type, database, schema, "mapping", package_prefix)
+    code = _cached_artifact(
+        ctx, key, "mapping",
+        lambda: PureCodeGenerator(schema, package_prefix).generate_mapping(),
+    )
+    ctx.add_pending_artifact("mapping", code)
 
-    except IntrospectionError:
-        raise
-    except Exception as e:
-        raise GenerationError(f"Mapping generation failed: {str(e)}")
+    return _artifact_response("mapping", code)
 
 
+@_wrap_errors("Runtime generation")
 async def generate_runtime(
     ctx: MCPContext,
     db_type: str,
@@ -1062,42 +1218,35 @@ async def generate_runtime(
     skip_database_prompt: bool = False,
 ) -> str:
     """Generate runtime definition."""
+    # Reject an unsupported db_type before prompting for the database
+    parse_db_type(db_type)
+
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_runtime")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate runtime without database. Runtime requires a database schema to be introspected.",
-            "suggestion": "Please provide the database parameter."
-        })
-
-    try:
-        from legend_cli.pure.generator import PureCodeGenerator
+        return _no_database_error(
+            "runtime", "Runtime requires a database schema to be introspected."
+        )
 
-        schema = _get_schema_or_error(ctx, db_type, database)
+    PureCodeGenerator = _pure_module().PureCodeGenerator
 
-        # Sanitize database name for Pure code
-        schema.name = sanitize_pure_identifier(schema.name)
+    schema = _get_schema_or_error(ctx, db_type, database)
 
-        generator = PureCodeGenerator(schema, package_prefix)
-        code = generator.generate_runtime()
+    # Sanitize database name for Pure code
+    schema.name = sanitize_pure_identifier(schema.name)
 
-        ctx.add_pending_artifact("runtime", code)
+    key = _artifact_cache_key(ctx, db_type, database, schema, "runtime", package_prefix)
+    code = _cached_artifact(
+        ctx, key, "runtime",
+        lambda: PureCodeGenerator(schema, package_prefix).generate_runtime(),
+    )
+    ctx.add_pending_artifact("runtime", code)
 
-        return json.dumps({
-            "status": "success",
-            "artifact_type": "runtime",
-            "code": code,
-            "message": "Runtime definition generated and added to pending artifacts"
-        })
-
-    except IntrospectionError:
-        raise
-    except Exception as e:
-        raise GenerationError(f"Runtime generation failed: {str(e)}")
+    return _artifact_response("runtime", code)
 
 
+@_wrap_errors("Association generation")
 async def generate_associations(
     ctx: MCPContext,
     db_type: str,
@@ -1109,136 +1258,195 @@ async def generate_associations(
     skip_database_prompt: bool = False,
 ) -> str:
     """Generate association definitions."""
+    # Reject an unsupported db_type before prompting for the database
+    parse_db_type(db_type)
+
     if not database and not skip_database_prompt:
         return _needs_database_input_response(db_type, "generate_associations")
 
     if not database and skip_database_prompt:
-        return json.dumps({
-            "status": "error",
-            "message": "Cannot generate associations without database. Associations require a database schema to be introspected.",
-            "suggestion": "Please provide the database parameter."
-        })
-
-    try:
-        from legend_cli.pure.generator import PureCodeGenerator
+        return _no_database_error(
+            "associations", "Associations require a database schema to be introspected."
+        )
 
-        schema = _get_schema_or_error(ctx, db_type, database)
+    PureCodeGenerator = _pure_module().PureCodeGenerator
+
+    schema = _get_schema_or_error(ctx, db_type, database)
+
+    # Sanitize database name for Pure code
+    schema.name = sanitize_pure_identifier(schema.name)
+
+    # A hit skips relationship discovery as well as rendering
+    cache_key = _artifact_cache_key(
+        ctx, db_type, database, schema, "associations",
+        package_prefix, doc_reference, use_llm, confidence_threshold,
+    )
+    cached = ctx.artifact_cache.get(cache_key)
+    if cached is not None:
+        if cached["associations"]:
+            ctx.add_pending_artifact("associations", cached["associations"])
+        return cached["response"]
+
+    # Check if relationships exist from introspection
+    has_relationships = bool(schema.relationships)
+    discovery_method = "introspection"
+    doc_relationship_count = 0
+    # Discovery failures are not cached, so the next call retries them
+    cacheable = True
+
+    # First try document-based relationship discovery if doc_reference provided
+    if doc_reference:
+        try:
+            from legend_cli.doc_generator import DocGenerator
+            from legend_cli.analysis import (
+                DocumentRelationshipAnalyzer,
+                RelationshipMerger,
+            )
 
-        # Check if relationships exist from introspection
-        has_relationships = bool(schema.relationships)
-        discovery_method = "introspection"
-        doc_relationship_count = 0
+            logger.info("Analyzing document source for relationships: %s", doc_reference)
 
-        # First try document-based relationship discovery if doc_reference provided
-        if doc_reference:
-            try:
-                from legend_cli.doc_generator import DocGenerator
-                from legend_cli.analysis import (
-                    DocumentRelationshipAnalyzer,
-                    RelationshipMerger,
-                )
+            # Parse the document source
+            doc_gen = DocGenerator()
+            parsed_doc_sources = asyncio.get_event_loop().run_until_complete(
+                doc_gen.parse_sources([doc_reference])
+            )
 
-                logger.info("Analyzing document source for relationships: %s", doc_reference)
+            # Analyze for relationships
+            doc_rel_analyzer = DocumentRelationshipAnalyzer()
+            known_tables = {t.name for t in schema.get_all_tables()}
+            doc_relationships = doc_rel_analyzer.analyze_documents_sync(
+                doc_sources=parsed_doc_sources,
+                known_tables=known_tables,
+            )
 
-                # Parse the document source
-                doc_gen = DocGenerator()
-                parsed_doc_sources = asyncio.get_event_loop().run_until_complete(
-                    doc_gen.parse_sources([doc_reference])
-                )
+            if doc_relationships:
+                doc_relationship_count = len(doc_relationships)
+                logger.info("Found %d relationships in document", doc_relationship_count)
 
-                # Analyze for relationships
-                doc_rel_analyzer = DocumentRelationshipAnalyzer()
-                known_tables = {t.name for t in schema.get_all_tables()}
-                doc_relationships = doc_rel_analyzer.analyze_documents_sync(
-                    doc_sources=parsed_doc_sources,
-                    known_tables=known_tables,
+                # Merge with existing relationships (document takes priority)
+                merger = RelationshipMerger()
+                schema.relationships = merger.merge_into_database(
+                    document_relationships=doc_relationships,
+                    existing_relationships=schema.relationships,
                 )
+                has_relationships = True
+                discovery_method = "document"
+
+        except Exception as doc_err:
+            logger.warning("Document relationship analysis failed: %s", doc_err)
+            cacheable = False
+
+    # If no relationships and LLM is enabled, try LLM discovery
+    if not has_relationships and use_llm:
+        try:
+            from legend_cli.analysis.relationship_analyzer import RelationshipAnalyzer
+
+            analyzer = RelationshipAnalyzer()
+            discovered = analyzer.discover_and_update_database(
+                schema,
+                confidence_threshold=confidence_threshold,
+            )
 
-                if doc_relationships:
-                    doc_relationship_count = len(doc_relationships)
-                    logger.info("Found %d relationships in document", doc_relationship_count)
+            if discovered:
+                has_relationships = True
+                discovery_method = "llm"
 
-                    # Merge with existing relationships (document takes priority)
-                    merger = RelationshipMerger()
-                    schema.relationships = merger.merge_into_database(
-                        document_relationships=doc_relationships,
-                        existing_relationships=schema.relationships,
-                    )
-                    has_relationships = True
-                    discovery_method = "document"
+        except Exception as llm_err:
+            # Log but don't fail - just continue without LLM discovery
+            logger.warning(
+                "LLM relationship discovery failed: %s", llm_err
+            )
+            cacheable = False
 
-            except Exception as doc_err:
-                logger.warning("Document relationship analysis failed: %s", doc_err)
+    # Without relationships there is nothing to render, so skip building
+    # the generator's table lookups
+    code = (
+        PureCodeGenerator(schema, package_prefix).generate_associations()
+        if schema.relationships else ""
+    )
 
-        # If no relationships and LLM is enabled, try LLM discovery
-        if not has_relationships and use_llm:
-            try:
-                from legend_cli.analysis.relationship_analyzer import RelationshipAnalyzer
+    if not code:
+        response = dumps({
+            "status": "success",
+            "artifact_type": "associations",
+            "code": "",
+            "relationships_found": 0,
+            "discovery_method": discovery_method,
+            "message": "No relationships detected - no associations generated",
+            "suggestion": "The database may not have foreign key constraints. Try using use_llm=true to discover relationships using AI analysis."
+                if not use_llm else "LLM analysis did not find confident relationships. Check that table/column naming follows common patterns."
+        })
+        if cacheable:
+            ctx.artifact_cache[cache_key] = {"associations": code, "response": response}
+        return response
+
+    ctx.add_pending_artifact("associations", code)
+
+    # Build relationship details for response
+    relationship_details = [
+        {
+            "source": r.source_key,
+            "target": r.target_key,
+            "type": r.relationship_type,
+            "property": r.property_name,
+        }
+        for r in schema.relationships
+    ]
 
-                analyzer = RelationshipAnalyzer()
-                discovered = analyzer.discover_and_update_database(
-                    schema,
-                    confidence_threshold=confidence_threshold,
-                )
+    response = dumps({
+        "status": "success",
+        "artifact_type": "associations",
+        "code": code,
+        "relationship_count": len(schema.relationships),
+        "discovery_method": discovery_method,
+        "relationships": relationship_details,
+        "message": f"Generated {len(schema.relationships)} associations using {discovery_method} discovery"
+    })
+    if cacheable:
+        ctx.artifact_cache[cache_key] = {"associations": code, "response": response}
+    return response
 
-                if discovered:
-                    has_relationships = True
-                    discovery_method = "llm"
 
-            except Exception as llm_err:
-                # Log but don't fail - just continue without LLM discovery
-                import logging
-                logging.getLogger(__name__).warning(
-                    "LLM relationship discovery failed: %s", llm_err
-                )
+_ANALYSIS_MESSAGE = (
+    "Analysis complete: {hierarchies} hierarchies, {enumerations} enums, "
+    "{constraints} constraints, {derived_properties} derived properties"
+)
 
-        # Sanitize database name for Pure code
-        schema.name = sanitize_pure_identifier(schema.name)
 
-        generator = PureCodeGenerator(schema, package_prefix)
-        code = generator.generate_associations()
-
-        if not code:
-            return json.dumps({
-                "status": "success",
-                "artifact_type": "associations",
-                "code": "",
-                "relationships_found": 0,
-                "discovery_method": discovery_method,
-                "message": "No relationships detected - no associations generated",
-                "suggestion": "The database may not have foreign key constraints. Try using use_llm=true to discover relationships using AI analysis."
-                    if not use_llm else "LLM analysis did not find confident relationships. Check that table/column naming follows common patterns."
-            })
-
-        ctx.add_pending_artifact("associations", code)
-
-        # Build relationship details for response
-        relationship_details = [
-            {
-                "source": f"{r.source_table}.{r.source_column}",
-                "target": f"{r.target_table}.{r.target_column}",
-                "type": r.relationship_type,
-                "property": r.property_name,
-            }
-            for r in schema.relationships
-        ]
+def _get_analysis_cache() -> Any:
+    """Return the on-disk analysis cache, or None when it is disabled."""
+    if not settings.analysis_cache_enabled:
+        return None
+    from legend_cli.analysis.analysis_cache import AnalysisCache
+    return AnalysisCache(settings.analysis_cache_dir)
 
-        return json.dumps({
-            "status": "success",
-            "artifact_type": "associations",
-            "code": code,
-            "relationship_count": len(schema.relationships),
-            "discovery_method": discovery_method,
-            "relationships": relationship_details,
-            "message": f"Generated {len(schema.relationships)} associations using {discovery_method} discovery"
-        })
 
-    except IntrospectionError:
-        raise
-    except Exception as e:
-        raise GenerationError(f"Association generation failed: {str(e)}")
+def _analysis_response(database: str, spec: Any, failures: List[str]) -> str:
+    """Encode an analyze_schema response for an analysis result."""
+    summary = {
+        "hierarchies": len(spec.hierarchies),
+        "enumerations": len(spec.enumerations),
+        "constraints": len(spec.constraints),
+        "derived_properties": len(spec.derived_properties)
+    }
+    response = {
+        "status": "success",
+        "database": database,
+        "analysis": {
+            "hierarchies": [h.to_dict() for h in spec.hierarchies],
+            "enumerations": [e.to_dict() for e in spec.enumerations],
+            "constraints": [c.to_dict() for c in spec.constraints],
+            "derived_properties": [d.to_dict() for d in spec.derived_properties],
+        },
+        "summary": summary,
+        "message": _ANALYSIS_MESSAGE.format(**summary),
+    }
+    if failures:
+        response["warnings"] = failures
+    return dumps(response)
 
 
+@_wrap_errors("Schema analysis")
 async def analyze_schema(
     ctx: MCPContext,
     db_type: str,
@@ -1250,13 +1458,37 @@ async def analyze_schema(
     detect_derived: bool = False,  # Disabled - unreliable LLM expressions
     use_llm: bool = True,
     confidence_threshold: float = 0.7,
+    refresh: bool = False,
 ) -> str:
     """Perform enhanced schema analysis."""
-    try:
-        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer, AnalysisOptions, AnalysisContext
-
-        schema = _get_schema_or_error(ctx, db_type, database)
-
+    from legend_cli.analysis.schema_analyzer import SchemaAnalyzer, AnalysisOptions, AnalysisContext
+
+    schema = _get_schema_or_error(ctx, db_type, database)
+
+    # The detectors' LLM calls take seconds; an unchanged schema analyzed
+    # with the same options and documentation (up to whitespace) reuses
+    # the earlier response
+    analysis_inputs = (
+        " ".join(documentation.split()) if documentation else None,
+        detect_hierarchies, detect_enums, detect_constraints, detect_derived,
+        use_llm, confidence_threshold,
+    )
+    cache_key = _artifact_cache_key(ctx, db_type, database, schema, "analysis", *analysis_inputs)
+    cached = None if refresh else ctx.artifact_cache.get(cache_key)
+    if cached is not None:
+        return cached["response"]
+
+    # Earlier sessions' results are keyed by the schema's content rather
+    # than the session's connection
+    analysis_cache = _get_analysis_cache()
+    disk_key = (schema.fingerprint(), *analysis_inputs)
+    spec = None
+    if analysis_cache is not None and not refresh:
+        spec = analysis_cache.load(disk_key)
+    loaded = spec is not None
+    failures: List[str] = []
+
+    if not loaded:
         options = AnalysisOptions(
             detect_hierarchies=detect_hierarchies,
             detect_enums=detect_enums,
@@ -1272,61 +1504,15 @@ async def analyze_schema(
             documentation=documentation,
         )
 
-        spec = analyzer.analyze(analysis_context)
-
-        return json.dumps({
-            "status": "success",
-            "database": database,
-            "analysis": {
-                "hierarchies": [
-                    {
-                        "base_class": h.base_class_name,
-                        "derived_classes": h.derived_classes,
-                        "confidence": h.confidence,
-                        "discriminator": h.discriminator_column
-                    }
-                    for h in spec.hierarchies
-                ],
-                "enumerations": [
-                    {
-                        "name": e.name,
-                        "source_table": e.source_table,
-                        "source_column": e.source_column,
-                        "values": e.values[:10],  # Limit values shown
-                        "confidence": e.confidence
-                    }
-                    for e in spec.enumerations
-                ],
-                "constraints": [
-                    {
-                        "class_name": c.class_name,
-                        "constraint_name": c.constraint_name,
-                        "expression": c.expression,
-                        "confidence": c.confidence
-                    }
-                    for c in spec.constraints
-                ],
-                "derived_properties": [
-                    {
-                        "class_name": d.class_name,
-                        "property_name": d.property_name,
-                        "expression": d.expression,
-                        "return_type": d.return_type,
-                        "confidence": d.confidence
-                    }
-                    for d in spec.derived_properties
-                ]
-            },
-            "summary": {
-                "hierarchies": len(spec.hierarchies),
-                "enumerations": len(spec.enumerations),
-                "constraints": len(spec.constraints),
-                "derived_properties": len(spec.derived_properties)
-            },
-            "message": f"Analysis complete: {len(spec.hierarchies)} hierarchies, {len(spec.enumerations)} enums, {len(spec.constraints)} constraints, {len(spec.derived_properties)} derived properties"
-        })
-
-    except IntrospectionError:
-        raise
-    except Exception as e:
-        raise GenerationError(f"Schema analysis failed: {str(e)}")
+        # The enabled detectors run concurrently, off the event loop
+        spec = await analyzer.analyze_async(analysis_context)
+        failures = analyzer.failures
+
+    response = _analysis_response(database, spec, failures)
+    # A detector that failed (an LLM outage, a missing API key) leaves a
+    # partial result; keep it out of both caches so the next call retries
+    if not failures:
+        if analysis_cache is not None and not loaded:
+            analysis_cache.save(disk_key, spec)
+        ctx.artifact_cache[cache_key] = {"response": response}
+    return response
@@ -6,335 +6,285 @@ in SDLC workspaces.
 
 import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.types import Tool
 
 from ..context import MCPContext
 from ..errors import SDLCError, EntityNotFoundError, ModificationError
-
-
-def get_tools() -> List[Tool]:
-    """Return all model modification tools."""
-    return [
-        Tool(
-            name="read_entity",
-            description="Read an existing Pure entity from SDLC workspace. Returns the entity content including Pure code.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "entity_path": {
-                        "type": "string",
-                        "description": "Full entity path (e.g., 'model::domain::Person')"
-                    }
+from .sdlc import _PROJECT_ID_SCHEMA, _WORKSPACE_ID_SCHEMA
+
+
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="read_entity",
+        description="Read an existing Pure entity from SDLC workspace. Returns the entity content including Pure code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "entity_path": {
+                    "type": "string",
+                    "description": "Full entity path (e.g., 'model::domain::Person')"
+                }
+            },
+            "required": ["project_id", "workspace_id", "entity_path"]
+        }
+    ),
+    Tool(
+        name="read_entities",
+        description="List all entities in an SDLC workspace with their paths and types.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "filter_type": {
+                    "type": "string",
+                    "description": "Optional: filter by classifier type (e.g., 'Class', 'Mapping', 'Database')"
+                }
+            },
+            "required": ["project_id", "workspace_id"]
+        }
+    ),
+    Tool(
+        name="add_property",
+        description="Add a new property to an existing Pure class.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "class_path": {
+                    "type": "string",
+                    "description": "Full class path (e.g., 'model::domain::Person')"
                 },
-                "required": ["project_id", "workspace_id", "entity_path"]
-            }
-        ),
-        Tool(
-            name="read_entities",
-            description="List all entities in an SDLC workspace with their paths and types.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "filter_type": {
-                        "type": "string",
-                        "description": "Optional: filter by classifier type (e.g., 'Class', 'Mapping', 'Database')"
-                    }
+                "property_name": {
+                    "type": "string",
+                    "description": "Name of the new property"
                 },
-                "required": ["project_id", "workspace_id"]
-            }
-        ),
-        Tool(
-            name="add_property",
-            description="Add a new property to an existing Pure class.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "class_path": {
-                        "type": "string",
-                        "description": "Full class path (e.g., 'model::domain::Person')"
-                    },
-                    "property_name": {
-                        "type": "string",
-                        "description": "Name of the new property"
-                    },
-                    "property_type": {
-                        "type": "string",
-                        "description": "Pure type (e.g., 'String', 'Integer', 'Date', or custom class path)"
-                    },
-                    "multiplicity": {
-                        "type": "string",
-                        "description": "Multiplicity (e.g., '[1]', '[0..1]', '[*]')",
-                        "default": "[1]"
-                    },
-                    "documentation": {
-                        "type": "string",
-                        "description": "Optional documentation for the property"
-                    }
+                "property_type": {
+                    "type": "string",
+                    "description": "Pure type (e.g., 'String', 'Integer', 'Date', or custom class path)"
                 },
-                "required": ["project_id", "workspace_id", "class_path", "property_name", "property_type"]
-            }
-        ),
-        Tool(
-            name="remove_property",
-            description="Remove a property from an existing Pure class.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "class_path": {
-                        "type": "string",
-                        "description": "Full class path"
-                    },
-                    "property_name": {
-                        "type": "string",
-                        "description": "Name of the property to remove"
-                    }
+                "multiplicity": {
+                    "type": "string",
+                    "description": "Multiplicity (e.g., '[1]', '[0..1]', '[*]')",
+                    "default": "[1]"
+                },
+                "documentation": {
+                    "type": "string",
+                    "description": "Optional documentation for the property"
+                }
+            },
+            "required": ["project_id", "workspace_id", "class_path", "property_name", "property_type"]
+        }
+    ),
+    Tool(
+        name="remove_property",
+        description="Remove a property from an existing Pure class.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "class_path": {
+                    "type": "string",
+                    "description": "Full class path"
+                },
+                "property_name": {
+                    "type": "string",
+                    "description": "Name of the property to remove"
+                }
+            },
+            "required": ["project_id", "workspace_id", "class_path", "property_name"]
+        }
+    ),
+    Tool(
+        name="create_class",
+        description="Create a new Pure class in the workspace.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "class_path": {
+                    "type": "string",
+                    "description": "Full class path (e.g., 'model::domain::NewClass')"
                 },
-                "required": ["project_id", "workspace_id", "class_path", "property_name"]
-            }
-        ),
-        Tool(
-            name="create_class",
-            description="Create a new Pure class in the workspace.",
-            inputSchema={
-                "type": "object",
                 "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "class_path": {
-                        "type": "string",
-                        "description": "Full class path (e.g., 'model::domain::NewClass')"
-                    },
-                    "properties": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "type": {"type": "string"},
-                                "multiplicity": {"type": "string", "default": "[1]"},
-                                "doc": {"type": "string"}
-                            },
-                            "required": ["name", "type"]
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "type": {"type": "string"},
+                            "multiplicity": {"type": "string", "default": "[1]"},
+                            "doc": {"type": "string"}
                         },
-                        "description": "List of properties to add to the class"
-                    },
-                    "extends": {
-                        "type": "string",
-                        "description": "Optional: parent class path for inheritance"
+                        "required": ["name", "type"]
                     },
-                    "documentation": {
-                        "type": "string",
-                        "description": "Optional: class documentation"
-                    },
-                    "commit_message": {
-                        "type": "string",
-                        "description": "Commit message",
-                        "default": "Create class via MCP"
-                    }
+                    "description": "List of properties to add to the class"
                 },
-                "required": ["project_id", "workspace_id", "class_path"]
-            }
-        ),
-        Tool(
-            name="create_association",
-            description="Create a new Pure Association between two classes.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "association_path": {
-                        "type": "string",
-                        "description": "Full association path (e.g., 'model::domain::Person_Address')"
-                    },
-                    "first_class": {
-                        "type": "string",
-                        "description": "First class path"
-                    },
-                    "first_property": {
-                        "type": "string",
-                        "description": "Property name on first class"
-                    },
-                    "first_multiplicity": {
-                        "type": "string",
-                        "description": "Multiplicity for first property",
-                        "default": "[*]"
-                    },
-                    "second_class": {
-                        "type": "string",
-                        "description": "Second class path"
-                    },
-                    "second_property": {
-                        "type": "string",
-                        "description": "Property name on second class"
-                    },
-                    "second_multiplicity": {
-                        "type": "string",
-                        "description": "Multiplicity for second property",
-                        "default": "[0..1]"
-                    },
-                    "commit_message": {
-                        "type": "string",
-                        "description": "Commit message",
-                        "default": "Create association via MCP"
-                    }
+                "extends": {
+                    "type": "string",
+                    "description": "Optional: parent class path for inheritance"
                 },
-                "required": ["project_id", "workspace_id", "association_path", "first_class", "first_property", "second_class", "second_property"]
-            }
-        ),
-        Tool(
-            name="create_function",
-            description="Create a new Pure function or query.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "function_path": {
-                        "type": "string",
-                        "description": "Full function path (e.g., 'model::functions::getActiveUsers')"
-                    },
-                    "parameters": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "type": {"type": "string"},
-                                "multiplicity": {"type": "string", "default": "[1]"}
-                            },
-                            "required": ["name", "type"]
+                "documentation": {
+                    "type": "string",
+                    "description": "Optional: class documentation"
+                },
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message",
+                    "default": "Create class via MCP"
+                }
+            },
+            "required": ["project_id", "workspace_id", "class_path"]
+        }
+    ),
+    Tool(
+        name="create_association",
+        description="Create a new Pure Association between two classes.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "association_path": {
+                    "type": "string",
+                    "description": "Full association path (e.g., 'model::domain::Person_Address')"
+                },
+                "first_class": {
+                    "type": "string",
+                    "description": "First class path"
+                },
+                "first_property": {
+                    "type": "string",
+                    "description": "Property name on first class"
+                },
+                "first_multiplicity": {
+                    "type": "string",
+                    "description": "Multiplicity for first property",
+                    "default": "[*]"
+                },
+                "second_class": {
+                    "type": "string",
+                    "description": "Second class path"
+                },
+                "second_property": {
+                    "type": "string",
+                    "description": "Property name on second class"
+                },
+                "second_multiplicity": {
+                    "type": "string",
+                    "description": "Multiplicity for second property",
+                    "default": "[0..1]"
+                },
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message",
+                    "default": "Create association via MCP"
+                }
+            },
+            "required": ["project_id", "workspace_id", "association_path", "first_class", "first_property", "second_class", "second_property"]
+        }
+    ),
+    Tool(
+        name="create_function",
+        description="Create a new Pure function or query.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "function_path": {
+                    "type": "string",
+                    "description": "Full function path (e.g., 'model::functions::getActiveUsers')"
+                },
+                "parameters": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "type": {"type": "string"},
+                            "multiplicity": {"type": "string", "default": "[1]"}
                         },
-                        "description": "Function parameters"
-                    },
-                    "return_type": {
-                        "type": "string",
-                        "description": "Return type"
-                    },
-                    "return_multiplicity": {
-                        "type": "string",
-                        "description": "Return multiplicity",
-                        "default": "[*]"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Function body (Pure expression)"
+                        "required": ["name", "type"]
                     },
-                    "commit_message": {
-                        "type": "string",
-                        "description": "Commit message",
-                        "default": "Create function via MCP"
-                    }
+                    "description": "Function parameters"
                 },
-                "required": ["project_id", "workspace_id", "function_path", "return_type", "body"]
-            }
-        ),
-        Tool(
-            name="delete_entity",
-            description="Delete an entity from the SDLC workspace.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "entity_path": {
-                        "type": "string",
-                        "description": "Full entity path to delete"
-                    }
+                "return_type": {
+                    "type": "string",
+                    "description": "Return type"
                 },
-                "required": ["project_id", "workspace_id", "entity_path"]
-            }
-        ),
-        Tool(
-            name="update_entity",
-            description="Update an existing entity's content.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "entity_path": {
-                        "type": "string",
-                        "description": "Full entity path"
-                    },
-                    "pure_code": {
-                        "type": "string",
-                        "description": "New Pure code for the entity"
-                    },
-                    "commit_message": {
-                        "type": "string",
-                        "description": "Commit message",
-                        "default": "Update entity via MCP"
-                    }
+                "return_multiplicity": {
+                    "type": "string",
+                    "description": "Return multiplicity",
+                    "default": "[*]"
                 },
-                "required": ["project_id", "workspace_id", "entity_path", "pure_code"]
-            }
-        ),
-    ]
+                "body": {
+                    "type": "string",
+                    "description": "Function body (Pure expression)"
+                },
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message",
+                    "default": "Create function via MCP"
+                }
+            },
+            "required": ["project_id", "workspace_id", "function_path", "return_type", "body"]
+        }
+    ),
+    Tool(
+        name="delete_entity",
+        description="Delete an entity from the SDLC workspace.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "entity_path": {
+                    "type": "string",
+                    "description": "Full entity path to delete"
+                }
+            },
+            "required": ["project_id", "workspace_id", "entity_path"]
+        }
+    ),
+    Tool(
+        name="update_entity",
+        description="Update an existing entity's content.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "entity_path": {
+                    "type": "string",
+                    "description": "Full entity path"
+                },
+                "pure_code": {
+                    "type": "string",
+                    "description": "New Pure code for the entity"
+                },
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message",
+                    "default": "Update entity via MCP"
+                }
+            },
+            "required": ["project_id", "workspace_id", "entity_path", "pure_code"]
+        }
+    ),
+)
+
+
+def get_tools() -> List[Tool]:
+    """Return all model modification tools."""
+    return list(_TOOLS)
 
 
 async def read_entity(
@@ -374,8 +324,8 @@ async def read_entity(
 
     except Exception as e:
         if "404" in str(e):
-            raise EntityNotFoundError(entity_path)
-        raise SDLCError(f"Failed to read entity: {str(e)}")
+            raise EntityNotFoundError(entity_path) from e
+        raise SDLCError(f"Failed to read entity: {e}") from e
 
 
 async def read_entities(
@@ -428,7 +378,7 @@ async def read_entities(
         })
 
     except Exception as e:
-        raise SDLCError(f"Failed to read entities: {str(e)}")
+        raise SDLCError(f"Failed to read entities: {e}") from e
 
 
 async def add_property(
@@ -521,8 +471,8 @@ async def add_property(
 
     except Exception as e:
         if "404" in str(e):
-            raise EntityNotFoundError(class_path)
-        raise ModificationError(f"Failed to add property: {str(e)}")
+            raise EntityNotFoundError(class_path) from e
+        raise ModificationError(f"Failed to add property: {e}") from e
 
 
 async def remove_property(
@@ -577,8 +527,8 @@ async def remove_property(
 
     except Exception as e:
         if "404" in str(e):
-            raise EntityNotFoundError(class_path)
-        raise ModificationError(f"Failed to remove property: {str(e)}")
+            raise EntityNotFoundError(class_path) from e
+        raise ModificationError(f"Failed to remove property: {e}") from e
 
 
 async def create_class(
@@ -649,7 +599,7 @@ async def create_class(
         })
 
     except Exception as e:
-        raise ModificationError(f"Failed to create class: {str(e)}")
+        raise ModificationError(f"Failed to create class: {e}") from e
 
 
 async def create_association(
@@ -696,7 +646,7 @@ async def create_association(
         })
 
     except Exception as e:
-        raise ModificationError(f"Failed to create association: {str(e)}")
+        raise ModificationError(f"Failed to create association: {e}") from e
 
 
 async def create_function(
@@ -749,7 +699,7 @@ async def create_function(
         })
 
     except Exception as e:
-        raise ModificationError(f"Failed to create function: {str(e)}")
+        raise ModificationError(f"Failed to create function: {e}") from e
 
 
 async def delete_entity(
@@ -775,8 +725,8 @@ async def delete_entity(
 
     except Exception as e:
         if "404" in str(e):
-            raise EntityNotFoundError(entity_path)
-        raise SDLCError(f"Failed to delete entity: {str(e)}")
+            raise EntityNotFoundError(entity_path) from e
+        raise SDLCError(f"Failed to delete entity: {e}") from e
 
 
 async def update_entity(
@@ -825,4 +775,4 @@ async def update_entity(
         })
 
     except Exception as e:
-        raise ModificationError(f"Failed to update entity: {str(e)}")
+        raise ModificationError(f"Failed to update entity: {e}") from e
@@ -5,7 +5,7 @@ syntax before pushing to SDLC.
 """
 
 import json
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from mcp.types import Tool
 
@@ -13,56 +13,59 @@ from ..context import MCPContext
 from ..errors import ValidationError, EngineError, EngineParseError
 
 
-def get_tools() -> List[Tool]:
-    """Return all preview and validation tools."""
-    return [
-        Tool(
-            name="preview_changes",
-            description="Preview all pending artifacts before pushing to SDLC. Shows the generated Pure code for review.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "artifact_type": {
-                        "type": "string",
-                        "description": "Optional: filter to specific artifact type (store, classes, connection, mapping, runtime, associations)"
-                    },
-                    "include_full_code": {
-                        "type": "boolean",
-                        "description": "Include full code (default: True, otherwise shows preview)",
-                        "default": True
-                    }
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="preview_changes",
+        description="Preview all pending artifacts before pushing to SDLC. Shows the generated Pure code for review.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "artifact_type": {
+                    "type": "string",
+                    "description": "Optional: filter to specific artifact type (store, classes, connection, mapping, runtime, associations)"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="validate_pure_code",
-            description="Validate Pure code syntax using Legend Engine. Can validate pending artifacts or custom Pure code.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pure_code": {
-                        "type": "string",
-                        "description": "Optional: Pure code to validate. If not provided, validates all pending artifacts."
-                    },
-                    "artifact_type": {
-                        "type": "string",
-                        "description": "Optional: if validating pending artifacts, filter to specific type"
-                    }
+                "include_full_code": {
+                    "type": "boolean",
+                    "description": "Include full code (default: True, otherwise shows preview)",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="validate_pure_code",
+        description="Validate Pure code syntax using Legend Engine. Can validate pending artifacts or custom Pure code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pure_code": {
+                    "type": "string",
+                    "description": "Optional: Pure code to validate. If not provided, validates all pending artifacts."
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="validate_model_completeness",
-            description="Validate that all required artifacts are present for a complete model before pushing. Checks for missing dependencies (e.g., mapping needs store and classes, runtime needs connection and mapping). Use this BEFORE push_artifacts to ensure the model is complete.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-    ]
+                "artifact_type": {
+                    "type": "string",
+                    "description": "Optional: if validating pending artifacts, filter to specific type"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="validate_model_completeness",
+        description="Validate that all required artifacts are present for a complete model before pushing. Checks for missing dependencies (e.g., mapping needs store and classes, runtime needs connection and mapping). Use this BEFORE push_artifacts to ensure the model is complete.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+)
+
+
+def get_tools() -> List[Tool]:
+    """Return all preview and validation tools."""
+    return list(_TOOLS)
 
 
 async def preview_changes(
@@ -95,7 +98,7 @@ async def preview_changes(
         total_lines = 0
 
         for artifact in artifacts:
-            lines = len(artifact.pure_code.split("\n"))
+            lines = artifact.pure_code.count("\n") + 1
             total_lines += lines
 
             artifact_preview = {
@@ -108,7 +111,7 @@ async def preview_changes(
                 artifact_preview["code"] = artifact.pure_code
             else:
                 # Show first 20 lines as preview
-                preview_lines = artifact.pure_code.split("\n")[:20]
+                preview_lines = artifact.pure_code.split("\n", 20)[:20]
                 artifact_preview["preview"] = "\n".join(preview_lines)
                 if lines > 20:
                     artifact_preview["preview"] += f"\n... ({lines - 20} more lines)"
@@ -222,7 +225,7 @@ async def validate_pure_code(
         })
 
     except Exception as e:
-        raise EngineError(f"Validation failed: {str(e)}")
+        raise EngineError(f"Validation failed: {e}") from e
 
 
 async def validate_model_completeness(ctx: MCPContext) -> str:
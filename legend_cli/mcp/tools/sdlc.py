@@ -6,144 +6,140 @@ management and entity operations.
 
 import json
 import logging
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
 from mcp.types import Tool
 
-from ..context import MCPContext
+from ..context import MCPContext, code_preview
 from ..errors import SDLCError, WorkspaceNotFoundError, ProjectNotFoundError, PartialPushError, EngineParseError
 
 logger = logging.getLogger(__name__)
 
 
-def get_tools() -> List[Tool]:
-    """Return all SDLC-related tools."""
-    return [
-        Tool(
-            name="list_projects",
-            description="List all Legend SDLC projects accessible to the current user.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="create_project",
-            description="Create a new Legend SDLC project. Use this when you need to create a new project for storing models. The project will be created with the specified name and optional description.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the project to create (e.g., 'SEC-FILINGS', 'Customer-Analytics')"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional description of the project"
-                    },
-                    "group_id": {
-                        "type": "string",
-                        "description": "Maven group ID for the project (default: 'org.demo.legend')",
-                        "default": "org.demo.legend"
-                    },
-                    "artifact_id": {
-                        "type": "string",
-                        "description": "Maven artifact ID (default: derived from project name)"
-                    }
+# Also used by the model modification tools, which address the same
+# SDLC workspaces
+_PROJECT_ID_SCHEMA = {
+    "type": "string",
+    "description": "Project ID"
+}
+_WORKSPACE_ID_SCHEMA = {
+    "type": "string",
+    "description": "Workspace ID"
+}
+
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="list_projects",
+        description="List all Legend SDLC projects accessible to the current user.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="create_project",
+        description="Create a new Legend SDLC project. Use this when you need to create a new project for storing models. The project will be created with the specified name and optional description.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name of the project to create (e.g., 'SEC-FILINGS', 'Customer-Analytics')"
                 },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="list_workspaces",
-            description="List all workspaces in a Legend SDLC project.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Optional description of the project"
                 },
-                "required": ["project_id"]
-            }
-        ),
-        Tool(
-            name="create_workspace",
-            description="Create a new workspace in a Legend SDLC project.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID to create"
-                    }
+                "group_id": {
+                    "type": "string",
+                    "description": "Maven group ID for the project (default: 'org.demo.legend')",
+                    "default": "org.demo.legend"
                 },
-                "required": ["project_id", "workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_workspace_entities",
-            description="Get all entities in a Legend SDLC workspace.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    }
+                "artifact_id": {
+                    "type": "string",
+                    "description": "Maven artifact ID (default: derived from project name)"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="list_workspaces",
+        description="List all workspaces in a Legend SDLC project.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA
+            },
+            "required": ["project_id"]
+        }
+    ),
+    Tool(
+        name="create_workspace",
+        description="Create a new workspace in a Legend SDLC project.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": {
+                    "type": "string",
+                    "description": "Workspace ID to create"
+                }
+            },
+            "required": ["project_id", "workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_workspace_entities",
+        description="Get all entities in a Legend SDLC workspace.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA
+            },
+            "required": ["project_id", "workspace_id"]
+        }
+    ),
+    Tool(
+        name="push_artifacts",
+        description="Push pending artifacts to Legend SDLC workspace. This performs an atomic batch push of all generated Pure code with optional verification and retry logic.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_SCHEMA,
+                "workspace_id": _WORKSPACE_ID_SCHEMA,
+                "commit_message": {
+                    "type": "string",
+                    "description": "Commit message for the change",
+                    "default": "Generated via Legend CLI MCP"
                 },
-                "required": ["project_id", "workspace_id"]
-            }
-        ),
-        Tool(
-            name="push_artifacts",
-            description="Push pending artifacts to Legend SDLC workspace. This performs an atomic batch push of all generated Pure code with optional verification and retry logic.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID"
-                    },
-                    "workspace_id": {
-                        "type": "string",
-                        "description": "Workspace ID"
-                    },
-                    "commit_message": {
-                        "type": "string",
-                        "description": "Commit message for the change",
-                        "default": "Generated via Legend CLI MCP"
-                    },
-                    "clear_pending": {
-                        "type": "boolean",
-                        "description": "Clear pending artifacts after push",
-                        "default": True
-                    },
-                    "verify_push": {
-                        "type": "boolean",
-                        "description": "Verify entities exist after push (default: true)",
-                        "default": True
-                    },
-                    "max_retries": {
-                        "type": "integer",
-                        "description": "Maximum retry attempts for transient failures (default: 3)",
-                        "default": 3
-                    }
+                "clear_pending": {
+                    "type": "boolean",
+                    "description": "Clear pending artifacts after push",
+                    "default": True
                 },
-                "required": ["project_id", "workspace_id"]
-            }
-        ),
-    ]
+                "verify_push": {
+                    "type": "boolean",
+                    "description": "Verify entities exist after push (default: true)",
+                    "default": True
+                },
+                "max_retries": {
+                    "type": "integer",
+                    "description": "Maximum retry attempts for transient failures (default: 3)",
+                    "default": 3
+                }
+            },
+            "required": ["project_id", "workspace_id"]
+        }
+    ),
+)
+
+
+def get_tools() -> List[Tool]:
+    """Return all SDLC-related tools."""
+    return list(_TOOLS)
 
 
 async def list_projects(ctx: MCPContext) -> str:
@@ -171,7 +167,7 @@ async def list_projects(ctx: MCPContext) -> str:
         })
 
     except Exception as e:
-        raise SDLCError(f"Failed to list projects: {str(e)}")
+        raise SDLCError(f"Failed to list projects: {e}") from e
 
 
 async def create_project(
@@ -218,7 +214,7 @@ async def create_project(
                 "name": name,
                 "message": f"Project '{name}' already exists. Use list_projects to find the existing project ID."
             })
-        raise SDLCError(f"Failed to create project: {error_str}")
+        raise SDLCError(f"Failed to create project: {error_str}") from e
 
 
 async def list_workspaces(ctx: MCPContext, project_id: str) -> str:
@@ -245,8 +241,8 @@ async def list_workspaces(ctx: MCPContext, project_id: str) -> str:
 
     except Exception as e:
         if "404" in str(e):
-            raise ProjectNotFoundError(project_id)
-        raise SDLCError(f"Failed to list workspaces: {str(e)}")
+            raise ProjectNotFoundError(project_id) from e
+        raise SDLCError(f"Failed to list workspaces: {e}") from e
 
 
 async def create_workspace(ctx: MCPContext, project_id: str, workspace_id: str) -> str:
@@ -270,7 +266,7 @@ async def create_workspace(ctx: MCPContext, project_id: str, workspace_id: str)
 
     except Exception as e:
         if "404" in str(e):
-            raise ProjectNotFoundError(project_id)
+            raise ProjectNotFoundError(project_id) from e
         if "409" in str(e) or "already exists" in str(e).lower():
             return json.dumps({
                 "status": "exists",
@@ -278,7 +274,7 @@ async def create_workspace(ctx: MCPContext, project_id: str, workspace_id: str)
                 "workspace_id": workspace_id,
                 "message": f"Workspace '{workspace_id}' already exists"
             })
-        raise SDLCError(f"Failed to create workspace: {str(e)}")
+        raise SDLCError(f"Failed to create workspace: {e}") from e
 
 
 async def get_workspace_entities(ctx: MCPContext, project_id: str, workspace_id: str) -> str:
@@ -309,8 +305,8 @@ async def get_workspace_entities(ctx: MCPContext, project_id: str, workspace_id:
 
     except Exception as e:
         if "404" in str(e):
-            raise WorkspaceNotFoundError(project_id, workspace_id)
-        raise SDLCError(f"Failed to get workspace entities: {str(e)}")
+            raise WorkspaceNotFoundError(project_id, workspace_id) from e
+        raise SDLCError(f"Failed to get workspace entities: {e}") from e
 
 
 def _validate_artifacts(ctx: MCPContext) -> dict:
@@ -474,9 +470,14 @@ async def push_artifacts(
             # Parse each artifact separately to track failures
             all_entities = []
             for artifact_type, code in pure_codes.items():
-                # Log artifact being parsed (truncated for readability)
-                code_preview = code[:200] + "..." if len(code) > 200 else code
-                logger.debug("Parsing artifact '%s': %s", artifact_type, code_preview.replace('\n', '\\n'))
+                # Log artifact being parsed (truncated for readability); the
+                # preview is only built when debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Parsing artifact '%s': %s",
+                        artifact_type,
+                        code_preview(code, 200).replace('\n', '\\n'),
+                    )
 
                 try:
                     entities = engine.parse_pure_code(code)
@@ -644,5 +645,5 @@ async def push_artifacts(
 
     except Exception as e:
         if "404" in str(e):
-            raise WorkspaceNotFoundError(project_id, workspace_id)
-        raise SDLCError(f"Failed to push artifacts: {str(e)}")
+            raise WorkspaceNotFoundError(project_id, workspace_id) from e
+        raise SDLCError(f"Failed to push artifacts: {e}") from e
@@ -0,0 +1,61 @@
+"""Base class for the on-disk pickle caches under ~/.legend-cli."""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PickleCache:
+    """Values pickled to disk, one file per cache key.
+
+    Subclasses set dir_name, the default directory under ~/.legend-cli,
+    and wrap _read/_write with typed load/save methods. Writes go to a
+    temporary file that is renamed over the entry, so readers never see
+    a partial file. Read and write errors are logged and treated as a
+    miss, so a broken cache only costs speed.
+    """
+
+    dir_name: str = "cache"
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files. If None, uses
+                ~/.legend-cli/<dir_name>.
+        """
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir else Path.home() / ".legend-cli" / self.dir_name
+        )
+
+    def _path(self, key: Tuple) -> Path:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+        return self.cache_dir / f"{name}.pickle"
+
+    def _read(self, key: Tuple) -> Optional[Any]:
+        """Return the value stored under key, or None if missing or unreadable."""
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable %s entry: %s", self.dir_name, e)
+            return None
+
+    def _write(self, key: Tuple, value: Any) -> None:
+        """Store value under key, replacing any earlier entry."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Failed to write %s entry: %s", self.dir_name, e)
@@ -7,6 +7,7 @@ Extends the base PureCodeGenerator to support:
 - Derived properties
 """
 
+import re
 from typing import Any, Dict, List, Optional, Set
 
 from legend_cli.analysis.models import (
@@ -19,6 +20,11 @@ from legend_cli.analysis.models import (
 from legend_cli.database.models import Database, Table
 from legend_cli.pure.generator import PureCodeGenerator
 
+# Compiled once at import; the generator applies these for every enum,
+# constraint and derived property it renders
+_CAMEL_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+_IF_CALL_RE = re.compile(r'if\([^)]+(?:\([^)]*\)[^)]*)*\)')
+
 
 class EnhancedPureCodeGenerator(PureCodeGenerator):
     """Extended generator that produces Pure code with advanced features.
@@ -61,11 +67,8 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
         if not self.spec:
             return
 
-        # Get table class names to filter out conflicting enums
-        table_class_names = set()
-        for schema in self.database.schemas:
-            for table in schema.tables:
-                table_class_names.add(table.get_class_name())
+        # Enums named like a table class would conflict with it
+        table_class_names = self.table_class_names
 
         # Build inheritance map
         for hierarchy in self.spec.hierarchies:
@@ -97,8 +100,7 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
     @staticmethod
     def _camel_to_upper_snake_static(name: str) -> str:
         """Convert CamelCase to UPPER_SNAKE_CASE (static version)."""
-        import re
-        result = re.sub(r'(?<!^)(?=[A-Z])', '_', name)
+        result = _CAMEL_BOUNDARY_RE.sub('_', name)
         return result.upper()
 
         # Build constraints map
@@ -122,11 +124,8 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
         if not self.spec or not self.spec.enumerations:
             return ""
 
-        # Get all table class names to avoid conflicts
-        table_class_names = set()
-        for schema in self.database.schemas:
-            for table in schema.tables:
-                table_class_names.add(table.get_class_name())
+        # Table class names, to avoid conflicts
+        table_class_names = self.table_class_names
 
         enum_defs = ["###Pure"]
 
@@ -428,7 +427,7 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
 
     def _is_table_class(self, class_name: str) -> bool:
         """Check if a class name corresponds to an actual table."""
-        return class_name in self.table_to_class.values()
+        return class_name in self.table_class_names
 
     def _sanitize_enum_value(self, value: str) -> str:
         """Sanitize a value for use as Pure enum value.
@@ -464,9 +463,8 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
 
         E.g., OrderType -> ORDER_TYPE, TradeSide -> TRADE_SIDE
         """
-        import re
         # Insert underscore before uppercase letters (except first)
-        result = re.sub(r'(?<!^)(?=[A-Z])', '_', name)
+        result = _CAMEL_BOUNDARY_RE.sub('_', name)
         return result.upper()
 
     def _sanitize_pure_expression(self, expression: str) -> str:
@@ -478,13 +476,8 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
         Returns:
             Sanitized expression with valid Pure syntax
         """
-        import re
-
-        result = expression
-
         # Fix %now() -> now() (% is for date literals, not function calls)
-        result = re.sub(r'%now\(\)', 'now()', result)
-        result = re.sub(r'%today\(\)', 'today()', result)
+        result = expression.replace('%now()', 'now()').replace('%today()', 'today()')
 
         # Fix if() syntax - add lambda markers (|) to then/else branches
         # Pattern: if(condition, thenExpr, elseExpr)
@@ -521,7 +514,7 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
             return full_match
 
         # Fix if() calls - find balanced parentheses
-        result = re.sub(r'if\([^)]+(?:\([^)]*\)[^)]*)*\)', fix_if_syntax, result)
+        result = _IF_CALL_RE.sub(fix_if_syntax, result)
 
         # Remove any trailing semicolons (should not be in the expression itself)
         result = result.rstrip(';').strip()
@@ -539,10 +532,7 @@ class EnhancedPureCodeGenerator(PureCodeGenerator):
         lines.append("(")
 
         # Get valid enums (those that don't conflict with table class names)
-        table_class_names = set()
-        for schema in self.database.schemas:
-            for table in schema.tables:
-                table_class_names.add(table.get_class_name())
+        table_class_names = self.table_class_names
 
         valid_enums = []
         if self.spec and self.spec.enumerations:
@@ -2,7 +2,7 @@
 
 from typing import Optional, List, Dict, Any
 
-from ..database.models import Database
+from ..database.models import Database, Table
 
 
 class PureCodeGenerator:
@@ -15,6 +15,7 @@ class PureCodeGenerator:
         self.table_to_class = {}
         for table in database.get_all_tables():
             self.table_to_class[table.name] = table.get_class_name()
+        self.table_class_names = set(self.table_to_class.values())
 
     def generate_store(self) -> str:
         """Generate Pure store definition."""
@@ -27,15 +28,7 @@ class PureCodeGenerator:
             lines.append("  (")
 
             for table in schema.tables:
-                lines.append(f"    Table {table.name}")
-                lines.append("    (")
-
-                col_lines = []
-                for col in table.columns:
-                    col_lines.append(f"      {col.name} {col.to_pure_type()}")
-
-                lines.append(",\n".join(col_lines))
-                lines.append("    )")
+                lines.extend(self._store_table_lines(table))
 
             lines.append("  )")
 
@@ -53,44 +46,103 @@ class PureCodeGenerator:
 
         for schema in self.database.schemas:
             for table in schema.tables:
-                class_name = table.get_class_name()
-
-                # Get class documentation if available
-                class_doc = ""
-                attr_docs = {}
-                if docs and class_name in docs:
-                    class_doc_obj = docs[class_name]
-                    class_doc = getattr(class_doc_obj, 'class_doc', '') or ''
-                    attr_docs = {k: getattr(v, 'doc', '') for k, v in getattr(class_doc_obj, 'attributes', {}).items()}
-
-                # Class declaration with optional doc.doc
-                if class_doc:
-                    escaped_doc = self._escape_doc_string(class_doc)
-                    lines = [f"Class {{meta::pure::profiles::doc.doc = '{escaped_doc}'}} {self.package_prefix}::domain::{class_name}"]
-                else:
-                    lines = [f"Class {self.package_prefix}::domain::{class_name}"]
-
-                lines.append("{")
-
-                # Regular properties only (no association properties)
-                for col in table.columns:
-                    prop_name = table.get_property_name(col.name)
-                    prop_type = col.to_pure_property_type()
-                    multiplicity = "[0..1]" if col.is_nullable else "[1]"
-
-                    # Property with optional doc.doc
-                    prop_doc = attr_docs.get(prop_name, '')
-                    if prop_doc:
-                        escaped_prop_doc = self._escape_doc_string(prop_doc)
-                        lines.append(f"  {{meta::pure::profiles::doc.doc = '{escaped_prop_doc}'}} {prop_name}: {prop_type}{multiplicity};")
-                    else:
-                        lines.append(f"  {prop_name}: {prop_type}{multiplicity};")
-
-                lines.append("}")
-                class_defs.append("\n".join(lines))
+                class_defs.append(self._class_block(
+                    table,
+                    table.get_class_name(),
+                    self._property_names(table),
+                    docs,
+                ))
 
         return "\n\n".join(class_defs)
 
+    def _property_names(self, table: Table) -> List[str]:
+        """Property names for a table's columns, in column order."""
+        get_property_name = table.get_property_name
+        return [get_property_name(col.name) for col in table.columns]
+
+    def _store_table_lines(self, table: Table) -> List[str]:
+        """Store lines declaring one table and its columns."""
+        return [
+            f"    Table {table.name}",
+            "    (",
+            ",\n".join(f"      {col.name} {col.to_pure_type()}" for col in table.columns),
+            "    )",
+        ]
+
+    def _class_block(
+        self,
+        table: Table,
+        class_name: str,
+        prop_names: List[str],
+        docs: Optional[Dict[str, Any]],
+    ) -> str:
+        """Render the Pure class for one table."""
+        # Get class documentation if available
+        class_doc = ""
+        attr_docs = {}
+        if docs and class_name in docs:
+            class_doc_obj = docs[class_name]
+            class_doc = getattr(class_doc_obj, 'class_doc', '') or ''
+            attr_docs = {k: getattr(v, 'doc', '') for k, v in getattr(class_doc_obj, 'attributes', {}).items()}
+
+        # Class declaration with optional doc.doc
+        if class_doc:
+            escaped_doc = self._escape_doc_string(class_doc)
+            lines = [f"Class {{meta::pure::profiles::doc.doc = '{escaped_doc}'}} {self.package_prefix}::domain::{class_name}"]
+        else:
+            lines = [f"Class {self.package_prefix}::domain::{class_name}"]
+
+        lines.append("{")
+
+        # Regular properties only (no association properties)
+        for col, prop_name in zip(table.columns, prop_names):
+            prop_type = col.to_pure_property_type()
+            multiplicity = "[0..1]" if col.is_nullable else "[1]"
+
+            # Property with optional doc.doc
+            prop_doc = attr_docs.get(prop_name, '')
+            if prop_doc:
+                escaped_prop_doc = self._escape_doc_string(prop_doc)
+                lines.append(f"  {{meta::pure::profiles::doc.doc = '{escaped_prop_doc}'}} {prop_name}: {prop_type}{multiplicity};")
+            else:
+                lines.append(f"  {prop_name}: {prop_type}{multiplicity};")
+
+        lines.append("}")
+        return "\n".join(lines)
+
+    def _mapping_block(
+        self,
+        schema_name: str,
+        table: Table,
+        class_name: str,
+        prop_names: List[str],
+    ) -> str:
+        """Render the class mapping for one table."""
+        class_path = f"{self.package_prefix}::domain::{class_name}"
+        table_path = f"[{self.package_prefix}::store::{self.database.name}]{schema_name}.{table.name}"
+
+        block_lines = [f"  {class_path}: Relational"]
+        block_lines.append("  {")
+
+        # Primary key
+        if table.columns:
+            pk_col = table.primary_key_columns[0] if table.primary_key_columns else table.columns[0].name
+            block_lines.append("    ~primaryKey")
+            block_lines.append("    (")
+            block_lines.append(f"      {table_path}.{pk_col}")
+            block_lines.append("    )")
+
+        block_lines.append(f"    ~mainTable {table_path}")
+
+        # Property mappings only (no association mappings here)
+        block_lines.append(",\n".join(
+            f"    {prop_name}: {table_path}.{col.name}"
+            for col, prop_name in zip(table.columns, prop_names)
+        ))
+        block_lines.append("  }")
+
+        return "\n".join(block_lines)
+
     def _escape_doc_string(self, doc: str) -> str:
         """Escape a documentation string for use in Pure code.
 
@@ -154,67 +206,17 @@ class PureCodeGenerator:
         mapping_blocks = []
         for schema in self.database.schemas:
             for table in schema.tables:
-                class_name = table.get_class_name()
-                class_path = f"{self.package_prefix}::domain::{class_name}"
-                store_path = f"{self.package_prefix}::store::{self.database.name}"
-
-                block_lines = [f"  {class_path}: Relational"]
-                block_lines.append("  {")
-
-                # Primary key
-                if table.columns:
-                    pk_col = table.primary_key_columns[0] if table.primary_key_columns else table.columns[0].name
-                    block_lines.append("    ~primaryKey")
-                    block_lines.append("    (")
-                    block_lines.append(f"      [{store_path}]{schema.name}.{table.name}.{pk_col}")
-                    block_lines.append("    )")
-
-                block_lines.append(f"    ~mainTable [{store_path}]{schema.name}.{table.name}")
-
-                # Property mappings only (no association mappings here)
-                prop_mappings = []
-                for col in table.columns:
-                    prop_name = table.get_property_name(col.name)
-                    prop_mappings.append(
-                        f"    {prop_name}: [{store_path}]{schema.name}.{table.name}.{col.name}"
-                    )
-
-                block_lines.append(",\n".join(prop_mappings))
-                block_lines.append("  }")
-
-                mapping_blocks.append("\n".join(block_lines))
+                mapping_blocks.append(self._mapping_block(
+                    schema.name,
+                    table,
+                    table.get_class_name(),
+                    self._property_names(table),
+                ))
 
         lines.append("\n".join(mapping_blocks))
 
         # Add association mappings
-        if self.database.relationships:
-            lines.append("")
-            seen_associations = set()
-            for rel in self.database.relationships:
-                source_class = self.table_to_class.get(rel.source_table)
-                target_class = self.table_to_class.get(rel.target_table)
-
-                if not source_class or not target_class:
-                    continue
-
-                # Create a unique key for this association
-                assoc_key = (source_class, target_class, rel.property_name)
-                if assoc_key in seen_associations:
-                    continue
-                seen_associations.add(assoc_key)
-
-                assoc_name = f"{source_class}_{target_class}_{rel.property_name}"
-                assoc_path = f"{self.package_prefix}::domain::{assoc_name}"
-                store_path = f"{self.package_prefix}::store::{self.database.name}"
-                join_name = f"{rel.source_table}_{rel.target_table}"
-
-                lines.append(f"  {assoc_path}: Relational")
-                lines.append("  {")
-                lines.append(f"    AssociationMapping")
-                lines.append("    (")
-                lines.append(f"      {rel.property_name}: [{store_path}]@{join_name}")
-                lines.append("    )")
-                lines.append("  }")
+        lines.extend(self._association_mapping_lines())
 
         lines.append(")")
         return "\n".join(lines)
@@ -230,31 +232,71 @@ class PureCodeGenerator:
             lines.append("  (")
 
             for table in schema.tables:
-                lines.append(f"    Table {table.name}")
-                lines.append("    (")
-
-                col_lines = []
-                for col in table.columns:
-                    col_lines.append(f"      {col.name} {col.to_pure_type()}")
-
-                lines.append(",\n".join(col_lines))
-                lines.append("    )")
+                lines.extend(self._store_table_lines(table))
 
             lines.append("  )")
 
         # Add Join definitions
-        if self.database.relationships:
-            lines.append("")
-            for rel in self.database.relationships:
-                source_table = self.database.get_table_by_name(rel.source_table)
-                target_table = self.database.get_table_by_name(rel.target_table)
-                if source_table and target_table:
-                    join_name = f"{rel.source_table}_{rel.target_table}"
-                    lines.append(f"  Join {join_name}({source_table.schema}.{rel.source_table}.{rel.source_column} = {target_table.schema}.{rel.target_table}.{rel.target_column})")
+        lines.extend(self._join_lines())
 
         lines.append(")")
         return "\n".join(lines)
 
+    def _association_mapping_lines(self) -> List[str]:
+        """Mapping lines for each distinct association, after the class mappings."""
+        if not self.database.relationships:
+            return []
+
+        lines = [""]
+        store_path = f"{self.package_prefix}::store::{self.database.name}"
+        seen_associations = set()
+        for rel in self.database.relationships:
+            source_class = self.table_to_class.get(rel.source_table)
+            target_class = self.table_to_class.get(rel.target_table)
+
+            if not source_class or not target_class:
+                continue
+
+            # Create a unique key for this association
+            assoc_key = (source_class, target_class, rel.property_name)
+            if assoc_key in seen_associations:
+                continue
+            seen_associations.add(assoc_key)
+
+            assoc_name = f"{source_class}_{target_class}_{rel.property_name}"
+            assoc_path = f"{self.package_prefix}::domain::{assoc_name}"
+            join_name = f"{rel.source_table}_{rel.target_table}"
+
+            lines.append(f"  {assoc_path}: Relational")
+            lines.append("  {")
+            lines.append(f"    AssociationMapping")
+            lines.append("    (")
+            lines.append(f"      {rel.property_name}: [{store_path}]@{join_name}")
+            lines.append("    )")
+            lines.append("  }")
+        return lines
+
+    def _join_lines(self) -> List[str]:
+        """Store lines defining a join per relationship between known tables."""
+        if not self.database.relationships:
+            return []
+
+        # First table per name, as Database.get_table_by_name would find it,
+        # without rescanning every schema for each relationship
+        tables_by_name: Dict[str, Table] = {}
+        for schema in self.database.schemas:
+            for table in schema.tables:
+                tables_by_name.setdefault(table.name, table)
+
+        lines = [""]
+        for rel in self.database.relationships:
+            source_table = tables_by_name.get(rel.source_table)
+            target_table = tables_by_name.get(rel.target_table)
+            if source_table and target_table:
+                join_name = f"{rel.source_table}_{rel.target_table}"
+                lines.append(f"  Join {join_name}({source_table.schema}.{rel.source_table}.{rel.source_column} = {target_table.schema}.{rel.target_table}.{rel.target_column})")
+        return lines
+
     def generate_runtime(self) -> str:
         """Generate Pure runtime definition."""
         lines = ["###Runtime"]
@@ -288,11 +330,43 @@ class PureCodeGenerator:
         Returns:
             Dictionary with keys: store, classes, connection, mapping, runtime, (optional) associations
         """
+        prefix = self.package_prefix
+        db_name = self.database.name
+        store_lines = ["###Relational", f"Database {prefix}::store::{db_name}", "("]
+        class_defs = ["###Pure"]
+        mapping_blocks = []
+
+        # One walk over the tables feeds the store, classes and mapping;
+        # each table's class and property names are derived once for both
+        # the class and its mapping
+        for schema in self.database.schemas:
+            store_lines.append(f"  Schema {schema.name}")
+            store_lines.append("  (")
+            for table in schema.tables:
+                class_name = table.get_class_name()
+                prop_names = self._property_names(table)
+                store_lines.extend(self._store_table_lines(table))
+                class_defs.append(self._class_block(table, class_name, prop_names, docs))
+                mapping_blocks.append(self._mapping_block(schema.name, table, class_name, prop_names))
+            store_lines.append("  )")
+
+        store_lines.extend(self._join_lines())
+        store_lines.append(")")
+
+        mapping_lines = [
+            "###Mapping",
+            f"Mapping {prefix}::mapping::{db_name}Mapping",
+            "(",
+            "\n".join(mapping_blocks),
+        ]
+        mapping_lines.extend(self._association_mapping_lines())
+        mapping_lines.append(")")
+
         artifacts = {
-            "store": self.generate_store_with_joins(),
-            "classes": self.generate_classes(docs=docs),
+            "store": "\n".join(store_lines),
+            "classes": "\n\n".join(class_defs),
             "connection": connection_code,
-            "mapping": self.generate_mapping(),
+            "mapping": "\n".join(mapping_lines),
             "runtime": self.generate_runtime(),
         }
 
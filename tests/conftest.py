@@ -7,6 +7,26 @@ from legend_cli.mcp.context import MCPContext, PendingArtifact
 from legend_cli.database.models import Database, Schema, Table, Column
 
 
+@pytest.fixture(autouse=True)
+def schema_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk schema cache inside the test's temp directory."""
+    from legend_cli.config import settings
+
+    cache_dir = tmp_path / "schema_cache"
+    monkeypatch.setattr(settings, "schema_cache_dir", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def analysis_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk analysis cache inside the test's temp directory."""
+    from legend_cli.config import settings
+
+    cache_dir = tmp_path / "analysis_cache"
+    monkeypatch.setattr(settings, "analysis_cache_dir", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def mcp_context():
     """Create a fresh MCPContext for each test."""
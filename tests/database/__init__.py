@@ -0,0 +1 @@
+"""Database introspection tests package."""
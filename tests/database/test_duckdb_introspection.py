@@ -0,0 +1,130 @@
+"""Tests for DuckDB schema introspection."""
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from legend_cli.database.duckdb import DuckDBIntrospector
+
+
+@pytest.fixture
+def duckdb_path(tmp_path):
+    """Create a DuckDB file with a few related tables."""
+    path = str(tmp_path / "shop.duckdb")
+    conn = duckdb.connect(path)
+    conn.execute("CREATE TABLE customer (id INTEGER PRIMARY KEY, name VARCHAR)")
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, customer_id INTEGER, "
+        "total DECIMAL(10,2), status VARCHAR)"
+    )
+    for i in range(10):
+        conn.execute(f"CREATE TABLE extra_{i} (id INTEGER PRIMARY KEY, label VARCHAR)")
+    conn.close()
+    return path
+
+
+class TestIntrospectDatabase:
+    """Test sync and async full-database introspection."""
+
+    def test_sync_introspection(self, duckdb_path):
+        """Test tables, columns and primary keys are introspected."""
+        with DuckDBIntrospector(database_path=duckdb_path) as introspector:
+            db = introspector.introspect_database()
+
+        assert db.name == "shop"
+        assert [s.name for s in db.schemas] == ["main"]
+        orders = db.get_table_by_name("orders")
+        assert [c.name for c in orders.columns] == ["id", "customer_id", "total", "status"]
+        assert orders.primary_key_columns == ["id"]
+
+    async def test_async_matches_sync(self, duckdb_path):
+        """Test concurrent introspection produces the same model as sequential."""
+        with DuckDBIntrospector(database_path=duckdb_path) as introspector:
+            expected = introspector.introspect_database()
+            actual = await introspector.introspect_database_async()
+
+        assert actual == expected
+        assert len(actual.get_all_tables()) == 12
+
+    async def test_async_schema_filter(self, duckdb_path):
+        """Test schema filter keeps only the matching schema."""
+        with DuckDBIntrospector(database_path=duckdb_path) as introspector:
+            db = await introspector.introspect_database_async(schema_filter="main")
+
+        assert [s.name for s in db.schemas] == ["main"]
+        assert len(db.schemas[0].tables) == 12
+
+
+class TestColumnListing:
+    """Test the bulk column listing used to validate cached schemas."""
+
+    def test_matches_generic_listing(self, duckdb_path):
+        """Test the bulk queries list the same columns as per-table introspection."""
+        from legend_cli.database.base import DatabaseIntrospector
+
+        with DuckDBIntrospector(database_path=duckdb_path) as introspector:
+            listing = introspector.get_column_listing()
+            generic = DatabaseIntrospector.get_column_listing(introspector, None)
+
+        assert listing == generic
+        assert ("main", "orders", "id", "INTEGER", False, True) in listing
+        assert ("main", "orders", "total", "DECIMAL(10,2)", True, False) in listing
+
+
+class TestDistinctValues:
+    """Test fetching distinct column values for enum detection."""
+
+    def test_multi_matches_single_column_fetches(self, tmp_path):
+        """Test one combined query returns each column's values, limited per column."""
+        path = str(tmp_path / "values.duckdb")
+        conn = duckdb.connect(path)
+        conn.execute("CREATE TABLE t AS SELECT 'S' || (i % 5) AS status, i % 3 AS code, "
+                     "CAST(NULL AS VARCHAR) AS empty FROM range(100) r(i)")
+        conn.close()
+
+        with DuckDBIntrospector(database_path=path) as introspector:
+            values = introspector.get_distinct_values_multi(
+                "main", "t", ["status", "code", "empty"], limit=4,
+            )
+            expected = {
+                c: sorted(introspector.get_distinct_values("main", "t", c, limit=50))
+                for c in ("status", "code", "empty")
+            }
+
+        assert len(values["status"]) == 4
+        assert set(values["status"]) <= set(expected["status"])
+        assert sorted(values["code"]) == expected["code"] == ["0", "1", "2"]
+        assert values["empty"] == []
+
+    def test_multi_formats_values_like_single_column(self, tmp_path):
+        """Test non-text values are converted to strings the same way in both paths."""
+        path = str(tmp_path / "typed.duckdb")
+        conn = duckdb.connect(path)
+        conn.execute("CREATE TABLE t AS SELECT i % 2 = 0 AS flag, "
+                     "CAST(i AS DECIMAL(4,2)) AS amount, "
+                     "DATE '2024-01-01' + CAST(i AS INTEGER) AS day FROM range(3) r(i)")
+        conn.close()
+
+        with DuckDBIntrospector(database_path=path) as introspector:
+            values = introspector.get_distinct_values_multi("main", "t", ["flag", "amount", "day"])
+            expected = {
+                c: introspector.get_distinct_values("main", "t", c)
+                for c in ("flag", "amount", "day")
+            }
+
+        assert {c: sorted(v) for c, v in values.items()} == {c: sorted(v) for c, v in expected.items()}
+        assert sorted(values["flag"]) == ["False", "True"]
+
+    def test_multi_falls_back_per_column(self, duckdb_path):
+        """Test a missing column costs only that column's values."""
+        conn = duckdb.connect(duckdb_path)
+        conn.execute("INSERT INTO orders VALUES (1, 1, 9.5, 'OPEN'), (2, 1, 3.0, 'SHIPPED')")
+        conn.close()
+
+        with DuckDBIntrospector(database_path=duckdb_path) as introspector:
+            values = introspector.get_distinct_values_multi(
+                "main", "orders", ["status", "missing"],
+            )
+
+        assert sorted(values["status"]) == ["OPEN", "SHIPPED"]
+        assert values["missing"] == []
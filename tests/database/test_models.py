@@ -0,0 +1,108 @@
+"""Tests for database model type mapping."""
+
+from legend_cli.database.models import Column, Database, Relationship, Schema, Table
+from legend_cli.database.type_mappers import DuckDBTypeMapper
+
+
+class TestColumnPropertyType:
+    """Test Column.to_pure_property_type mapping."""
+
+    def test_default_mapping(self):
+        """Test mapping without a type mapper uses the default rules."""
+        assert Column(name="id", data_type="INTEGER").to_pure_property_type() == "Integer"
+        assert Column(name="total", data_type="NUMBER(10,2)").to_pure_property_type() == "Float"
+        assert Column(name="name", data_type="VARCHAR(50)").to_pure_property_type() == "String"
+
+    def test_type_mapper_mapping(self):
+        """Test mapping delegates to the column's type mapper."""
+        mapper = DuckDBTypeMapper()
+        col = Column(name="flag", data_type="BOOLEAN", _type_mapper=mapper)
+
+        assert col.to_pure_property_type() == mapper.to_pure_property_type("BOOLEAN")
+
+    def test_repeated_types_share_result(self):
+        """Test columns of the same type map to the same result."""
+        first = Column(name="a", data_type="TIMESTAMP").to_pure_property_type()
+        second = Column(name="b", data_type="TIMESTAMP").to_pure_property_type()
+
+        assert first == second == "DateTime"
+
+
+class TestColumnType:
+    """Test Column.to_pure_type mapping."""
+
+    def test_default_mapping(self):
+        """Test mapping without a type mapper uses the default rules."""
+        assert Column(name="id", data_type="INTEGER").to_pure_type() == "INTEGER"
+        assert Column(name="name", data_type="varchar(50)").to_pure_type() == "VARCHAR(50)"
+        assert Column(name="at", data_type="TIME").to_pure_type() == "TIMESTAMP"
+
+    def test_type_mapper_mapping(self):
+        """Test mapping delegates to the column's type mapper."""
+        mapper = DuckDBTypeMapper()
+        col = Column(name="flag", data_type="BOOLEAN", _type_mapper=mapper)
+
+        assert col.to_pure_type() == mapper.to_pure_column_type("BOOLEAN")
+
+
+class TestTableNames:
+    """Test Table class and property name conversion."""
+
+    def test_class_and_property_names(self):
+        """Test snake case names convert to Pascal and camel case."""
+        table = Table(name="ORDER_LINE_ITEMS", schema="main")
+
+        assert table.get_class_name() == "OrderLineItems"
+        assert table.get_property_name("CUSTOMER_ID") == "customerId"
+        assert table.get_property_name("id") == "id"
+
+
+class TestRelationshipKeys:
+    """Test precomputed Relationship endpoint labels."""
+
+    def test_endpoint_keys(self):
+        """Test source and target keys combine table and column names."""
+        rel = Relationship(
+            source_table="ORDERS",
+            source_column="CUSTOMER_ID",
+            target_table="CUSTOMER",
+            target_column="ID",
+            relationship_type="many_to_one",
+            property_name="customer",
+        )
+
+        assert rel.source_key == "ORDERS.CUSTOMER_ID"
+        assert rel.target_key == "CUSTOMER.ID"
+
+
+class TestDatabaseFingerprint:
+    """Test the schema fingerprint used to cache generated code."""
+
+    def _database(self):
+        return Database(
+            name="DB",
+            schemas=[Schema(name="main", tables=[
+                Table(name="T", schema="main", columns=[Column(name="ID", data_type="INT")]),
+            ])],
+        )
+
+    def test_equal_schemas_share_fingerprint(self):
+        """Test independently built identical schemas hash the same."""
+        assert self._database().fingerprint() == self._database().fingerprint()
+
+    def test_changes_alter_fingerprint(self):
+        """Test renames, column changes and relationships change the hash."""
+        db = self._database()
+        seen = {db.fingerprint()}
+
+        db.name = "Db"
+        seen.add(db.fingerprint())
+        db.schemas[0].tables[0].columns[0].data_type = "BIGINT"
+        seen.add(db.fingerprint())
+        db.relationships.append(Relationship(
+            source_table="T", source_column="ID", target_table="T",
+            target_column="ID", relationship_type="one_to_one", property_name="self",
+        ))
+        seen.add(db.fingerprint())
+
+        assert len(seen) == 4
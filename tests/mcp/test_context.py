@@ -1,15 +1,31 @@
 """Tests for MCP context management."""
 
+import asyncio
+
 import pytest
 from legend_cli.mcp.context import (
     MCPContext,
     PendingArtifact,
     DatabaseConnection,
     DatabaseType,
+    IntrospectorPool,
+    code_preview,
+    code_summary,
+    parse_db_type,
     sanitize_pure_identifier,
 )
 
 
+class _FakeIntrospector:
+    """Minimal introspector stand-in that records close() calls."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
 class TestMCPContextCreation:
     """Test MCPContext initialization."""
 
@@ -57,6 +73,23 @@ class TestPendingArtifacts:
 
         assert len(mcp_context.pending_artifacts) == 3
 
+    def test_add_pending_artifacts_bulk(self, mcp_context):
+        """Test adding a dict of artifacts keeps their order."""
+        mcp_context.add_pending_artifact(artifact_type="connection", pure_code="conn code")
+        mcp_context.add_pending_artifacts({"store": "store code", "classes": "class code"})
+
+        assert [a.artifact_type for a in mcp_context.pending_artifacts] == ["connection", "store", "classes"]
+        assert mcp_context.pending_artifacts[2].pure_code == "class code"
+
+    def test_set_pending_artifacts(self, mcp_context):
+        """Test setting artifacts replaces the list contents in place."""
+        pending = mcp_context.pending_artifacts
+        mcp_context.add_pending_artifact(artifact_type="connection", pure_code="old")
+        mcp_context.set_pending_artifacts({"store": "store code", "classes": "class code"})
+
+        assert mcp_context.pending_artifacts is pending
+        assert [a.artifact_type for a in pending] == ["store", "classes"]
+
     def test_clear_pending_artifacts(self, mcp_context):
         """Test clearing pending artifacts."""
         mcp_context.add_pending_artifact(artifact_type="store", pure_code="code")
@@ -223,6 +256,49 @@ class TestPendingArtifactDataclass:
         assert artifact.path == "model::domain::User"
         assert artifact.classifier_path == "meta::pure::metamodel::type::Class"
 
+    def test_preview_short_code(self):
+        """Test preview returns short code unchanged."""
+        artifact = PendingArtifact(artifact_type="store", pure_code="short code")
+
+        assert artifact.preview == "short code"
+
+    def test_preview_truncates_long_code(self):
+        """Test preview truncates code longer than 200 characters."""
+        artifact = PendingArtifact(artifact_type="store", pure_code="x" * 250)
+
+        assert artifact.preview == "x" * 200 + "..."
+
+
+class TestParseDbType:
+    """Test db_type argument parsing."""
+
+    def test_case_insensitive(self):
+        """Test any casing maps to the enum member."""
+        assert parse_db_type("Snowflake") is DatabaseType.SNOWFLAKE
+        assert parse_db_type("DUCKDB") is DatabaseType.DUCKDB
+
+    def test_unsupported_type(self):
+        """Test unknown types raise ValueError every time."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="supported: snowflake, duckdb"):
+                parse_db_type("oracle")
+
+
+class TestCodePreview:
+    """Test code preview truncation."""
+
+    def test_short_code_unchanged(self):
+        """Test code within the limit is returned as is."""
+        assert code_preview("abc", 3) == "abc"
+
+    def test_long_code_truncated(self):
+        """Test code over the limit is cut and marked."""
+        assert code_preview("abcd", 3) == "abc..."
+
+    def test_summary(self):
+        """Test summaries pair the line count with the preview."""
+        assert code_summary("a\nb\nc", 3) == {"lines": 3, "preview": "a\nb..."}
+
 
 class TestDatabaseConnectionDataclass:
     """Test DatabaseConnection dataclass."""
@@ -249,3 +325,86 @@ class TestDatabaseConnectionDataclass:
         )
 
         assert conn.db_type == DatabaseType.SNOWFLAKE
+
+
+class TestIntrospectorPool:
+    """Test pooled introspectors for a connection."""
+
+    async def test_reuses_seed_introspector(self):
+        """Test sequential acquires reuse the seeded introspector."""
+        seed = _FakeIntrospector()
+        pool = IntrospectorPool(_FakeIntrospector, size=2, initial=seed)
+
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            pass
+
+        assert first is seed
+        assert second is seed
+
+    async def test_creates_at_most_size_introspectors(self):
+        """Test concurrent acquires never exceed the pool size."""
+        created = []
+
+        def factory():
+            introspector = _FakeIntrospector()
+            created.append(introspector)
+            return introspector
+
+        pool = IntrospectorPool(factory, size=2)
+        in_use = 0
+        peak = 0
+
+        async def borrow():
+            nonlocal in_use, peak
+            async with pool.acquire():
+                in_use += 1
+                peak = max(peak, in_use)
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        await asyncio.gather(*(borrow() for _ in range(6)))
+
+        assert len(created) == 2
+        assert peak == 2
+
+    async def test_close_closes_all_introspectors(self):
+        """Test closing the pool closes every introspector it created."""
+        seed = _FakeIntrospector()
+        pool = IntrospectorPool(_FakeIntrospector, size=2, initial=seed)
+
+        async def borrow():
+            async with pool.acquire() as introspector:
+                await asyncio.sleep(0.01)
+                return introspector
+
+        borrowed = await asyncio.gather(borrow(), borrow())
+        pool.close()
+
+        assert all(i.closed for i in borrowed)
+
+    async def test_connection_without_pool_yields_introspector(self):
+        """Test acquire falls back to the connection's own introspector."""
+        introspector = _FakeIntrospector()
+        conn = DatabaseConnection(
+            db_type=DatabaseType.DUCKDB,
+            database_name="test.db",
+            introspector=introspector,
+        )
+
+        async with conn.acquire() as borrowed:
+            assert borrowed is introspector
+
+    def test_remove_connection_closes_pool(self, mcp_context):
+        """Test removing a pooled connection closes its introspectors."""
+        seed = _FakeIntrospector()
+        mcp_context.add_connection(
+            db_type=DatabaseType.DUCKDB,
+            database="test.db",
+            introspector=seed,
+            introspector_factory=_FakeIntrospector,
+        )
+
+        assert mcp_context.remove_connection(DatabaseType.DUCKDB, "test.db")
+        assert seed.closed
@@ -0,0 +1,197 @@
+"""Tests for database MCP tools against a local DuckDB file."""
+
+import json
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from legend_cli.mcp.context import DatabaseType
+from legend_cli.mcp.tools import database
+
+
+@pytest.fixture
+def duckdb_path(tmp_path):
+    """Create a DuckDB file with customers and orders."""
+    path = str(tmp_path / "shop.duckdb")
+    conn = duckdb.connect(path)
+    conn.execute("CREATE TABLE CUSTOMER (ID INTEGER PRIMARY KEY, NAME VARCHAR)")
+    conn.execute(
+        "CREATE TABLE ORDERS (ID INTEGER PRIMARY KEY, CUSTOMER_ID INTEGER, "
+        "TOTAL DECIMAL(10,2))"
+    )
+    conn.close()
+    return path
+
+
+class TestDescribeTable:
+    """Test the describe_table tool."""
+
+    async def test_describe_table(self, mcp_context, duckdb_path):
+        """Test columns, primary keys and Pure types are reported."""
+        result = json.loads(await database.describe_table(
+            mcp_context, "duckdb", duckdb_path, "main", "ORDERS"
+        ))
+
+        assert result["primary_keys"] == ["ID"]
+        assert result["column_count"] == 3
+        assert [c["name"] for c in result["columns"]] == ["ID", "CUSTOMER_ID", "TOTAL"]
+        assert [c["is_primary_key"] for c in result["columns"]] == [True, False, False]
+        assert result["columns"][0]["pure_type"] == "Integer"
+
+    async def test_uses_one_introspector(self, mcp_context, duckdb_path):
+        """Test columns and primary keys are read without opening a second connection."""
+        await database.describe_table(mcp_context, "duckdb", duckdb_path, "main", "ORDERS")
+
+        conn = mcp_context.get_connection(DatabaseType.DUCKDB, duckdb_path)
+        assert len(conn.pool._all) == 1
+
+    async def test_failure_keeps_cause(self, mcp_context, tmp_path):
+        """Test a failed describe chains the driver's exception."""
+        from legend_cli.mcp.errors import DatabaseError
+
+        # A directory is not a readable DuckDB file
+        with pytest.raises(DatabaseError) as excinfo:
+            await database.describe_table(mcp_context, "duckdb", str(tmp_path), "main", "ORDERS")
+
+        assert excinfo.value.__cause__ is not None
+        assert str(excinfo.value.__cause__) in str(excinfo.value)
+
+
+class TestIntrospectDatabase:
+    """Test the introspect_database tool."""
+
+    async def test_introspect_response(self, mcp_context, duckdb_path):
+        """Test the response is valid JSON describing the introspected schema."""
+        result = json.loads(await database.introspect_database(
+            mcp_context, "duckdb", duckdb_path
+        ))
+
+        assert result["status"] == "success"
+        assert result["summary"]["tables"] == 2
+        assert result["summary"]["columns"] == 5
+        tables = {t["name"]: t for t in result["schemas"][0]["tables"]}
+        assert tables["ORDERS"] == {"name": "ORDERS", "columns": 3, "primary_keys": ["ID"]}
+        assert result["relationships"] == [{
+            "source": "ORDERS.CUSTOMER_ID",
+            "target": "CUSTOMER.ID",
+            "type": "many_to_one",
+            "property_name": "customer",
+        }]
+        assert "2 tables" in result["message"]
+
+    async def test_introspect_stores_schema(self, mcp_context, duckdb_path):
+        """Test the introspected schema is stored in the context."""
+        await database.introspect_database(mcp_context, "duckdb", duckdb_path)
+
+        schema = mcp_context.get_schema(DatabaseType.DUCKDB, duckdb_path)
+        assert schema is not None
+        assert {t.name for t in schema.get_all_tables()} == {"CUSTOMER", "ORDERS"}
+
+    async def test_introspect_schema_returns_stored_schema(self, mcp_context, duckdb_path):
+        """Test introspect_schema hands back the schema it stores."""
+        schema = await database.introspect_schema(mcp_context, "duckdb", duckdb_path)
+
+        assert schema is mcp_context.get_schema(DatabaseType.DUCKDB, duckdb_path)
+
+    async def test_response_with_either_encoder(self, monkeypatch, mcp_context, duckdb_path):
+        """Test the response is the same text with orjson and with the json module."""
+        from legend_cli.mcp import serialization
+
+        with_orjson = await database.introspect_database(mcp_context, "duckdb", duckdb_path)
+        monkeypatch.setattr(serialization, "orjson", None)
+        without_orjson = await database.introspect_database(mcp_context, "duckdb", duckdb_path)
+
+        assert with_orjson == without_orjson
+        result = json.loads(with_orjson)
+        assert result["summary"] == {"schemas": 1, "tables": 2, "columns": 5, "relationships": 1}
+        assert len(result["relationships"]) == 1
+
+
+class TestSchemaCache:
+    """Test reuse of introspected schemas across sessions."""
+
+    async def test_restores_unchanged_schema(self, duckdb_path):
+        """Test a new session restores the schema without introspecting."""
+        from legend_cli.mcp.context import MCPContext
+
+        first = MCPContext()
+        await database.introspect_database(first, "duckdb", duckdb_path)
+        first.close_all_connections()
+
+        second = MCPContext()
+        schema = await database.load_cached_schema(second, "duckdb", duckdb_path)
+        second.close_all_connections()
+
+        assert schema is not None
+        assert second.get_schema(DatabaseType.DUCKDB, duckdb_path) is schema
+        assert {t.name for t in schema.get_all_tables()} == {"CUSTOMER", "ORDERS"}
+        assert schema.get_table_by_name("ORDERS").columns[2].to_pure_property_type() == "Float"
+        assert len(schema.relationships) == 1
+
+    async def test_new_table_invalidates(self, duckdb_path):
+        """Test a changed table listing forces a fresh introspection."""
+        from legend_cli.mcp.context import MCPContext
+
+        first = MCPContext()
+        await database.introspect_database(first, "duckdb", duckdb_path)
+        first.close_all_connections()
+
+        conn = duckdb.connect(duckdb_path)
+        conn.execute("CREATE TABLE PRODUCT (ID INTEGER PRIMARY KEY)")
+        conn.close()
+
+        second = MCPContext()
+        schema = await database.load_cached_schema(second, "duckdb", duckdb_path)
+        second.close_all_connections()
+
+        assert schema is None
+
+    @pytest.mark.parametrize("statement", [
+        "ALTER TABLE ORDERS ADD COLUMN STATUS VARCHAR",
+        "ALTER TABLE ORDERS ALTER COLUMN TOTAL TYPE VARCHAR",
+        "ALTER TABLE ORDERS DROP COLUMN TOTAL",
+    ])
+    async def test_column_change_invalidates(self, duckdb_path, statement):
+        """Test a column change within an existing table forces a fresh introspection."""
+        from legend_cli.mcp.context import MCPContext
+
+        first = MCPContext()
+        await database.introspect_database(first, "duckdb", duckdb_path)
+        first.close_all_connections()
+
+        conn = duckdb.connect(duckdb_path)
+        conn.execute(statement)
+        conn.close()
+
+        second = MCPContext()
+        schema = await database.load_cached_schema(second, "duckdb", duckdb_path)
+        second.close_all_connections()
+
+        assert schema is None
+
+    async def test_disabled(self, duckdb_path, monkeypatch):
+        """Test nothing is written or restored when the cache is disabled."""
+        from legend_cli.config import settings
+        from legend_cli.mcp.context import MCPContext
+
+        monkeypatch.setattr(settings, "schema_cache_enabled", False)
+        ctx = MCPContext()
+        await database.introspect_database(ctx, "duckdb", duckdb_path)
+
+        assert await database.load_cached_schema(ctx, "duckdb", duckdb_path) is None
+        ctx.close_all_connections()
+
+
+def test_tools_share_property_schemas():
+    """Test the database tools share their common property schemas."""
+    tools = [
+        t for t in database.get_tools()
+        if t.name not in ("connect_database", "list_databases")
+    ]
+
+    for name, shared in [
+        ("db_type", database._DB_TYPE_SCHEMA),
+        ("database", database._DATABASE_SCHEMA),
+    ]:
+        assert {id(t.inputSchema["properties"][name]) for t in tools} == {id(shared)}
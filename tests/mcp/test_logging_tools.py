@@ -0,0 +1,511 @@
+"""Tests for MCP logging tools."""
+
+import asyncio
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from legend_cli.mcp import server
+from legend_cli.mcp.logging.db import MCPLogDatabase
+from legend_cli.mcp.logging.service import MCPLogService
+from legend_cli.mcp.tools import logging as logging_tools
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache(monkeypatch):
+    """Keep cached stats and breaker state from leaking between tests."""
+    logging_tools._stats_cache.clear()
+    logging_tools._stats_locks.clear()
+    monkeypatch.setattr(logging_tools, "_consecutive_failures", 0)
+    monkeypatch.setattr(logging_tools, "_breaker_open_until", 0.0)
+    yield
+    logging_tools._stats_cache.clear()
+    logging_tools._stats_locks.clear()
+
+
+@pytest.fixture
+def log_service(tmp_path, monkeypatch):
+    """Install an enabled log service backed by a temporary SQLite file."""
+    service = MCPLogService(db_path=str(tmp_path / "mcp_logs.db"))
+    monkeypatch.setattr(server, "_log_service", service)
+    yield service
+    service.close()
+
+
+async def _log_at(service, tool_name, hours_ago):
+    """Write a successful call logged hours_ago."""
+    service.db.insert_logs([{
+        "tool_name": tool_name,
+        "status": "success",
+        "timestamp": datetime.utcnow() - timedelta(hours=hours_ago),
+    }])
+
+
+class TestGetTools:
+    """Test logging tool definitions."""
+
+    def test_tools_built_once(self):
+        """Test each call returns the same Tool objects in a fresh list."""
+        first = logging_tools.get_tools()
+        first.append(None)
+        second = logging_tools.get_tools()
+
+        assert [t.name for t in second] == ["query_mcp_logs", "get_mcp_log_stats"]
+        assert second[0] is first[0]
+
+
+class TestLogDatabaseQuery:
+    """Test projection and truncation in the log store query."""
+
+    async def test_projects_fields_and_truncates_parameters(self, log_service):
+        """Test only requested columns return and parameters are cut in SQL."""
+        log_id = await log_service.log_tool_start("push_artifacts", {"code": "x" * 500})
+        await log_service.log_tool_success(log_id, "ok", duration_ms=1)
+        log_service.flush()
+
+        rows = log_service.db.query_logs(
+            fields=("id", "tool_name", "parameters"),
+            truncate_parameters=200,
+        )
+
+        assert list(rows[0]) == ["id", "tool_name", "parameters"]
+        assert len(rows[0]["parameters"]) == 203
+        assert rows[0]["parameters"].endswith("...")
+
+    def test_error_query_uses_partial_index(self, log_service):
+        """Test error-only queries walk the partial timestamp index."""
+        log_service.db.initialize()
+        plan = log_service.db._get_connection().execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM mcp_tool_calls "
+            "WHERE timestamp >= ? AND status = 'error' "
+            "ORDER BY timestamp DESC LIMIT 20",
+            ("2024-01-01",),
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+
+        assert "idx_tool_calls_error_ts" in details
+        assert "TEMP B-TREE" not in details
+
+    async def test_returns_row_type_instances(self, log_service):
+        """Test rows are built as the given namedtuple from its fields."""
+        log_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_success(log_id, "ok", duration_ms=3)
+        log_service.flush()
+
+        rows = log_service.db.query_logs(row_type=logging_tools._LogRow)
+
+        assert type(rows[0]) is logging_tools._LogRow
+        assert rows[0].tool_name == "list_schemas"
+        assert rows[0].duration_ms == 3
+
+    async def test_preview_stored_at_insert(self, log_service):
+        """Test the parameters preview is written once with the log entry."""
+        log_id = await log_service.log_tool_start("push_artifacts", {"code": "x" * 500})
+        await log_service.log_tool_success(log_id, "ok", duration_ms=1)
+        log_service.flush()
+
+        entry = log_service.db.get_log_by_id(1)
+
+        assert len(entry["parameters"]) > 500
+        assert len(entry["parameters_preview"]) == 203
+        assert entry["parameters"].startswith(entry["parameters_preview"][:-3])
+
+    def test_preview_leaves_short_parameters_alone(self, log_service):
+        """Test short parameters are stored as-is and missing ones stay NULL."""
+        log_service.db.insert_logs([
+            {"tool_name": "short", "parameters": '{"a": 1}'},
+            {"tool_name": "none"},
+        ])
+
+        rows = log_service.db.query_logs(fields=("tool_name", "parameters_preview"))
+
+        assert {r["tool_name"]: r["parameters_preview"] for r in rows} == {
+            "short": '{"a": 1}',
+            "none": None,
+        }
+
+    def test_migrates_preview_column(self, tmp_path):
+        """Test databases created before parameters_preview are backfilled."""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE mcp_tool_calls (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, session_id TEXT, "
+            "tool_name TEXT NOT NULL, parameters TEXT, status TEXT, result TEXT, "
+            "error_message TEXT, error_type TEXT, duration_ms INTEGER, context_data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO mcp_tool_calls (tool_name, parameters) VALUES (?, ?)",
+            ("push_artifacts", "y" * 300),
+        )
+        conn.commit()
+        conn.close()
+
+        db = MCPLogDatabase(path)
+        rows = db.query_logs(fields=("parameters_preview",))
+        db.close()
+
+        assert rows[0]["parameters_preview"] == "y" * 200 + "..."
+
+    def test_rejects_unknown_fields(self, log_service):
+        """Test unknown column names are rejected rather than interpolated."""
+        with pytest.raises(ValueError):
+            log_service.db.query_logs(fields=("id", "1; DROP TABLE mcp_tool_calls"))
+
+
+class TestBufferedWrites:
+    """Test buffered log writes in MCPLogService."""
+
+    def _rows(self, service):
+        return service.db.query_logs(fields=("tool_name", "status"))
+
+    async def test_entries_written_after_flush_interval(self, log_service):
+        """Test a partial batch is flushed once flush_interval passes."""
+        log_service.flush_interval = 0.01
+        log_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_success(log_id, "ok", duration_ms=1)
+
+        assert self._rows(log_service) == []
+        await asyncio.sleep(0.05)
+        assert self._rows(log_service) == [{"tool_name": "list_schemas", "status": "success"}]
+
+    async def test_full_batch_flushes_immediately(self, log_service):
+        """Test reaching batch_size writes the batch without waiting."""
+        log_service.batch_size = 3
+        for _ in range(3):
+            log_id = await log_service.log_tool_start("list_tables")
+            await log_service.log_tool_error(log_id, ValueError("boom"), duration_ms=1)
+
+        assert len(self._rows(log_service)) == 3
+
+    async def test_overflow_drops_oldest(self, tmp_path):
+        """Test a full buffer drops the oldest entry and counts it."""
+        service = MCPLogService(db_path=str(tmp_path / "small.db"), batch_size=100, buffer_size=2)
+        for name in ("a", "b", "c"):
+            log_id = await service.log_tool_start(name)
+            await service.log_tool_success(log_id, "ok", duration_ms=1)
+
+        stats = await service.get_stats()
+        logs = await service.query_logs()
+        service.close()
+
+        assert stats["dropped"] == 1
+        assert sorted(log["tool_name"] for log in logs) == ["b", "c"]
+
+    async def test_close_writes_running_calls(self, tmp_path):
+        """Test calls still running at shutdown are kept as 'started'."""
+        path = str(tmp_path / "close.db")
+        service = MCPLogService(db_path=path)
+        await service.log_tool_start("generate_model")
+        service.close()
+
+        db = MCPLogDatabase(path)
+        rows = db.query_logs(fields=("tool_name", "status"))
+        db.close()
+
+        assert rows == [{"tool_name": "generate_model", "status": "started"}]
+
+
+class TestStatsRollup:
+    """Test get_stats answered from the hourly rollup."""
+
+    def _insert(self, db, tool_name, status, hours_ago, duration_ms):
+        db.insert_logs([{
+            "tool_name": tool_name,
+            "status": status,
+            "duration_ms": duration_ms,
+            "timestamp": datetime.utcnow() - timedelta(hours=hours_ago),
+        }])
+
+    def test_stats_match_window(self, log_service):
+        """Test whole-hour rollups and the partial first hour add up exactly."""
+        db = log_service.db
+        self._insert(db, "list_tables", "success", 0.1, 10)
+        self._insert(db, "list_tables", "error", 1.5, 20)
+        self._insert(db, "describe_table", "success", 1.95, 30)
+        self._insert(db, "describe_table", "success", 2.05, 40)  # outside
+        self._insert(db, "describe_table", "error", 30, 50)  # outside
+
+        stats = db.get_stats(since_hours=2)
+
+        assert stats["total_calls"] == 3
+        assert stats["success_count"] == 2
+        assert stats["error_count"] == 1
+        assert stats["avg_duration_ms"] == 20.0
+        assert stats["by_tool"] == [
+            {"tool_name": "list_tables", "count": 2, "success": 1, "errors": 1},
+            {"tool_name": "describe_table", "count": 1, "success": 1, "errors": 0},
+        ]
+
+    def test_rollup_backfilled_for_existing_logs(self, tmp_path):
+        """Test a log database without the rollup gets it filled on open."""
+        path = str(tmp_path / "old.db")
+        db = MCPLogDatabase(path)
+        self._insert(db, "list_tables", "success", 0.5, 10)
+        db._get_connection().execute("DELETE FROM mcp_tool_call_stats_hourly")
+        db.close()
+
+        db = MCPLogDatabase(path)
+        stats = db.get_stats(since_hours=24)
+        db.close()
+
+        assert stats["total_calls"] == 1
+        assert stats["avg_duration_ms"] == 10.0
+
+
+class TestBatchedQuery:
+    """Test the growing-window log scan."""
+
+    async def test_stops_once_limit_is_filled(self, log_service, monkeypatch):
+        """Test older slices are not scanned once limit rows are found."""
+        await _log_at(log_service, "recent", 0.5)
+        await _log_at(log_service, "older", 3)
+        await _log_at(log_service, "oldest", 30)
+
+        windows = []
+        query_logs = log_service.query_logs
+
+        async def recording_query_logs(**kwargs):
+            windows.append((kwargs["since"], kwargs["until"]))
+            return await query_logs(**kwargs)
+
+        monkeypatch.setattr(log_service, "query_logs", recording_query_logs)
+
+        rows = await logging_tools._batched_query(log_service, limit=2, since_hours=24 * 30)
+
+        assert [r["tool_name"] for r in rows] == ["recent", "older"]
+        assert len(windows) == 3  # 1h, 1-2h, 2-4h
+        assert windows[0][1] is None
+        assert all(windows[i][0] == windows[i + 1][1] for i in range(len(windows) - 1))
+
+    async def test_covers_whole_window(self, log_service):
+        """Test every slice up to since_hours is scanned when rows are scarce."""
+        await _log_at(log_service, "recent", 0.5)
+        await _log_at(log_service, "oldest", 30)
+        await _log_at(log_service, "outside", 50)
+
+        rows = await logging_tools._batched_query(log_service, limit=10, since_hours=48)
+
+        assert [r["tool_name"] for r in rows] == ["recent", "oldest"]
+
+    async def test_failed_slice_stops_scan(self, log_service, monkeypatch):
+        """Test a database error ends the scan instead of widening the window."""
+        calls = 0
+
+        def failing_query_logs(**kwargs):
+            nonlocal calls
+            calls += 1
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(log_service.db, "query_logs", failing_query_logs)
+
+        with pytest.raises(sqlite3.OperationalError):
+            await logging_tools._batched_query(log_service, limit=10, since_hours=24)
+
+        assert calls == 1
+
+    async def test_same_day_cutoff(self, log_service):
+        """Test cutoffs compare correctly against SQLite timestamps."""
+        await _log_at(log_service, "recent", 0.25)
+
+        rows = await log_service.query_logs(since_hours=1)
+
+        assert [r["tool_name"] for r in rows] == ["recent"]
+
+
+class TestQueryMCPLogs:
+    """Test the query_mcp_logs tool."""
+
+    async def test_disabled(self, mcp_context, monkeypatch):
+        """Test response when logging is not enabled."""
+        monkeypatch.setattr(server, "_log_service", None)
+
+        result = json.loads(await logging_tools.query_mcp_logs(mcp_context))
+
+        assert result["status"] == "disabled"
+
+    async def test_ndjson_output(self, mcp_context, log_service):
+        """Test NDJSON output has a summary line then one line per entry."""
+        for i in range(3):
+            log_id = await log_service.log_tool_start("list_tables", {"i": i})
+            await log_service.log_tool_success(log_id, "ok", duration_ms=i)
+
+        document = json.loads(await logging_tools.query_mcp_logs(mcp_context))
+        lines = (await logging_tools.query_mcp_logs(mcp_context, output_format="ndjson")).split("\n")
+        summary = json.loads(lines[0])
+
+        assert summary["status"] == "success"
+        assert summary["count"] == 3
+        assert "logs" not in summary
+        assert [json.loads(line) for line in lines[1:]] == document["logs"]
+
+    async def test_clamps_limit_and_window(self, mcp_context, log_service, monkeypatch):
+        """Test out-of-range arguments are clamped before querying."""
+        calls = []
+
+        async def recording_batched_query(service, *, limit, since_hours, **filters):
+            calls.append((limit, since_hours))
+            return []
+
+        monkeypatch.setattr(logging_tools, "_batched_query", recording_batched_query)
+
+        await logging_tools.query_mcp_logs(mcp_context, limit=10_000_000, since_hours=100_000)
+        await logging_tools.query_mcp_logs(mcp_context, limit=0, since_hours=-5)
+
+        assert calls == [(1000, 24 * 90), (1, 1)]
+
+    async def test_error_response(self, mcp_context, monkeypatch):
+        """Test unexpected failures return an encoded error message."""
+        def broken():
+            raise RuntimeError('no "log" store')
+
+        monkeypatch.setattr(logging_tools, "_get_log_service", broken)
+
+        result = json.loads(await logging_tools.query_mcp_logs(mcp_context))
+
+        assert result == {"status": "error", "message": 'Failed to query logs: no "log" store'}
+
+    async def test_breaker_opens_after_repeated_failures(self, mcp_context, log_service, monkeypatch, caplog):
+        """Test repeated database failures stop calls to the log service for a while."""
+        calls = 0
+
+        def failing_query_logs(**kwargs):
+            nonlocal calls
+            calls += 1
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(log_service.db, "query_logs", failing_query_logs)
+
+        for _ in range(logging_tools._BREAKER_THRESHOLD + 2):
+            result = json.loads(await logging_tools.query_mcp_logs(mcp_context))
+            assert result["status"] == "error"
+
+        assert calls == logging_tools._BREAKER_THRESHOLD
+        assert sum(1 for r in caplog.records if r.exc_info) == 1
+
+    async def test_breaker_retries_after_cooldown(self, mcp_context, log_service, monkeypatch):
+        """Test a success after the cooldown closes the breaker."""
+        monkeypatch.setattr(logging_tools, "_consecutive_failures", logging_tools._BREAKER_THRESHOLD)
+        monkeypatch.setattr(logging_tools, "_breaker_open_until", 0.0)
+
+        result = json.loads(await logging_tools.query_mcp_logs(mcp_context))
+
+        assert result["status"] == "success"
+        assert logging_tools._consecutive_failures == 0
+
+    async def test_returns_logged_calls(self, mcp_context, log_service):
+        """Test logged tool calls are returned with errors and parameters."""
+        ok_id = await log_service.log_tool_start("list_schemas", {"database": "db"})
+        await log_service.log_tool_success(ok_id, "ok", duration_ms=5)
+        err_id = await log_service.log_tool_start("describe_table", {"table": "t"})
+        await log_service.log_tool_error(err_id, ValueError("boom"), duration_ms=7)
+
+        result = json.loads(await logging_tools.query_mcp_logs(mcp_context))
+
+        assert result["status"] == "success"
+        assert result["count"] == 2
+        by_tool = {log["tool_name"]: log for log in result["logs"]}
+        assert by_tool["describe_table"]["error"] == {"message": "boom", "type": "ValueError"}
+        assert json.loads(by_tool["list_schemas"]["parameters"]) == {"database": "db"}
+
+    async def test_filters_by_status(self, mcp_context, log_service):
+        """Test status filtering."""
+        ok_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_success(ok_id, "ok", duration_ms=5)
+        err_id = await log_service.log_tool_start("describe_table")
+        await log_service.log_tool_error(err_id, ValueError("boom"), duration_ms=7)
+
+        result = json.loads(await logging_tools.query_mcp_logs(mcp_context, status="error"))
+
+        assert [log["tool_name"] for log in result["logs"]] == ["describe_table"]
+
+    async def test_streamed_response_matches_pretty(self, mcp_context, log_service, monkeypatch):
+        """Test responses over the pretty limit stream the same document."""
+        for i in range(3):
+            log_id = await log_service.log_tool_start("list_tables", {"i": i})
+            await log_service.log_tool_success(log_id, "ok", duration_ms=i)
+
+        pretty = await logging_tools.query_mcp_logs(mcp_context)
+        monkeypatch.setattr(logging_tools, "_PRETTY_LOG_LIMIT", 1)
+        streamed = await logging_tools.query_mcp_logs(mcp_context)
+
+        assert "\n" not in streamed
+        assert json.loads(streamed) == json.loads(pretty)
+        assert list(json.loads(streamed)) == list(json.loads(pretty))
+
+
+class TestGetMCPLogStats:
+    """Test the get_mcp_log_stats tool."""
+
+    async def test_stats(self, mcp_context, log_service):
+        """Test stats include success and error counts."""
+        ok_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_success(ok_id, "ok", duration_ms=5)
+        err_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_error(err_id, ValueError("boom"), duration_ms=7)
+
+        result = json.loads(await logging_tools.get_mcp_log_stats(mcp_context))
+
+        assert result["status"] == "success"
+        assert result["total_calls"] == 2
+        assert result["success_count"] == 1
+        assert result["error_count"] == 1
+
+    async def test_stats_cached_within_ttl(self, mcp_context, log_service):
+        """Test repeated calls within the TTL reuse the aggregation."""
+        first = await logging_tools.get_mcp_log_stats(mcp_context)
+        log_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_success(log_id, "ok", duration_ms=5)
+
+        assert await logging_tools.get_mcp_log_stats(mcp_context) == first
+
+    async def test_stats_recomputed_after_ttl(self, mcp_context, log_service, monkeypatch):
+        """Test expired entries are recomputed."""
+        await logging_tools.get_mcp_log_stats(mcp_context)
+        log_id = await log_service.log_tool_start("list_schemas")
+        await log_service.log_tool_success(log_id, "ok", duration_ms=5)
+        monkeypatch.setattr(logging_tools, "_STATS_TTL", 0.0)
+
+        result = json.loads(await logging_tools.get_mcp_log_stats(mcp_context))
+
+        assert result["total_calls"] == 1
+
+    async def test_concurrent_stats_aggregate_once(self, mcp_context, log_service, monkeypatch):
+        """Test concurrent callers share a single aggregation."""
+        calls = 0
+        get_stats = log_service.get_stats
+
+        async def counting_get_stats(**kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return await get_stats(**kwargs)
+
+        monkeypatch.setattr(log_service, "get_stats", counting_get_stats)
+
+        results = await asyncio.gather(
+            *(logging_tools.get_mcp_log_stats(mcp_context) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert len(set(results)) == 1
+
+    async def test_database_failure_counts_toward_breaker(self, mcp_context, log_service, monkeypatch):
+        """Test a failed aggregation is reported as an error, not cached, and trips the breaker."""
+        calls = 0
+
+        def failing_get_stats(**kwargs):
+            nonlocal calls
+            calls += 1
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(log_service.db, "get_stats", failing_get_stats)
+
+        for _ in range(logging_tools._BREAKER_THRESHOLD + 2):
+            result = json.loads(await logging_tools.get_mcp_log_stats(mcp_context))
+            assert result["status"] == "error"
+
+        assert calls == logging_tools._BREAKER_THRESHOLD
+        assert logging_tools._stats_cache == {}
@@ -1,8 +1,12 @@
 """Tests for model generation tools."""
 
+import json
+
 import pytest
-from legend_cli.mcp.context import MCPContext, PendingArtifact
-from legend_cli.database.models import Database, Schema, Table, Column
+from legend_cli.mcp.context import DatabaseType, MCPContext, PendingArtifact
+from legend_cli.database.models import Database, Schema, Table, Column, Relationship
+from legend_cli.mcp.tools import model_generation
+from legend_cli.pure.generator import PureCodeGenerator
 
 
 class TestDatabaseModel:
@@ -200,6 +204,14 @@ class TestSchemaGeneration:
         assert "users" in table_names
         assert "orders" in table_names
 
+    def test_table_count(self, sample_database):
+        """Test table_count spans all schemas and follows edits."""
+        assert sample_database.table_count == 2
+
+        sample_database.schemas.append(Schema(name="staging", tables=[Table(name="t", schema="staging")]))
+
+        assert sample_database.table_count == 3
+
     def test_create_database_with_multiple_schemas(self):
         """Test creating database with multiple schemas."""
         db = Database(
@@ -220,3 +232,609 @@ class TestSchemaGeneration:
         schema_names = [s.name for s in db.schemas]
         assert "public" in schema_names
         assert "staging" in schema_names
+
+
+
+class TestPureCodeGenerator:
+    """Test the Pure code generator."""
+
+    def test_generate_all_matches_single_artifacts(self, sample_database):
+        """Test the single-pass generate_all renders what the per-artifact methods do."""
+        sample_database.relationships.append(
+            Relationship("orders", "user_id", "users", "id", "many_to_one", "user")
+        )
+        docs = {"Users": type("Doc", (), {"class_doc": "App users", "attributes": {}})()}
+        generator = PureCodeGenerator(sample_database, "model")
+
+        artifacts = generator.generate_all("conn", docs=docs)
+
+        assert artifacts["store"] == generator.generate_store_with_joins()
+        assert artifacts["classes"] == generator.generate_classes(docs=docs)
+        assert artifacts["mapping"] == generator.generate_mapping()
+        assert artifacts["associations"] == generator.generate_associations()
+        assert "Join orders_users(main.orders.user_id = main.users.id)" in artifacts["store"]
+
+    def test_table_class_names(self, sample_database):
+        """Test the generator collects each table's class name once."""
+        generator = PureCodeGenerator(sample_database, "model")
+
+        assert generator.table_class_names == {"Users", "Orders"}
+
+
+class TestArtifactCache:
+    """Test reuse of generated code for an unchanged schema."""
+
+    @pytest.fixture
+    def render_calls(self, monkeypatch):
+        """Count store renders."""
+        from legend_cli.pure.generator import PureCodeGenerator
+
+        calls = []
+        original = PureCodeGenerator.generate_store_with_joins
+
+        def counting(self):
+            calls.append(1)
+            return original(self)
+
+        monkeypatch.setattr(PureCodeGenerator, "generate_store_with_joins", counting)
+        return calls
+
+    async def test_repeat_call_skips_render(self, mcp_context, sample_database, render_calls):
+        """Test a second generate_store call reuses the cached code."""
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        first = await model_generation.generate_store(mcp_context, "duckdb", "test.db")
+        second = await model_generation.generate_store(mcp_context, "duckdb", "test.db")
+
+        assert len(render_calls) == 1
+        assert json.loads(first)["code"] == json.loads(second)["code"]
+        assert len(mcp_context.pending_artifacts) == 2
+
+    async def test_schema_change_renders_again(self, mcp_context, sample_database, render_calls):
+        """Test renaming or merging relationships in place misses the cache."""
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        await model_generation.generate_store(mcp_context, "duckdb", "test.db")
+        sample_database.relationships = [
+            Relationship("orders", "user_id", "users", "id", "many_to_one", "buyer")
+        ]
+        await model_generation.generate_store(mcp_context, "duckdb", "test.db")
+        sample_database.name = "renamed"
+        await model_generation.generate_store(mcp_context, "duckdb", "test.db")
+
+        assert len(render_calls) == 3
+
+    def test_store_schema_renews_version(self, mcp_context, sample_database):
+        """Test each store_schema gives the schema a new version."""
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+        first = mcp_context.schema_versions["duckdb:test.db"]
+
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        assert mcp_context.schema_versions["duckdb:test.db"] > first
+
+    async def test_store_schema_invalidates(self, mcp_context, sample_database):
+        """Test storing a schema drops that database's cached code."""
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+        await model_generation.generate_mapping(mcp_context, "duckdb", "test.db")
+        assert mcp_context.artifact_cache
+
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        assert not mcp_context.artifact_cache
+
+
+class TestGenerateModel:
+    """Test generate_model on an introspected schema."""
+
+    async def test_renders_off_event_loop(self, mcp_context, sample_database, monkeypatch):
+        """Test artifacts are rendered in a worker thread."""
+        import threading
+        from legend_cli.pure.generator import PureCodeGenerator
+
+        threads = []
+        original = PureCodeGenerator.generate_all
+
+        def recording(self, *args, **kwargs):
+            threads.append(threading.current_thread())
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(PureCodeGenerator, "generate_all", recording)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        result = json.loads(await model_generation.generate_model(
+            mcp_context, "duckdb", "test.db", enhanced=False, generate_docs=False,
+        ))
+
+        assert result["status"] == "success"
+        assert threads and threads[0] is not threading.main_thread()
+        assert {a.artifact_type for a in mcp_context.pending_artifacts} >= {"store", "classes", "mapping"}
+
+    async def test_analysis_and_docs_run_concurrently(self, mcp_context, sample_database, monkeypatch):
+        """Test enhanced analysis and documentation overlap in worker threads."""
+        import threading
+
+        # Each side waits for the other; run one after the other, this times out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def analysis(*args, **kwargs):
+            barrier.wait()
+            return None, {"error": "skipped"}
+
+        def docs(*args, **kwargs):
+            barrier.wait()
+            return None
+
+        monkeypatch.setattr(model_generation, "_run_enhanced_analysis", analysis)
+        monkeypatch.setattr(model_generation, "_generate_docs_from_schema", docs)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        result = json.loads(await model_generation.generate_model(
+            mcp_context, "duckdb", "test.db", enhanced=True, generate_docs=True,
+        ))
+
+        assert result["status"] == "success"
+        assert result["enhanced_mode"] is False
+        assert not mcp_context.artifact_cache
+
+    async def test_repeat_call_returns_same_response(self, mcp_context, sample_database):
+        """Test a cached model returns the response of the first call."""
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+        kwargs = dict(enhanced=False, generate_docs=False)
+
+        first = await model_generation.generate_model(mcp_context, "duckdb", "test.db", **kwargs)
+        second = await model_generation.generate_model(mcp_context, "duckdb", "test.db", **kwargs)
+
+        assert second == first
+        result = json.loads(first)
+        assert list(result["artifacts"]) == result["artifacts_generated"]
+        assert result["summary"]["tables"] == sample_database.table_count
+        assert result["message"].startswith(f"Generated {len(result['artifacts'])} artifacts")
+
+    async def test_reports_line_counts(self, mcp_context, sample_database):
+        """Test each artifact's line count matches its code."""
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        result = json.loads(await model_generation.generate_model(
+            mcp_context, "duckdb", "test.db", enhanced=False, generate_docs=False,
+        ))
+
+        for artifact in mcp_context.pending_artifacts:
+            expected = len(artifact.pure_code.split("\n"))
+            assert result["artifacts"][artifact.artifact_type]["lines"] == expected
+
+
+class TestGetTools:
+    """Test model generation tool definitions."""
+
+    def test_tools_share_property_schemas(self):
+        """Test the tools are built once and share common properties."""
+        first = model_generation.get_tools()
+        first.clear()
+        tools = model_generation.get_tools()
+
+        assert len(tools) == 8
+        for name, shared in [
+            ("db_type", model_generation._DB_TYPE_SCHEMA),
+            ("database", model_generation._DATABASE_SCHEMA),
+        ]:
+            assert {id(t.inputSchema["properties"][name]) for t in tools} == {id(shared)}
+
+        skip_prompts = {
+            id(t.inputSchema["properties"]["skip_database_prompt"])
+            for t in tools
+            if t.name not in ("generate_model", "analyze_schema")
+        }
+        assert skip_prompts == {id(model_generation._SKIP_PROMPT_SCHEMA)}
+
+
+class TestGenerateAssociations:
+    """Test generate_associations on an introspected schema."""
+
+    async def test_no_relationships_skips_generator(self, mcp_context, sample_database, monkeypatch):
+        """Test a schema without relationships returns no code and builds no generator."""
+        def fail(*args, **kwargs):
+            raise AssertionError("generator built")
+
+        monkeypatch.setattr(PureCodeGenerator, "__init__", fail)
+        sample_database.relationships = []
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        result = json.loads(await model_generation.generate_associations(
+            mcp_context, "duckdb", "test.db", use_llm=False,
+        ))
+
+        assert result["code"] == ""
+        assert result["relationships_found"] == 0
+        assert not mcp_context.pending_artifacts
+
+
+class TestNeedsDatabaseInput:
+    """Test the prompt returned when no database is given."""
+
+    async def test_prompts_for_database(self, mcp_context):
+        """Test a missing database asks for it with a db_type hint."""
+        result = json.loads(await model_generation.generate_store(mcp_context, "duckdb"))
+
+        assert result["status"] == "needs_input"
+        assert result["message"] == "Please provide the database identifier to generate store."
+        assert ".duckdb" in result["hint"]
+
+    async def test_response_reused(self, mcp_context):
+        """Test repeated prompts return the same encoded response."""
+        first = await model_generation.generate_store(mcp_context, "snowflake")
+        second = await model_generation.generate_store(mcp_context, "snowflake")
+
+        assert first is second
+
+    @pytest.mark.parametrize("tool", ["generate_model", "generate_store", "generate_connection"])
+    async def test_unsupported_db_type_rejected_first(self, mcp_context, tool):
+        """Test an unknown db_type fails instead of prompting for a database."""
+        from legend_cli.mcp.errors import GenerationError
+
+        with pytest.raises(GenerationError, match="Unsupported database type 'postgres'"):
+            await getattr(model_generation, tool)(mcp_context, "postgres")
+
+    async def test_skip_prompt_error(self, mcp_context):
+        """Test skipping the prompt on a tool that needs a database returns its error."""
+        result = json.loads(await model_generation.generate_mapping(
+            mcp_context, "duckdb", skip_database_prompt=True
+        ))
+
+        assert result == {
+            "status": "error",
+            "message": "Cannot generate mapping without database. Mapping requires a database schema to be introspected.",
+            "suggestion": "Please provide the database parameter.",
+        }
+
+
+class TestDumps:
+    """Test response serialization."""
+
+    def test_artifact_response(self):
+        """Test prebuilt artifact responses decode to the full response."""
+        result = model_generation._artifact_response("store", 'Table "T"\n(\n)')
+
+        assert json.loads(result) == {
+            "status": "success",
+            "artifact_type": "store",
+            "code": 'Table "T"\n(\n)',
+            "message": "Store definition generated and added to pending artifacts",
+        }
+
+
+class TestAnalyzeSchema:
+    """Test the analyze_schema response."""
+
+    async def test_enumeration_values_preview(self, mcp_context, sample_database, monkeypatch):
+        """Test enum values are capped at ten with the full count reported."""
+        from legend_cli.analysis.models import EnhancedModelSpec, EnumerationCandidate
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+
+        spec = EnhancedModelSpec(
+            database_name="TestDB",
+            schema_names=["main"],
+            enumerations=[EnumerationCandidate(
+                name="Status", source_table="orders", source_column="status",
+                values=[f"S{i}" for i in range(25)],
+            )],
+        )
+        async def analyze_async(self, context):
+            return spec
+
+        monkeypatch.setattr(SchemaAnalyzer, "analyze_async", analyze_async)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        result = json.loads(await model_generation.analyze_schema(mcp_context, "duckdb", "test.db"))
+
+        enum = result["analysis"]["enumerations"][0]
+        assert enum["values"] == [f"S{i}" for i in range(10)]
+        assert enum["value_count"] == 25
+        assert result["message"] == (
+            "Analysis complete: 0 hierarchies, 1 enums, 0 constraints, 0 derived properties"
+        )
+
+    async def test_detectors_run_concurrently(self, mcp_context, sample_database, monkeypatch):
+        """Test enabled detectors overlap in worker threads."""
+        import threading
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+
+        # Run one after the other, the first detector times out waiting
+        barrier = threading.Barrier(2, timeout=5)
+
+        def detect(self, context):
+            barrier.wait()
+            return []
+
+        monkeypatch.setattr(SchemaAnalyzer, "_detect_enums", detect)
+        monkeypatch.setattr(SchemaAnalyzer, "_detect_constraints", detect)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        result = json.loads(await model_generation.analyze_schema(
+            mcp_context, "duckdb", "test.db", detect_constraints=True, use_llm=False,
+        ))
+
+        assert result["summary"]["enumerations"] == 0
+        assert result["summary"]["constraints"] == 0
+
+    async def test_repeat_analysis_reuses_response(self, mcp_context, sample_database, monkeypatch):
+        """Test re-analyzing with the same options and documentation skips the analyzer."""
+        from legend_cli.analysis.models import EnhancedModelSpec
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+
+        calls = []
+
+        async def analyze_async(self, context):
+            calls.append(context.documentation)
+            return EnhancedModelSpec(database_name="TestDB", schema_names=["main"])
+
+        monkeypatch.setattr(SchemaAnalyzer, "analyze_async", analyze_async)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        first = await model_generation.analyze_schema(
+            mcp_context, "duckdb", "test.db", documentation="Orders  belong\nto users",
+        )
+        second = await model_generation.analyze_schema(
+            mcp_context, "duckdb", "test.db", documentation="Orders belong to users ",
+        )
+        await model_generation.analyze_schema(
+            mcp_context, "duckdb", "test.db", documentation="Orders belong to users", use_llm=False,
+        )
+
+        assert second == first
+        assert len(calls) == 2
+
+    async def test_new_session_reuses_saved_analysis(self, sample_database, monkeypatch):
+        """Test a new session restores an earlier session's analysis from disk."""
+        from legend_cli.analysis.analysis_cache import AnalysisCache
+        from legend_cli.analysis.models import EnhancedModelSpec, EnumerationCandidate
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+        from legend_cli.mcp.context import MCPContext
+
+        calls = []
+
+        async def analyze_async(self, context):
+            calls.append(context)
+            return EnhancedModelSpec(
+                database_name="TestDB",
+                schema_names=["main"],
+                enumerations=[EnumerationCandidate(
+                    name="Status", source_table="orders", source_column="status",
+                    values=["OPEN", "CLOSED"], confidence=0.9,
+                )],
+            )
+
+        monkeypatch.setattr(SchemaAnalyzer, "analyze_async", analyze_async)
+
+        saves = []
+        save = AnalysisCache.save
+
+        def recording_save(self, key, spec):
+            saves.append(key)
+            save(self, key, spec)
+
+        monkeypatch.setattr(AnalysisCache, "save", recording_save)
+
+        first = MCPContext()
+        first.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+        expected = await model_generation.analyze_schema(first, "duckdb", "test.db")
+
+        second = MCPContext()
+        second.store_schema(DatabaseType.DUCKDB, "copy.db", sample_database)
+        result = await model_generation.analyze_schema(second, "duckdb", "copy.db")
+        # Other options are a different analysis
+        await model_generation.analyze_schema(second, "duckdb", "copy.db", use_llm=False)
+
+        assert json.loads(result)["analysis"] == json.loads(expected)["analysis"]
+        assert len(calls) == 2
+        # The restored entry is not written back
+        assert len(saves) == 2
+
+    async def test_saved_analysis_disabled(self, sample_database, monkeypatch, analysis_cache_dir):
+        """Test nothing is written or restored when the analysis cache is disabled."""
+        from legend_cli.analysis.models import EnhancedModelSpec
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+        from legend_cli.config import settings
+        from legend_cli.mcp.context import MCPContext
+
+        calls = []
+
+        async def analyze_async(self, context):
+            calls.append(context)
+            return EnhancedModelSpec(database_name="TestDB", schema_names=["main"])
+
+        monkeypatch.setattr(SchemaAnalyzer, "analyze_async", analyze_async)
+        monkeypatch.setattr(settings, "analysis_cache_enabled", False)
+
+        for _ in range(2):
+            ctx = MCPContext()
+            ctx.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+            await model_generation.analyze_schema(ctx, "duckdb", "test.db")
+
+        assert len(calls) == 2
+        assert not analysis_cache_dir.exists()
+
+    async def test_llm_failure_is_reported_and_not_cached(
+        self, mcp_context, sample_database, monkeypatch, analysis_cache_dir,
+    ):
+        """Test a failed LLM step is reported and the partial analysis is not kept."""
+        from legend_cli.analysis.enum_detector import EnumDetector
+
+        calls = []
+
+        def detect_with_llm(self, *args):
+            calls.append(args)
+            raise RuntimeError("API key not configured")
+
+        monkeypatch.setattr(EnumDetector, "_detect_with_llm", detect_with_llm)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        for _ in range(2):
+            result = json.loads(await model_generation.analyze_schema(mcp_context, "duckdb", "test.db"))
+
+        assert result["status"] == "success"
+        assert result["warnings"] == ["enums: API key not configured"]
+        assert len(calls) == 2
+        assert not mcp_context.artifact_cache
+        assert not analysis_cache_dir.exists()
+
+    async def test_refresh_bypasses_caches(self, mcp_context, sample_database, monkeypatch):
+        """Test refresh=True analyzes again despite cached results."""
+        from legend_cli.analysis.models import EnhancedModelSpec
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+        from legend_cli.mcp.context import MCPContext
+
+        calls = []
+
+        async def analyze_async(self, context):
+            calls.append(context)
+            return EnhancedModelSpec(database_name="TestDB", schema_names=["main"])
+
+        monkeypatch.setattr(SchemaAnalyzer, "analyze_async", analyze_async)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+        await model_generation.analyze_schema(mcp_context, "duckdb", "test.db")
+        await model_generation.analyze_schema(mcp_context, "duckdb", "test.db", refresh=True)
+
+        # A new session would otherwise restore the saved analysis
+        other = MCPContext()
+        other.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+        await model_generation.analyze_schema(other, "duckdb", "test.db", refresh=True)
+
+        assert len(calls) == 3
+
+    async def test_empty_schema_skips_detectors(self, mcp_context, monkeypatch):
+        """Test a schema without tables is analyzed without running any detector."""
+        from legend_cli.analysis.schema_analyzer import SchemaAnalyzer
+
+        calls = []
+
+        def detect(self, context):
+            calls.append(context)
+            return []
+
+        for name in ("_detect_hierarchies", "_detect_enums", "_detect_constraints", "_detect_derived"):
+            monkeypatch.setattr(SchemaAnalyzer, name, detect)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "empty.db", Database(name="Empty"))
+
+        result = json.loads(await model_generation.analyze_schema(
+            mcp_context, "duckdb", "empty.db",
+            detect_hierarchies=True, detect_constraints=True, detect_derived=True,
+        ))
+
+        assert set(result["summary"].values()) == {0}
+        assert not calls
+
+
+class TestPopulateEnumValues:
+    """Test filling enum candidates with values from the database."""
+
+    def test_one_query_per_table(self, tmp_path, monkeypatch):
+        """Test enums on the same table share one distinct-values query."""
+        duckdb = pytest.importorskip("duckdb")
+        from legend_cli.analysis.models import EnhancedModelSpec, EnumerationCandidate
+        from legend_cli.database import DuckDBIntrospector
+
+        path = str(tmp_path / "enums.duckdb")
+        conn = duckdb.connect(path)
+        conn.execute("CREATE TABLE orders (status VARCHAR, channel VARCHAR)")
+        conn.execute("INSERT INTO orders VALUES ('open', 'web'), ('on hold', 'store')")
+        conn.execute("CREATE TABLE users (tier VARCHAR)")
+        conn.execute("INSERT INTO users VALUES ('gold')")
+        conn.close()
+
+        queries = []
+        execute_query = DuckDBIntrospector._execute_query
+
+        def counting_execute(self, sql):
+            queries.append(sql)
+            return execute_query(self, sql)
+
+        monkeypatch.setattr(DuckDBIntrospector, "_execute_query", counting_execute)
+        schema = Database(name="enums", schemas=[Schema(name="main", tables=[])])
+        spec = EnhancedModelSpec(
+            database_name="enums",
+            schema_names=["main"],
+            enumerations=[
+                EnumerationCandidate(name=name, source_table=table, source_column=column, values=[])
+                for name, table, column in (
+                    ("OrderStatus", "orders", "status"),
+                    ("Channel", "orders", "channel"),
+                    ("Tier", "users", "tier"),
+                )
+            ],
+        )
+
+        model_generation._populate_enum_values(spec, DatabaseType.DUCKDB, path, schema)
+
+        status, channel, tier = spec.enumerations
+        assert sorted(status.values) == ["ON_HOLD", "OPEN"]
+        assert status.value_descriptions["ON_HOLD"] == "on hold"
+        assert sorted(channel.values) == ["STORE", "WEB"]
+        assert tier.values == ["GOLD"]
+        assert len(queries) == 2
+
+    async def test_uses_session_connection(self, mcp_context, tmp_path, monkeypatch):
+        """Test enum values are fetched through the session's open connection."""
+        duckdb = pytest.importorskip("duckdb")
+        from legend_cli.analysis.models import EnhancedModelSpec, EnumerationCandidate
+        from legend_cli.database import DuckDBIntrospector
+
+        path = str(tmp_path / "enums.duckdb")
+        conn = duckdb.connect(path)
+        conn.execute("CREATE TABLE orders (status VARCHAR)")
+        conn.execute("INSERT INTO orders VALUES ('open')")
+        conn.close()
+
+        spec = EnhancedModelSpec(
+            database_name="enums",
+            schema_names=["main"],
+            enumerations=[EnumerationCandidate(
+                name="OrderStatus", source_table="orders", source_column="status", values=[],
+            )],
+        )
+        monkeypatch.setattr(model_generation, "_run_enhanced_analysis", lambda *args: (spec, {}))
+
+        def no_new_introspector(**kwargs):
+            raise AssertionError("opened a second connection")
+
+        monkeypatch.setattr(model_generation, "DuckDBIntrospector", no_new_introspector)
+        introspector = DuckDBIntrospector(database_path=path)
+        mcp_context.add_connection(DatabaseType.DUCKDB, path, introspector)
+        schema = Database(name="enums", schemas=[Schema(name="main", tables=[])])
+
+        result, _ = await model_generation._analyze_with_enum_values(
+            mcp_context, schema, None, DatabaseType.DUCKDB, path,
+            False, True, False, False, 0.7,
+        )
+
+        assert result.enumerations[0].values == ["OPEN"]
+        # Still open for the session's other tools
+        assert introspector.get_distinct_values("main", "orders", "status") == ["open"]
+        mcp_context.close_all_connections()
+
+
+class TestErrorWrapping:
+    """Test how generation tools report failures."""
+
+    async def test_missing_schema_passes_through(self, mcp_context):
+        """Test MCP errors keep their type and message."""
+        from legend_cli.mcp.errors import IntrospectionError
+
+        with pytest.raises(IntrospectionError, match="not introspected"):
+            await model_generation.generate_store(mcp_context, "duckdb", "missing.db")
+
+    async def test_unexpected_error_is_chained(self, mcp_context, sample_database, monkeypatch):
+        """Test other exceptions become GenerationError with the cause kept."""
+        from legend_cli.mcp.errors import GenerationError
+        from legend_cli.pure.generator import PureCodeGenerator
+
+        def broken(self):
+            raise KeyError("orders")
+
+        monkeypatch.setattr(PureCodeGenerator, "generate_mapping", broken)
+        mcp_context.store_schema(DatabaseType.DUCKDB, "test.db", sample_database)
+
+        with pytest.raises(GenerationError, match="Mapping generation failed") as excinfo:
+            await model_generation.generate_mapping(mcp_context, "duckdb", "test.db")
+
+        assert isinstance(excinfo.value.__cause__, KeyError)
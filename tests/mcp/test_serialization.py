@@ -0,0 +1,101 @@
+"""Tests for MCP response serialization."""
+
+import enum
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from legend_cli.mcp import serialization
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson and with the json module fallback."""
+    if not request.param:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+@dataclass
+class _Point:
+    """A dataclass with a private field orjson leaves out."""
+    x: int
+    y: int
+    _cache: object = None
+
+
+class _Color(enum.Enum):
+    """An enum orjson writes by value."""
+    RED = "red"
+
+
+class TestDumps:
+    """Test compact encoding."""
+
+    def test_compact_round_trip(self, encoder):
+        """Test both encoders produce the same compact JSON document."""
+        payload = {"status": "success", "artifacts": {"store": {"lines": 3, "preview": "a\nb é"}}}
+
+        result = serialization.dumps(payload)
+
+        assert json.loads(result) == payload
+        assert result == '{"status":"success","artifacts":{"store":{"lines":3,"preview":"a\\nb é"}}}'
+
+    def test_unsupported_values_as_str(self, encoder):
+        """Test values neither encoder supports natively are written as str()."""
+        assert serialization.dumps({"at": date(2024, 1, 2)}) == '{"at":"2024-01-02"}'
+        assert serialization.dumps({"path": object}) == '{"path":"<class \'object\'>"}'
+
+    @pytest.mark.parametrize("value, expected", [
+        (datetime(2024, 1, 2, 3, 4, 5), '"2024-01-02T03:04:05"'),
+        (datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc), '"2024-01-02T03:04:05.000006+00:00"'),
+        (date(2024, 1, 2), '"2024-01-02"'),
+        (_Point(1, 2), '{"x":1,"y":2}'),
+        (_Color.RED, '"red"'),
+    ])
+    def test_native_types_match_orjson(self, encoder, value, expected):
+        """Test the json fallback encodes what orjson supports exactly as orjson does."""
+        assert serialization.dumps(value) == expected
+
+    def test_unknown_types_fall_back_to_str(self, encoder):
+        """Test Decimals from the log backend serialize instead of raising."""
+        payload = {"at": datetime(2024, 1, 2, 3, 4, 5), "avg": Decimal("1.5")}
+
+        result = json.loads(serialization.dumps(payload))
+
+        assert result["avg"] == "1.5"
+        assert result["at"].startswith("2024-01-02")
+
+    def test_pretty(self, encoder):
+        """Test pretty output indents by two spaces with either encoder."""
+        payload = {"status": "success", "logs": [{"id": 1, "tool_name": "x"}]}
+
+        result = serialization.dumps(payload, pretty=True)
+
+        assert json.loads(result) == payload
+        assert result == json.dumps(payload, indent=2)
+
+
+class TestWriteJsonObject:
+    """Test streamed object encoding."""
+
+    def test_streams_iterators_as_arrays(self, encoder):
+        """Test iterator values become arrays and the result matches dumps()."""
+        buf = io.StringIO()
+        serialization.write_json_object(buf, {
+            "status": "success",
+            "items": ({"n": i} for i in range(3)),
+            "empty": iter(()),
+            "tags": ["a", "b"],
+        })
+
+        assert buf.getvalue() == serialization.dumps({
+            "status": "success",
+            "items": [{"n": 0}, {"n": 1}, {"n": 2}],
+            "empty": [],
+            "tags": ["a", "b"],
+        })
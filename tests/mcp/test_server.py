@@ -0,0 +1,154 @@
+"""Tests for MCP server tool dispatch."""
+
+import json
+from types import MappingProxyType
+
+import jsonschema
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from legend_cli.mcp import server, tools
+from legend_cli.mcp.errors import DatabaseError
+
+
+def _patch_handler(monkeypatch, name, handler):
+    """Replace one entry of the read-only TOOL_HANDLERS mapping."""
+    handlers = {**server.TOOL_HANDLERS, name: handler}
+    monkeypatch.setattr(server, "TOOL_HANDLERS", MappingProxyType(handlers))
+
+
+class TestToolDispatch:
+    """Test call_tool routing through TOOL_HANDLERS."""
+
+    async def test_every_listed_tool_has_handler(self):
+        """Test each advertised tool is routed to a handler."""
+        tools = await server.list_tools()
+
+        assert {tool.name for tool in tools} == set(server.TOOL_HANDLERS)
+
+    async def test_tool_list_built_once(self):
+        """Test each listing reuses the same Tool objects in a fresh list."""
+        first = await server.list_tools()
+        first.clear()
+        second = await server.list_tools()
+
+        assert len(second) == len(server.TOOL_HANDLERS)
+        assert second[0] is server._ALL_TOOLS[0]
+
+    @pytest.mark.parametrize("module", [
+        tools.database, tools.model_generation, tools.sdlc,
+        tools.preview, tools.model_modification, tools.logging,
+    ])
+    def test_get_tools_returns_copies(self, module):
+        """Test get_tools hands out a new list of the same Tool objects."""
+        first = module.get_tools()
+        first.clear()
+        second = module.get_tools()
+
+        assert second
+        assert second[0] is module.get_tools()[0]
+
+    def test_sdlc_property_schemas_shared(self):
+        """Test SDLC and model modification tools share one schema per SDLC argument."""
+        all_tools = tools.sdlc.get_tools() + tools.model_modification.get_tools()
+
+        for name, shared in [
+            ("project_id", tools.sdlc._PROJECT_ID_SCHEMA),
+            ("workspace_id", tools.sdlc._WORKSPACE_ID_SCHEMA),
+        ]:
+            schemas = {
+                id(t.inputSchema["properties"][name])
+                for t in all_tools
+                if t.inputSchema["properties"].get(name) == shared
+            }
+            assert schemas == {id(shared)}
+
+    def test_handlers_are_read_only(self):
+        """Test the dispatch table cannot be mutated."""
+        with pytest.raises(TypeError):
+            server.TOOL_HANDLERS["list_schemas"] = None
+
+    async def test_unknown_tool(self):
+        """Test unknown tool names return a message instead of raising."""
+        result = await server.call_tool("no_such_tool", {})
+
+        assert result[0].text == "Unknown tool: no_such_tool"
+
+    async def test_dispatches_with_arguments(self, monkeypatch):
+        """Test arguments are passed to the handler as keyword arguments."""
+        async def fake_list_schemas(ctx, db_type, database):
+            return json.dumps({"db_type": db_type, "database": database})
+
+        _patch_handler(monkeypatch, "list_schemas", fake_list_schemas)
+        result = await server.call_tool("list_schemas", {"db_type": "duckdb", "database": "x.duckdb"})
+
+        assert json.loads(result[0].text) == {"db_type": "duckdb", "database": "x.duckdb"}
+
+    async def test_expected_error_logged_without_traceback(self, monkeypatch, caplog):
+        """Test MCPError failures are logged as warnings without a traceback."""
+        async def failing(ctx):
+            raise DatabaseError("no such table")
+
+        _patch_handler(monkeypatch, "list_schemas", failing)
+        result = await server.call_tool("list_schemas", {})
+
+        assert result[0].text == "Error: no such table"
+        record = next(r for r in caplog.records if r.name == server.logger.name)
+        assert record.levelname == "WARNING"
+        assert record.exc_info is None
+
+    async def test_unexpected_error_logged_with_traceback(self, monkeypatch, caplog):
+        """Test unexpected failures are logged with a traceback."""
+        async def failing(ctx):
+            raise RuntimeError("boom")
+
+        _patch_handler(monkeypatch, "list_schemas", failing)
+        result = await server.call_tool("list_schemas", {})
+
+        assert result[0].text == "Error: boom"
+        record = next(r for r in caplog.records if r.name == server.logger.name)
+        assert record.levelname == "ERROR"
+        assert record.exc_info is not None
+
+
+class TestArgumentValidation:
+    """Test tool arguments are checked against precompiled input schemas."""
+
+    def test_valid_arguments(self):
+        """Test arguments matching the schema pass."""
+        assert server.validate_arguments("list_schemas", {"db_type": "duckdb", "database": "x.duckdb"}) is None
+
+    def test_invalid_arguments(self):
+        """Test schema violations report the same message jsonschema.validate would."""
+        arguments = {"db_type": "oracle", "database": "x"}
+        tool = next(t for t in server._ALL_TOOLS if t.name == "list_schemas")
+
+        with pytest.raises(jsonschema.ValidationError) as expected:
+            jsonschema.validate(arguments, tool.inputSchema)
+
+        assert server.validate_arguments("list_schemas", arguments) == expected.value.message
+
+    def test_unknown_tool(self):
+        """Test unknown tools are left to call_tool to report."""
+        assert server.validate_arguments("no_such_tool", {}) is None
+
+    async def test_request_rejected_before_handler(self, monkeypatch):
+        """Test an invalid request returns an error result without running the tool."""
+        calls = []
+
+        async def fake_list_schemas(ctx, **kwargs):
+            calls.append(kwargs)
+            return "{}"
+
+        _patch_handler(monkeypatch, "list_schemas", fake_list_schemas)
+        handler = server.server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="list_schemas", arguments={"db_type": "duckdb"}),
+        )
+
+        result = (await handler(request)).root
+
+        assert result.isError
+        assert result.content[0].text == "Input validation error: 'database' is a required property"
+        assert calls == []